@@ -0,0 +1,5 @@
+# benchmarks/__init__.py
+"""
+Mesures de performance hors interface du Traducteur Ren'Py Pro
+Corpus synthétique (corpus.py) et campagne de mesures (run_benchmarks.py)
+"""
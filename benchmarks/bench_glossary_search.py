@@ -0,0 +1,109 @@
+# benchmarks/bench_glossary_search.py
+# Glossary Search Index Benchmark
+# Created for Traducteur Ren'Py Pro v2.4.4
+
+"""
+Recherche dans le glossaire : index des n-grammes contre parcours linéaire
+
+Les requêtes reproduisent une saisie dans le dialogue du glossaire (chaque
+préfixe d'un terme, lettre par lettre) sur un glossaire synthétique. Les
+deux recherches doivent donner les mêmes entrées dans le même ordre, avant
+et après des ajouts et suppressions indexés au fil de l'eau.
+
+Usage (depuis le dossier du projet):
+    python -m benchmarks.bench_glossary_search
+    python -m benchmarks.bench_glossary_search --size 50000 --queries 200
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.corpus import generate_glossary, WORDS
+
+def linear_search(glossary, search_term):
+    """Ancienne recherche de GlossaryManager.search_entries (référence)"""
+    search_term = search_term.lower()
+    return [original for original, translation in glossary.items()
+            if search_term in original.lower() or search_term in translation.lower()]
+
+def typed_queries(glossary, count, seed):
+    """Préfixes successifs de termes et de mots du glossaire (frappe au clavier)"""
+    rng = random.Random(seed)
+    sources = rng.sample(list(glossary), min(count, len(glossary))) + rng.sample(WORDS, min(count, len(WORDS)))
+    queries = []
+    for source in sources:
+        queries.extend(source[:end] for end in range(1, len(source) + 1))
+    return queries
+
+def compare(glossary, index, queries, label):
+    """Compare les deux recherches ; affiche la première différence et les durées"""
+    start = time.perf_counter()
+    expected = [linear_search(glossary, query) for query in queries]
+    linear_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    actual = [index.search(query) for query in queries]
+    index_time = time.perf_counter() - start
+    
+    ok = True
+    for query, before, after in zip(queries, expected, actual):
+        if before != after:
+            print(f"[{label}] requête {query!r}: {len(before)} attendues, {len(after)} obtenues")
+            ok = False
+            break
+    
+    print(f"[{label}] {len(queries)} requêtes: {'identique' if ok else 'DIFFÉRENT'} "
+          f"(linéaire {linear_time:.3f}s, index {index_time:.3f}s, "
+          f"x{linear_time / index_time if index_time else 0:.1f})")
+    return ok
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Recherche indexée dans le glossaire")
+    parser.add_argument("--size", type=int, default=20000, help="Nombre d'entrées du glossaire")
+    parser.add_argument("--queries", type=int, default=100, help="Termes saisis lettre par lettre")
+    parser.add_argument("--seed", type=int, default=0, help="Graine")
+    args = parser.parse_args(argv)
+    
+    # Comme run_benchmarks : importer les modules depuis un dossier de travail
+    start_dir = os.getcwd()
+    work_dir = tempfile.mkdtemp(prefix="renpy_glossary_search_")
+    os.chdir(work_dir)
+    try:
+        from core.glossary import GlossarySearchIndex
+        
+        glossary = generate_glossary(args.size, args.seed)
+        start = time.perf_counter()
+        index = GlossarySearchIndex()
+        index.rebuild(glossary)
+        print(f"Index de {len(glossary)} entrées construit en {time.perf_counter() - start:.3f}s")
+        
+        queries = typed_queries(glossary, args.queries, args.seed)
+        ok = compare(glossary, index, queries, "glossaire")
+        
+        # Modifications indexées une à une, comme add_entry / remove_entry
+        rng = random.Random(args.seed)
+        for original in rng.sample(list(glossary), len(glossary) // 10):
+            del glossary[original]
+            index.remove(original)
+        for number in range(len(glossary) // 10):
+            original, translation = f"Ajout{number} {rng.choice(WORDS)}", rng.choice(WORDS)
+            glossary[original] = translation
+            index.add(original, translation)
+        index.entries = glossary
+        ok = compare(glossary, index, queries, "après modifications") and ok
+    finally:
+        os.chdir(start_dir)
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
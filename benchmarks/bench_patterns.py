@@ -0,0 +1,161 @@
+# benchmarks/bench_patterns.py
+# Compiled Pattern Micro-benchmark
+# Created for Traducteur Ren'Py Pro v2.4.4
+
+"""
+Micro-benchmark du registre REGEX_PATTERNS (utils/constants.py)
+
+Chaque boucle ligne par ligne du pipeline est mesurée deux fois sur le
+corpus synthétique : avec les chaînes brutes passées à re.* à chaque appel
+(ancienne écriture) et avec les expressions compilées du registre. Les
+deux versions doivent donner le même résultat.
+
+Usage (depuis le dossier du projet):
+    python -m benchmarks.bench_patterns
+    python -m benchmarks.bench_patterns --lines 200000 --repeat 5
+"""
+
+import argparse
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.corpus import generate_tl_lines
+
+# Contrôles de cohérence entre deux textes (ordre de CoherenceChecker)
+_COHERENCE_RAW = [
+    r'\{[^}]*\}', r'\[[^\]]*\]', r'\(\d+\)', r'\(\d+(?!\))',
+    r'\{[^}]*$', r'^[^{]*\}', r'\\n|--|%[^%]*%'
+]
+_COHERENCE_KEYS = [
+    "tag", "variable", "placeholder", "malformed_placeholder",
+    "orphan_open", "orphan_close", "special_sequence"
+]
+
+def codes_raw(lines):
+    """Détection des codes spéciaux (_build_code_mapping), chaînes brutes"""
+    from utils.constants import SPECIAL_CODES
+    codes = []
+    for line in lines:
+        codes.extend(re.findall(r'(\{[^}]+\}|\[[^\]]+\])', line))
+        for pattern in SPECIAL_CODES:
+            codes.extend(match.group(0) for match in re.finditer(pattern, line))
+    return codes
+
+def codes_compiled(lines):
+    """Détection des codes spéciaux (_build_code_mapping), registre"""
+    from utils.constants import REGEX_PATTERNS
+    code_tags = REGEX_PATTERNS["code_tags"]
+    any_code = REGEX_PATTERNS["special_codes_any"]
+    special_codes = REGEX_PATTERNS["special_codes"]
+    codes = []
+    for line in lines:
+        codes.extend(code_tags.findall(line))
+        if not any_code.search(line):
+            continue
+        for pattern in special_codes:
+            codes.extend(match.group(0) for match in pattern.finditer(line))
+    return codes
+
+def validation_raw(lines):
+    """Premier pattern Ren'Py et lignes de dialogue (is_renpy_file), chaînes brutes"""
+    from utils.constants import RENPY_PATTERNS
+    found = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        for pattern in RENPY_PATTERNS:
+            if re.search(pattern, line, re.IGNORECASE):
+                found.append(pattern)
+                break
+        found.append(bool(re.search(r'\w+\s+".*"', line) or re.search(r'".*"', line)))
+    return found
+
+def validation_compiled(lines):
+    """Premier pattern Ren'Py et lignes de dialogue (is_renpy_file), registre"""
+    from utils.constants import RENPY_PATTERNS, REGEX_PATTERNS
+    first_pattern = REGEX_PATTERNS["renpy_first"]
+    dialogue = REGEX_PATTERNS["dialogue"]
+    found = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        match = first_pattern.match(line)
+        if match:
+            found.append(RENPY_PATTERNS[match.lastindex - 1])
+        found.append(bool(dialogue.search(line)))
+    return found
+
+def coherence_raw(lines):
+    """Extraction des textes et contrôles de _check_content_coherence, chaînes brutes"""
+    results = []
+    for line in lines:
+        for text in re.findall(r'"([^"]*)"', line):
+            results.extend(re.findall(pattern, text) for pattern in _COHERENCE_RAW)
+    return results
+
+def coherence_compiled(lines):
+    """Extraction des textes et contrôles de _check_content_coherence, registre"""
+    from utils.constants import REGEX_PATTERNS
+    quoted_text = REGEX_PATTERNS["quoted_text"]
+    patterns = [REGEX_PATTERNS[key] for key in _COHERENCE_KEYS]
+    results = []
+    for line in lines:
+        for text in quoted_text.findall(line):
+            results.extend(pattern.findall(text) for pattern in patterns)
+    return results
+
+BENCHMARKS = [
+    ("codes", codes_raw, codes_compiled),
+    ("validation", validation_raw, validation_compiled),
+    ("coherence", coherence_raw, coherence_compiled),
+]
+
+def _best(func, lines, repeat):
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(lines)
+        runs.append(time.perf_counter() - start)
+    return min(runs), result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmark des expressions compilées")
+    parser.add_argument("--lines", type=int, default=100000, help="Taille du corpus, en lignes")
+    parser.add_argument("--repeat", type=int, default=3, help="Exécutions par mesure")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du corpus")
+    args = parser.parse_args(argv)
+    
+    lines = generate_tl_lines(args.lines, args.seed)
+    print(f"Corpus de {len(lines)} lignes")
+    
+    # Comme run_benchmarks : importer les modules depuis un dossier de travail
+    start_dir = os.getcwd()
+    work_dir = tempfile.mkdtemp(prefix="renpy_patterns_")
+    os.chdir(work_dir)
+    try:
+        ok = True
+        for name, raw, compiled in BENCHMARKS:
+            raw_time, raw_result = _best(raw, lines, args.repeat)
+            compiled_time, compiled_result = _best(compiled, lines, args.repeat)
+            same = raw_result == compiled_result
+            ok = ok and same
+            print(f"  {name:<12} brut {raw_time:.4f}s  compilé {compiled_time:.4f}s  "
+                  f"x{raw_time / compiled_time if compiled_time else 0:.2f}"
+                  f"{'' if same else '  RÉSULTATS DIFFÉRENTS'}")
+    finally:
+        os.chdir(start_dir)
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
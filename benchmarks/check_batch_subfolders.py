@@ -0,0 +1,97 @@
+# benchmarks/check_batch_subfolders.py
+# Batch Subfolder Regression Check
+# Created for Traducteur Ren'Py Pro v2.4.4
+
+"""
+Vérification du lot sur des scripts de même nom dans des sous-dossiers
+
+Deux scripts game/tl/french/a/script.rpy et b/script.rpy sont extraits puis
+reconstruits par run_batch : chacun doit avoir ses propres fichiers de travail
+et son fichier reconstruit ne doit contenir que ses propres textes. Hors d'un
+dossier de langue, deux scripts qui partageraient leurs fichiers de travail
+doivent être refusés (en échec, avec un message clair).
+
+Usage (depuis le dossier du projet):
+    python -m benchmarks.check_batch_subfolders
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+def write_script(path, label, lines=5):
+    """Script de traduction minimal dont chaque réplique porte le libellé donné"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        for index in range(lines):
+            f.write(f"# game/script.rpy:{index}\n")
+            f.write(f"translate french {label.lower()}_{index}:\n\n")
+            f.write(f'    # e "{label} line {index}"\n')
+            f.write(f'    e "{label} line {index}"\n\n')
+
+def check(condition, message):
+    """Affiche le résultat d'un contrôle"""
+    print(f"[{'OK' if condition else 'ÉCHEC'}] {message}")
+    return condition
+
+def run_checks(work_dir):
+    """Lots d'extraction et de reconstruction sur les deux arborescences"""
+    from core.batch import run_batch
+    from core.extraction_enhanced import get_file_base_name
+    
+    language_dir = os.path.join(work_dir, "MonJeu", "game", "tl", "french")
+    alpha = os.path.join(language_dir, "a", "script.rpy")
+    bravo = os.path.join(language_dir, "b", "script.rpy")
+    write_script(alpha, "Alpha")
+    write_script(bravo, "Bravo")
+    
+    ok = check(get_file_base_name(alpha) != get_file_base_name(bravo),
+               f"noms de base distincts ({get_file_base_name(alpha)}, {get_file_base_name(bravo)})")
+    
+    extracted = run_batch(language_dir, 'extract', workers=2)
+    ok = check(extracted['processed'] == 2 and extracted['failed'] == 0, "extraction des deux scripts") and ok
+    rebuilt = run_batch(language_dir, 'rebuild', workers=2)
+    ok = check(rebuilt['processed'] == 2 and rebuilt['failed'] == 0, "reconstruction des deux scripts") and ok
+    
+    for source, label, other in ((alpha, "Alpha", "Bravo"), (bravo, "Bravo", "Alpha")):
+        translated = source.replace(".rpy", "_translated.rpy")
+        with open(translated, encoding='utf-8') as f:
+            content = f.read()
+        ok = check(f"{label} line 0" in content and other not in content,
+                   f"{os.path.relpath(translated, language_dir)} ne contient que ses textes") and ok
+    
+    # Hors dossier de langue : même nom de base, le lot doit refuser les deux
+    mods_dir = os.path.join(work_dir, "mods")
+    write_script(os.path.join(mods_dir, "x", "script.rpy"), "Xray")
+    write_script(os.path.join(mods_dir, "y", "script.rpy"), "Yankee")
+    refused = run_batch(mods_dir, 'extract', workers=2)
+    ok = check(refused['failed'] == 2 and refused['processed'] == 0
+               and all("partagé" in error['error'] for error in refused['errors']),
+               "scripts de même nom de base hors dossier de langue refusés") and ok
+    return ok
+
+def main():
+    # Comme run_benchmarks : travailler dans un dossier temporaire
+    start_dir = os.getcwd()
+    work_dir = tempfile.mkdtemp(prefix="renpy_check_")
+    os.chdir(work_dir)
+    try:
+        from utils.logging import set_log_level, flush_log
+        set_log_level("WARNING")
+        ok = run_checks(work_dir)
+    finally:
+        # Rapport de performance écrit ici plutôt qu'à la sortie (dossier courant)
+        from utils.performance import flush_performance_report
+        flush_log()
+        flush_performance_report()
+        os.chdir(start_dir)
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
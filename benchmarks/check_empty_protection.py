@@ -0,0 +1,144 @@
+# benchmarks/check_empty_protection.py
+# Empty Text Protection Differential Check
+# Created for Traducteur Ren'Py Pro v2.4.4
+
+"""
+Comparaison de la protection des textes vides avec l'algorithme d'origine
+
+L'ancienne implémentation (remplacements successifs, une occurrence à la
+fois) sert de référence : pour des lignes aléatoires riches en guillemets,
+barres obliques et espaces, puis pour le corpus synthétique, les lignes
+protégées, le mapping et les textes vides doivent être identiques.
+
+Usage (depuis le dossier du projet):
+    python -m benchmarks.check_empty_protection
+    python -m benchmarks.check_empty_protection --lines 200000 --seed 3
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.corpus import generate_tl_lines
+
+# Caractères des lignes aléatoires : les cas limites sont les suites de guillemets
+_ALPHABET = ['"', '"', '"', ' ', ' ', '\\', 'a', 'b', '#', '\n']
+
+def reference_protection(lines, protection_order):
+    """
+    Algorithme d'origine de _apply_empty_text_protection (référence)
+    
+    Returns:
+        tuple: (lignes protégées, mapping, textes vides)
+    """
+    content = list(lines)
+    empty_mapping = OrderedDict()
+    empty_texts = []
+    empty_counter = 1
+    escape_placeholder = None
+    
+    for i, line in enumerate(content):
+        stripped_line = line.strip()
+        if stripped_line.startswith('#') or stripped_line.lower().startswith('old "'):
+            continue
+        
+        for pattern, _ in protection_order:
+            if pattern == r'\"':
+                if escape_placeholder is None:
+                    escape_placeholder = f"(ESC{empty_counter})"
+                    empty_mapping[escape_placeholder] = r'\"'
+                    empty_counter += 1
+                while r'\"' in content[i]:
+                    content[i] = content[i].replace(r'\"', escape_placeholder, 1)
+            else:
+                while pattern in content[i]:
+                    if pattern not in empty_mapping:
+                        empty_mapping[pattern] = f"(C{empty_counter})"
+                        empty_texts.append(pattern[1:-1] + '\n')
+                        empty_counter += 1
+                    content[i] = content[i].replace(pattern, f'"{empty_mapping[pattern]}"', 1)
+    
+    return content, empty_mapping, empty_texts
+
+def current_protection(lines):
+    """Implémentation actuelle (EnhancedTextExtractor)"""
+    from core.extraction_enhanced import EnhancedTextExtractor
+    extractor = EnhancedTextExtractor()
+    extractor.file_content = list(lines)
+    extractor._apply_empty_text_protection()
+    return extractor.file_content, extractor.empty_mapping, extractor.empty_texts
+
+def random_lines(count, seed):
+    """Lignes aléatoires courtes, souvent précédées d'un personnage ou de old"""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        prefix = rng.choice(["", "    e ", "    old ", "    new ", "# "])
+        body = "".join(rng.choice(_ALPHABET[:-1]) for _ in range(rng.randint(0, 14)))
+        lines.append(prefix + body + "\n")
+    return lines
+
+def compare(lines, label, quiet=False):
+    """Compare les deux implémentations ; affiche la première différence"""
+    from core.extraction_enhanced import PROTECTION_ORDER_NO_ELLIPSIS
+    
+    start = time.perf_counter()
+    expected = reference_protection(lines, PROTECTION_ORDER_NO_ELLIPSIS)
+    reference_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    actual = current_protection(lines)
+    current_time = time.perf_counter() - start
+    
+    ok = True
+    if list(expected[1].items()) != list(actual[1].items()) or expected[2] != actual[2]:
+        print(f"[{label}] mappings différents: {list(expected[1].items())} != {list(actual[1].items())}")
+        ok = False
+    for index, (before, after) in enumerate(zip(expected[0], actual[0])):
+        if before != after:
+            print(f"[{label}] ligne {index}: {lines[index]!r}\n  attendu {before!r}\n  obtenu  {after!r}")
+            ok = False
+            break
+    
+    if not quiet:
+        print(f"[{label}] {len(lines)} lignes: {'identique' if ok else 'DIFFÉRENT'} "
+              f"(référence {reference_time:.3f}s, actuelle {current_time:.3f}s)")
+    return ok
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vérification différentielle de la protection des textes vides")
+    parser.add_argument("--lines", type=int, default=50000, help="Nombre de lignes aléatoires")
+    parser.add_argument("--seed", type=int, default=0, help="Graine")
+    args = parser.parse_args(argv)
+    
+    # Comme run_benchmarks : importer les modules depuis un dossier de travail
+    start_dir = os.getcwd()
+    work_dir = tempfile.mkdtemp(prefix="renpy_check_")
+    os.chdir(work_dir)
+    try:
+        from utils.logging import set_log_level
+        set_log_level("WARNING")
+        
+        # Petits lots : chaque lot repart d'un mapping vide (ordre d'attribution des C)
+        small_batches = all(compare(random_lines(20, args.seed + batch), f"lot {batch}", quiet=True)
+                            for batch in range(0, args.lines, 20))
+        print(f"[lots de 20] {'identique' if small_batches else 'DIFFÉRENT'}")
+        ok = small_batches
+        ok = compare(random_lines(args.lines, args.seed), "aléatoire") and ok
+        ok = compare(generate_tl_lines(args.lines, args.seed), "corpus") and ok
+    finally:
+        os.chdir(start_dir)
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
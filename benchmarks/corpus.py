@@ -0,0 +1,155 @@
+# benchmarks/corpus.py
+# Synthetic Corpus Module
+# Created for Traducteur Ren'Py Pro v2.4.4
+
+"""
+Générateur de fichiers de traduction Ren'Py synthétiques (game/tl/<langue>)
+
+Le contenu imite un vrai dossier tl : blocs translate de dialogues (ligne
+d'origine commentée puis traduction), blocs translate strings (old/new),
+balises {b}, variables [...], \\n, actions *entre astérisques*, chaînes vides
+et guillemets échappés. La génération est déterministe pour une graine donnée.
+"""
+
+import os
+import random
+from collections import OrderedDict
+
+LANGUAGE = "french"
+
+SPEAKERS = ["e", "mc", "s", "m", "narrator", ""]
+
+WORDS = [
+    "bonjour", "merci", "vraiment", "toujours", "demain", "maison", "école",
+    "chambre", "soirée", "pourquoi", "peut-être", "ensemble", "attendre",
+    "regarder", "comprendre", "souvenir", "histoire", "silence", "lumière",
+    "fenêtre", "promis", "rapidement", "doucement", "encore", "jamais",
+    "quelque", "chose", "moment", "journée", "voiture", "musique", "café"
+]
+
+NAMES = [
+    "Sylvie", "Eileen", "Lucy", "Max", "Professeur Martin", "Café du Port",
+    "Académie Sakura", "Rue des Lilas", "Cristal de lune", "Épée du roi"
+]
+
+ACTIONS = ["soupir", "rire", "hoche la tête", "sourit", "rougit", "tousse"]
+
+TAGS = [("{b}", "{/b}"), ("{i}", "{/i}"), ("{color=#ff0000}", "{/color}"), ("{size=+5}", "{/size}")]
+
+VARIABLES = ["[player_name]", "[mc]", "[points]", "[sylvie_name!t]"]
+
+SUFFIXES = ["", "", "", " with dissolve", " nointeract", " with vpunch"]
+
+# Termes inventés des glossaires synthétiques, dont une partie apparaît dans le corpus
+_GLOSSARY_POOL = 200
+
+def _term(number):
+    return f"Lieu{number:05d}"
+
+def _sentence(rng):
+    """Texte de dialogue avec les éléments que l'extraction doit protéger"""
+    words = [rng.choice(WORDS) for _ in range(rng.randint(3, 12))]
+    
+    if rng.random() < 0.3:
+        words.insert(rng.randrange(len(words) + 1), rng.choice(NAMES))
+    if rng.random() < 0.1:
+        words.insert(rng.randrange(len(words) + 1), _term(rng.randrange(_GLOSSARY_POOL)))
+    if rng.random() < 0.25:
+        position = rng.randrange(len(words))
+        opening, closing = rng.choice(TAGS)
+        words[position] = f"{opening}{words[position]}{closing}"
+    if rng.random() < 0.2:
+        words.insert(rng.randrange(len(words) + 1), rng.choice(VARIABLES))
+    if rng.random() < 0.1:
+        words.insert(rng.randrange(1, len(words) + 1), "\\n")
+    if rng.random() < 0.1:
+        words.insert(0, f"*{rng.choice(ACTIONS)}*")
+    if rng.random() < 0.05:
+        position = rng.randrange(len(words))
+        words[position] = f'\\"{words[position]}\\"'
+    
+    text = " ".join(words)
+    return text[0].upper() + text[1:] + rng.choice([".", "!", "?", "..."])
+
+def _dialogue_block(rng, number):
+    """Bloc translate d'une réplique"""
+    speaker = rng.choice(SPEAKERS)
+    prefix = f"{speaker} " if speaker else ""
+    original = _sentence(rng)
+    translated = "" if rng.random() < 0.03 else _sentence(rng)
+    suffix = rng.choice(SUFFIXES)
+    return [
+        f"# game/script.rpy:{number * 7 + 12}\n",
+        f"translate {LANGUAGE} scene_{number:08x}:\n",
+        "\n",
+        f"    # {prefix}\"{original}\"{suffix}\n",
+        f"    {prefix}\"{translated}\"{suffix}\n",
+        "\n"
+    ]
+
+def _strings_block(rng, number):
+    """Bloc translate strings (old/new)"""
+    lines = [f"translate {LANGUAGE} strings:\n", "\n"]
+    for index in range(rng.randint(2, 8)):
+        text = _sentence(rng)
+        lines += [
+            f"    # game/screens.rpy:{number * 11 + index}\n",
+            f"    old \"{text}\"\n",
+            f"    new \"{_sentence(rng)}\"\n",
+            "\n"
+        ]
+    return lines
+
+def generate_tl_lines(line_count, seed=0):
+    """
+    Génère le contenu d'un fichier tl d'environ line_count lignes
+    
+    Args:
+        line_count (int): Nombre de lignes visé (arrondi au bloc supérieur)
+        seed (int): Graine du générateur
+    
+    Returns:
+        list: Lignes terminées par \\n
+    """
+    rng = random.Random(seed)
+    lines = [f"# TODO: Translation updated at 2024-01-01 12:00\n", "\n"]
+    number = 0
+    while len(lines) < line_count:
+        if rng.random() < 0.1:
+            lines.extend(_strings_block(rng, number))
+        else:
+            lines.extend(_dialogue_block(rng, number))
+        number += 1
+    return lines
+
+def write_tl_file(folder, line_count, seed=0, name=None):
+    """
+    Écrit un fichier tl synthétique
+    
+    Args:
+        folder (str): Dossier de destination (ex: <jeu>/game/tl/french)
+        line_count (int): Nombre de lignes visé
+        seed (int): Graine du générateur
+        name (str, optional): Nom du fichier (bench_<lignes>.rpy par défaut)
+    
+    Returns:
+        str: Chemin du fichier créé
+    """
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, name or f"bench_{line_count}.rpy")
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.writelines(generate_tl_lines(line_count, seed))
+    return path
+
+def generate_glossary(size, seed=0):
+    """
+    Glossaire synthétique de size termes, trié comme GlossaryManager.load_glossary
+    
+    Les premiers termes (noms propres et lieux du corpus) sont effectivement
+    rencontrés lors de la protection ; les suivants ne font que grossir la
+    table parcourue.
+    """
+    rng = random.Random(seed)
+    terms = list(NAMES) + [_term(number) for number in range(max(0, size - len(NAMES)))]
+    glossary = {term: f"{term} ({rng.choice(WORDS)})" for term in terms[:size]}
+    return OrderedDict(sorted(glossary.items(), key=lambda item: len(item[0]), reverse=True))
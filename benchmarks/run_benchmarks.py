@@ -0,0 +1,262 @@
+# benchmarks/run_benchmarks.py
+# Benchmark Runner Module
+# Created for Traducteur Ren'Py Pro v2.4.4
+
+"""
+Campagne de mesures de performance sur un corpus synthétique
+
+Chaque étape est mesurée séparément (validation, extraction, reconstruction,
+contrôle de cohérence, protection du glossaire) pour plusieurs tailles de
+fichiers et de glossaires. Les mesures tournent dans un dossier de travail
+temporaire ; les résultats sont écrits en JSON pour comparer les versions.
+
+Usage (depuis le dossier du projet):
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --sizes 1000 10000 100000 1000000 --repeat 5
+    python -m benchmarks.run_benchmarks --compare dossier_configs/benchmarks/ancien.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.corpus import LANGUAGE, write_tl_file, generate_glossary
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_GLOSSARY_SIZES = [0, 100, 1000, 10000]
+DEFAULT_GLOSSARY_LINES = 10000
+GAME_FOLDER = "Benchmark-1.0"
+
+def _result(benchmark, runs, lines, size, glossary_terms=0):
+    """Mesures d'un benchmark pour une taille donnée"""
+    best = min(runs)
+    return {
+        'benchmark': benchmark,
+        'lines': lines,
+        'bytes': size,
+        'glossary_terms': glossary_terms,
+        'runs': [round(run, 6) for run in runs],
+        'best': round(best, 6),
+        'median': round(statistics.median(runs), 6),
+        'lines_per_second': round(lines / best) if best else None,
+        'mb_per_second': round(size / best / (1024 * 1024), 2) if best else None
+    }
+
+def _result_key(result):
+    return (result['benchmark'], result['lines'], result['glossary_terms'])
+
+class BenchmarkSuite:
+    """Mesures des étapes du pipeline dans un dossier de travail"""
+    
+    def __init__(self, work_dir, repeat=3, seed=0):
+        self.work_dir = work_dir
+        self.repeat = max(1, repeat)
+        self.seed = seed
+        self.tl_folder = os.path.join(work_dir, GAME_FOLDER, "game", "tl", LANGUAGE)
+        self.results = []
+    
+    def _measure(self, func, prepare=None):
+        """Temps réel de repeat exécutions de func (prepare n'est pas chronométré)"""
+        runs = []
+        for _ in range(self.repeat):
+            if prepare:
+                prepare()
+            start = time.perf_counter()
+            func()
+            runs.append(time.perf_counter() - start)
+        return runs
+    
+    def _record(self, benchmark, runs, lines, size, glossary_terms=0):
+        result = _result(benchmark, runs, lines, size, glossary_terms)
+        self.results.append(result)
+        print(f"  {benchmark:<15} {lines:>9} lignes  glossaire {glossary_terms:>6}  "
+              f"meilleur {result['best']:.4f}s  médiane {result['median']:.4f}s  "
+              f"{result['lines_per_second'] or 0:>10} lignes/s")
+    
+    def _load(self, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.readlines()
+    
+    def _extract(self, path, content):
+        from core.extraction_enhanced import EnhancedTextExtractor
+        extractor = EnhancedTextExtractor()
+        extractor.load_file_content(content, path)
+        return extractor.extract_texts()
+    
+    def run_file_size(self, line_count):
+        """Validation, extraction, reconstruction et cohérence d'un fichier (sans glossaire)"""
+        from core.validation import FileValidator
+        from core.reconstruction_enhanced import EnhancedFileReconstructor
+        from core.coherence_checker import CoherenceChecker
+        from core.glossary import glossary_manager
+        
+        glossary_manager.glossary = generate_glossary(0)
+        path = write_tl_file(self.tl_folder, line_count, self.seed)
+        size = os.path.getsize(path)
+        content = self._load(path)
+        lines = len(content)
+        print(f"Fichier de {lines} lignes ({size / (1024 * 1024):.2f} Mo)")
+        
+        self._record('validation', self._measure(lambda: FileValidator.is_renpy_file(path)), lines, size)
+        self._record('extraction', self._measure(lambda: self._extract(path, content)), lines, size)
+        
+        # La reconstruction consomme les fichiers de l'extraction : réextraire avant chaque mesure
+        rebuilt = {}
+        def rebuild():
+            reconstructor = EnhancedFileReconstructor()
+            reconstructor.load_file_content(content, path)
+            rebuilt['path'] = reconstructor.reconstruct_file('new_file')['save_path']
+        self._record('reconstruction',
+                     self._measure(rebuild, prepare=lambda: self._extract(path, content)),
+                     lines, size)
+        
+        self._record('coherence',
+                     self._measure(lambda: CoherenceChecker().check_file_coherence(rebuilt['path'])),
+                     lines, os.path.getsize(rebuilt['path']))
+    
+    def run_glossary_size(self, term_count, line_count):
+        """Protection du glossaire et extraction complète avec term_count termes"""
+        from core.glossary import glossary_manager
+        
+        path = write_tl_file(self.tl_folder, line_count, self.seed, name=f"glossaire_{line_count}.rpy")
+        size = os.path.getsize(path)
+        content = self._load(path)
+        lines = len(content)
+        
+        glossary_manager.glossary = generate_glossary(term_count, self.seed)
+        try:
+            self._record('glossaire',
+                         self._measure(lambda: glossary_manager.protect_glossary_terms(content)),
+                         lines, size, term_count)
+            self._record('extraction',
+                         self._measure(lambda: self._extract(path, content)),
+                         lines, size, term_count)
+        finally:
+            glossary_manager.glossary = generate_glossary(0)
+
+def compare_results(current, previous):
+    """
+    Compare deux campagnes (meilleur temps de chaque mesure commune)
+    
+    Returns:
+        list: {'benchmark', 'lines', 'glossary_terms', 'before', 'after', 'ratio'}
+    """
+    before = {_result_key(result): result for result in previous.get('results', [])}
+    comparison = []
+    for result in current['results']:
+        old = before.get(_result_key(result))
+        if not old or not old['best']:
+            continue
+        comparison.append({
+            'benchmark': result['benchmark'],
+            'lines': result['lines'],
+            'glossary_terms': result['glossary_terms'],
+            'before': old['best'],
+            'after': result['best'],
+            'ratio': round(result['best'] / old['best'], 3)
+        })
+    return comparison
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Mesures de performance du Traducteur Ren'Py Pro")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Tailles des fichiers générés, en lignes")
+    parser.add_argument("--glossary-sizes", type=int, nargs="+", default=DEFAULT_GLOSSARY_SIZES,
+                        help="Nombres de termes du glossaire")
+    parser.add_argument("--glossary-lines", type=int, default=DEFAULT_GLOSSARY_LINES,
+                        help="Taille du fichier utilisé pour les mesures du glossaire")
+    parser.add_argument("--repeat", type=int, default=3, help="Exécutions par mesure")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du corpus")
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    parser.add_argument("--compare", help="Résultats précédents à comparer")
+    parser.add_argument("--verbose", action="store_true", help="Conserver les messages INFO dans le log")
+    parser.add_argument("--keep", action="store_true", help="Conserver le dossier de travail")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    start_dir = os.getcwd()
+    previous = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    
+    # Les modules créent leurs dossiers (configuration, log, temporaires)
+    # dans le dossier courant : les importer seulement depuis le dossier de travail
+    work_dir = tempfile.mkdtemp(prefix="renpy_benchmarks_")
+    os.chdir(work_dir)
+    try:
+        from utils.constants import VERSION, FOLDERS
+        from utils.logging import set_log_level
+        if not args.verbose:
+            set_log_level("WARNING")
+        
+        suite = BenchmarkSuite(work_dir, args.repeat, args.seed)
+        started = time.perf_counter()
+        for line_count in args.sizes:
+            suite.run_file_size(line_count)
+        if args.glossary_sizes:
+            print(f"Glossaire ({args.glossary_lines} lignes)")
+            for term_count in args.glossary_sizes:
+                suite.run_glossary_size(term_count, args.glossary_lines)
+    finally:
+        # Log et rapport de performance écrits ici : à la sortie du programme
+        # (atexit), le dossier courant ne serait plus le dossier de travail
+        from utils.logging import flush_log
+        from utils.performance import flush_performance_report
+        flush_log()
+        flush_performance_report()
+        os.chdir(start_dir)
+        if args.keep:
+            print(f"Dossier de travail conservé: {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    
+    timestamp = datetime.datetime.now()
+    report = {
+        'version': VERSION,
+        'generated': timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+        'duration': round(time.perf_counter() - started, 3),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'config': {
+            'sizes': args.sizes,
+            'glossary_sizes': args.glossary_sizes,
+            'glossary_lines': args.glossary_lines,
+            'repeat': args.repeat,
+            'seed': args.seed
+        },
+        'results': suite.results
+    }
+    if previous:
+        report['compared_to'] = {'version': previous.get('version'), 'generated': previous.get('generated')}
+        report['comparison'] = compare_results(report, previous)
+        print(f"Comparaison avec la version {previous.get('version')} ({previous.get('generated')}):")
+        for item in report['comparison']:
+            print(f"  {item['benchmark']:<15} {item['lines']:>9} lignes  glossaire {item['glossary_terms']:>6}  "
+                  f"{item['before']:.4f}s -> {item['after']:.4f}s  x{item['ratio']}")
+    
+    output = args.output or os.path.join(
+        start_dir, FOLDERS["configs"], "benchmarks",
+        f"benchmark_{VERSION}_{timestamp.strftime('%Y%m%d_%H%M%S')}.json")
+    output_dir = os.path.dirname(os.path.abspath(output))
+    os.makedirs(output_dir, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"Résultats: {output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,414 @@
+# core/batch.py
+# Batch Processing Module
+# Created for Traducteur Ren'Py Pro v2.4.4
+
+"""
+Traitement par lots d'un dossier (extraction ou reconstruction) avec reprise
+
+Les fichiers traversent un pipeline lecture -> traitement -> écriture, les
+plus gros en premier.
+Après chaque fichier, une entrée est ajoutée (et synchronisée sur le disque)
+au journal de reprise du lot. Une exécution avec resume=True ignore les
+fichiers déjà traités dont le contenu n'a pas changé (empreinte SHA-256).
+"""
+
+import io
+import os
+import json
+import time
+import queue
+import hashlib
+import datetime
+import threading
+from utils.constants import FILE_NAMES, BATCH_CONFIG
+from utils.logging import log_message, log_performance, anonymize_path, extract_game_name
+from utils.performance import flush_performance_report
+from core.project_store import compute_file_hash
+from core.extraction_enhanced import write_text_file, get_file_base_name
+
+BATCH_MODES = ('extract', 'rebuild')
+
+def get_checkpoint_path(game_name, mode):
+    """Chemin du journal de reprise d'un lot"""
+    safe_name = "".join(c if c.isalnum() or c in "-_." else "_" for c in game_name)
+    return os.path.join(FILE_NAMES["checkpoints_folder"], f"{safe_name}_{mode}.jsonl")
+
+class CheckpointJournal:
+    """Journal JSON-lines des fichiers terminés d'un lot"""
+    
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+    
+    def load(self):
+        """
+        Relit le journal
+        
+        Returns:
+            dict: Chemin absolu -> dernière entrée terminée ('done')
+        """
+        completed = {}
+        if not os.path.exists(self.path):
+            return completed
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Dernière ligne tronquée par une interruption
+                if entry.get('type') != 'file':
+                    continue
+                if entry.get('status') == 'done':
+                    completed[entry['path']] = entry
+                else:
+                    completed.pop(entry['path'], None)
+        return completed
+    
+    def open(self, header, resume=False):
+        """Ouvre le journal (vidé sauf en reprise) et écrit l'en-tête de session"""
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._file = open(self.path, 'a' if resume else 'w', encoding='utf-8', newline='')
+        self.write(dict(header, type='session', resume=resume))
+    
+    def write(self, entry):
+        """Ajoute une entrée et la synchronise sur le disque"""
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class BatchTask:
+    """Fichier en cours de traitement dans le pipeline d'un lot"""
+    
+    __slots__ = ('index', 'entry', 'path', 'content', 'source_hash', 'status',
+                 'error', 'details', 'artifacts', 'started', 'record')
+    
+    def __init__(self, index, entry):
+        self.index = index
+        self.entry = entry
+        self.path = os.path.abspath(entry['path'])
+        self.content = None
+        self.source_hash = None
+        self.status = 'pending'
+        self.error = None
+        self.details = {}
+        self.artifacts = []  # (chemin, contenu) écrits par le thread d'écriture
+        self.started = time.time()
+        self.record = None   # Enregistrement différé dans la base de projet
+
+class _QueueStats:
+    """Échantillons de profondeur des files du pipeline"""
+    
+    def __init__(self, *names):
+        self.samples = {name: [0, 0, 0] for name in names}  # max, somme, nombre
+        self._lock = threading.Lock()
+    
+    def sample(self, name, q):
+        depth = q.qsize()
+        with self._lock:
+            stats = self.samples[name]
+            stats[0] = max(stats[0], depth)
+            stats[1] += depth
+            stats[2] += 1
+    
+    def to_details(self):
+        details = {}
+        for name, (maximum, total, count) in self.samples.items():
+            details[f"file_{name}_max"] = maximum
+            details[f"file_{name}_moy"] = round(total / count, 2) if count else 0
+        return details
+
+class BatchRunner:
+    """
+    Extraction ou reconstruction de tous les fichiers .rpy d'un dossier
+    
+    Les fichiers traversent un pipeline : un thread de lecture (empreinte,
+    validation, sauvegarde, lecture), des threads de traitement, puis un
+    thread d'écriture (fichiers produits, journal, base de projet), reliés
+    par des files bornées. Les accès disque d'un fichier se recouvrent ainsi
+    avec le traitement des autres.
+    
+    Les fichiers sont lus du plus gros au plus petit (tailles du parcours du
+    dossier) pour qu'aucun thread ne finisse seul sur un gros fichier.
+    """
+    
+    def __init__(self, folder, mode='extract', resume=False, save_mode='new_file',
+                 progress_callback=None, workers=None):
+        """
+        Args:
+            folder (str): Dossier à traiter (ex: game/tl/french)
+            mode (str): 'extract' ou 'rebuild'
+            resume (bool): Ignorer les fichiers terminés lors d'un lot précédent
+            save_mode (str): Mode de sauvegarde de la reconstruction ('new_file' ou 'overwrite')
+            progress_callback (callable, optional): Appelée avec (index, total, entrée, statut)
+            workers (int, optional): Threads de traitement (BATCH_CONFIG["workers"] par défaut)
+        """
+        if mode not in BATCH_MODES:
+            raise ValueError(f"Mode de lot inconnu: {mode}")
+        self.folder = os.path.abspath(folder)
+        self.mode = mode
+        self.resume = resume
+        self.save_mode = save_mode
+        self.progress_callback = progress_callback
+        self.workers = max(1, workers or BATCH_CONFIG["workers"])
+        self.journal = None
+        self._completed = {}
+        self._summary = None
+        self._done_count = 0
+        self._name_conflicts = {}
+    
+    def discover(self):
+        """
+        Fichiers .rpy du dossier (voir scan_rpy_files)
+        
+        Les scripts qui partageraient leurs fichiers de travail (même jeu et même
+        nom de base, voir get_file_base_name) sont notés pour être refusés.
+        """
+        from core.file_manager import scan_rpy_files, project_manager
+        entries, _ = scan_rpy_files(self.folder)
+        project_manager.sync_folder(entries)
+        
+        by_name = {}
+        for entry in entries:
+            key = (extract_game_name(entry['path']), get_file_base_name(entry['path']))
+            by_name.setdefault(key, []).append(entry)
+        self._name_conflicts = {}
+        for (game_name, file_base), same_name in by_name.items():
+            if len(same_name) > 1:
+                others = ", ".join(entry['rel_path'] for entry in same_name)
+                log_message("WARNING", f"Lot: fichiers de travail communs ({file_base}) pour {others} : ignorés")
+                for entry in same_name:
+                    self._name_conflicts[entry['path']] = (
+                        f"Nom de fichiers de travail '{file_base}' partagé par {others} : "
+                        "renommez l'un des scripts")
+        return entries
+    
+    def run(self):
+        """
+        Exécute le lot
+        
+        Returns:
+            dict: Bilan {'total', 'processed', 'skipped', 'failed', 'errors', 'duration', 'checkpoint'}
+        """
+        start_time = time.time()
+        entries = self.discover()
+        summary = self._summary = {'total': len(entries), 'processed': 0, 'skipped': 0,
+                                   'failed': 0, 'errors': []}
+        if not entries:
+            log_message("WARNING", f"Lot: aucun fichier .rpy dans {anonymize_path(self.folder)}")
+            summary['duration'] = 0.0
+            summary['checkpoint'] = None
+            return summary
+        
+        game_name = extract_game_name(entries[0]['path'])
+        self.journal = CheckpointJournal(get_checkpoint_path(game_name, self.mode))
+        self._completed = self.journal.load() if self.resume else {}
+        self.journal.open({
+            'mode': self.mode,
+            'folder': self.folder,
+            'save_mode': self.save_mode,
+            'workers': self.workers,
+            'started': datetime.datetime.now().isoformat(timespec='seconds')
+        }, resume=self.resume)
+        
+        log_message("INFO", f"Lot {self.mode}: {len(entries)} fichiers dans {anonymize_path(self.folder)}, {self.workers} thread(s)" + (" (reprise)" if self.resume else ""))
+        try:
+            queue_stats = self._run_pipeline(entries)
+        finally:
+            self.journal.close()
+        
+        summary['duration'] = time.time() - start_time
+        summary['checkpoint'] = self.journal.path
+        log_message("INFO", f"Lot {self.mode} terminé en {summary['duration']:.2f}s: {summary['processed']} traités, {summary['skipped']} déjà faits, {summary['failed']} en échec")
+        
+        details = {'fichiers': len(entries), 'threads': self.workers}
+        details.update(queue_stats.to_details())
+        log_performance(f"lot_{self.mode}", os.path.basename(self.folder), summary['duration'], details)
+        flush_performance_report()
+        return summary
+    
+    # --- Pipeline ---
+    
+    def _schedule(self, entries):
+        """Ordre de traitement : les plus gros fichiers d'abord"""
+        return sorted(entries, key=lambda entry: entry.get('size') or 0, reverse=True)
+    
+    def _run_pipeline(self, entries):
+        """Lance les threads de lecture, de traitement et d'écriture puis attend la fin"""
+        queue_size = BATCH_CONFIG["queue_size"]
+        read_queue = queue.Queue(maxsize=queue_size)
+        write_queue = queue.Queue(maxsize=queue_size)
+        stats = _QueueStats('lecture', 'ecriture')
+        
+        def reader():
+            try:
+                for index, entry in enumerate(self._schedule(entries), 1):
+                    task = BatchTask(index, entry)
+                    self._guard(self._read_task, task)
+                    read_queue.put(task)
+                    stats.sample('lecture', read_queue)
+            finally:
+                for _ in range(self.workers):
+                    read_queue.put(None)
+        
+        def worker():
+            try:
+                while True:
+                    task = read_queue.get()
+                    if task is None:
+                        break
+                    if task.status == 'pending':
+                        self._guard(self._process_task, task)
+                    task.content = None  # Libérer le contenu avant l'écriture
+                    write_queue.put(task)
+                    stats.sample('ecriture', write_queue)
+            finally:
+                write_queue.put(None)
+        
+        threads = [threading.Thread(target=reader, name="BatchReader", daemon=True)]
+        threads += [threading.Thread(target=worker, name=f"BatchWorker-{n}", daemon=True)
+                    for n in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        
+        # Écriture dans le thread appelant : journal et rappels restent séquentiels
+        finished_workers = 0
+        while finished_workers < self.workers:
+            task = write_queue.get()
+            if task is None:
+                finished_workers += 1
+                continue
+            self._guard(self._write_task, task)
+            self._finish_task(task, len(entries))
+        
+        for thread in threads:
+            thread.join()
+        return stats
+    
+    def _guard(self, stage, task):
+        """Exécute une étape ; une erreur marque seulement ce fichier en échec"""
+        try:
+            stage(task)
+        except Exception as e:
+            log_message("ERREUR", f"Lot {self.mode}: échec pour {anonymize_path(task.path)}", e)
+            task.status = 'failed'
+            task.error = str(e)
+    
+    def _read_task(self, task):
+        """Étape lecture : reprise, validation, sauvegarde et chargement du contenu"""
+        from core.extraction_enhanced import should_stream_extraction
+        from core.validation import validate_before_extraction, create_safety_backup
+        
+        if task.path in self._name_conflicts:
+            raise ValueError(self._name_conflicts[task.path])
+        
+        record = self._completed.get(task.path)
+        if record:
+            if compute_file_hash(task.path) == record.get('hash_after'):
+                task.status = 'skipped'
+                return
+            log_message("INFO", f"Reprise: {anonymize_path(task.path)} modifié depuis le lot précédent, retraité")
+        
+        if self.mode == 'extract':
+            validate_before_extraction(task.path)
+            create_safety_backup(task.path)
+            if should_stream_extraction(task.path):
+                # Gros fichier : lu bloc par bloc par le thread de traitement
+                task.source_hash = compute_file_hash(task.path)
+                return
+        
+        with open(task.path, 'rb') as f:
+            data = f.read()
+        task.source_hash = hashlib.sha256(data).hexdigest()
+        # Même décodage que open(..., 'r', encoding='utf-8').readlines()
+        task.content = io.TextIOWrapper(io.BytesIO(data), encoding='utf-8').readlines()
+    
+    def _process_task(self, task):
+        """Étape traitement : extraction ou reconstruction"""
+        if self.mode == 'extract':
+            self._extract_task(task)
+        else:
+            self._rebuild_task(task)
+    
+    def _extract_task(self, task):
+        from core.extraction_enhanced import EnhancedTextExtractor
+        from core.file_manager import project_manager
+        
+        extractor = EnhancedTextExtractor()
+        if task.content is None:
+            results = extractor.extract_texts_streaming(task.path)
+        else:
+            extractor.load_file_content(task.content, task.path)
+            results = extractor.extract_texts(
+                write_file=lambda path, content: task.artifacts.append((path, content)))
+        
+        task.record = lambda: project_manager.record_extraction(task.path, extractor, results)
+        task.details = {
+            'source_hash': task.source_hash,
+            'extracted_count': extractor.extracted_count,
+            'asterix_count': extractor.asterix_count,
+            'empty_count': extractor.empty_count,
+            'main_file': results.get('main_file')
+        }
+    
+    def _rebuild_task(self, task):
+        from core.reconstruction_enhanced import EnhancedFileReconstructor
+        from core.file_manager import project_manager
+        
+        # La reconstruction écrit elle-même son résultat (écriture atomique en flux)
+        reconstructor = EnhancedFileReconstructor()
+        reconstructor.load_file_content(task.content, task.path)
+        result = reconstructor.reconstruct_file(self.save_mode)
+        
+        task.record = lambda: project_manager.record_rebuild(
+            task.path, result['save_path'], result['reconstruction_time'])
+        task.details = {'source_hash': task.source_hash, 'save_path': result['save_path']}
+    
+    def _write_task(self, task):
+        """Étape écriture : fichiers produits puis base de projet"""
+        if task.status != 'pending':
+            return
+        for path, content in task.artifacts:
+            write_text_file(path, content)
+        task.artifacts = []
+        if task.record:
+            task.record()
+        task.status = 'done'
+    
+    def _finish_task(self, task, total):
+        """Inscrit le résultat au journal et au bilan"""
+        summary = self._summary
+        duration = round(time.time() - task.started, 3)
+        
+        if task.status == 'done':
+            hash_after = task.source_hash if self.mode == 'extract' else compute_file_hash(task.path)
+            self.journal.write(dict(task.details, type='file', path=task.path, status='done',
+                                    hash_after=hash_after, duration=duration))
+            summary['processed'] += 1
+        elif task.status == 'skipped':
+            summary['skipped'] += 1
+        else:
+            summary['failed'] += 1
+            summary['errors'].append({'path': task.path, 'error': task.error})
+            self.journal.write({'type': 'file', 'path': task.path, 'status': 'failed',
+                                'error': task.error, 'duration': duration})
+        
+        self._done_count += 1
+        if self.progress_callback:
+            self.progress_callback(self._done_count, total, task.entry, task.status)
+
+def run_batch(folder, mode='extract', resume=False, save_mode='new_file', progress_callback=None,
+              workers=None):
+    """
+    Lance un lot sur un dossier
+    
+    Returns:
+        dict: Bilan du lot (voir BatchRunner.run)
+    """
+    return BatchRunner(folder, mode, resume, save_mode, progress_callback, workers).run()
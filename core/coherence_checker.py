@@ -6,9 +6,12 @@
 Module de vérification de la cohérence entre lignes OLD et NEW
 """
 
-import re
 import os
+from utils.constants import REGEX_PATTERNS
 from utils.logging import log_message
+from utils.performance import timed_span, add_span_bytes
+from utils.profiling import profiled
+from core.line_buffer import open_script_lines
 
 class CoherenceChecker:
     """Vérificateur de cohérence OLD/NEW"""
@@ -17,6 +20,8 @@ class CoherenceChecker:
         self.issues = []
         self.checked_lines = 0
         
+    @profiled("coherence")
+    @timed_span("coherence")
     def check_file_coherence(self, filepath):
         """
         Vérifie la cohérence d'un fichier .rpy traduit
@@ -45,12 +50,12 @@ class CoherenceChecker:
                 })
                 return result
             
-            # Lire le fichier
-            with open(filepath, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Analyser ligne par ligne
-            self._analyze_lines(lines, result)
+            # Lire le fichier (projeté en mémoire au-delà du seuil des gros fichiers)
+            with open_script_lines(filepath) as lines:
+                add_span_bytes(os.path.getsize(filepath))
+                
+                # Analyser ligne par ligne
+                self._analyze_lines(lines, result)
             
             # Créer le fichier d'avertissement si nécessaire
             if result['issues']:
@@ -199,16 +204,13 @@ class CoherenceChecker:
             if total_chars == 0:
                 return True
             
-            # Compter les variables [], {}, %(), etc.
-            import re
-            
-            # Variables et codes
-            variables = re.findall(r'\[[^\]]*\]|\{[^}]*\}|%\([^)]*\)|%[a-zA-Z_]|\(\d+\)', text)
+            # Variables et codes [], {}, %(), etc.
+            variables = REGEX_PATTERNS["code_chars"].findall(text)
             for var in variables:
                 code_chars += len(var)
             
             # Séquences d'échappement
-            escapes = re.findall(r'\\[a-zA-Z]', text)
+            escapes = REGEX_PATTERNS["escape_sequence"].findall(text)
             for esc in escapes:
                 code_chars += len(esc)
             
@@ -348,15 +350,15 @@ class CoherenceChecker:
     
     def _extract_quoted_content(self, line):
         """Extrait tous les contenus entre guillemets d'une ligne"""
-        return re.findall(r'"([^"]*)"', line)
+        return REGEX_PATTERNS["quoted_text"].findall(line)
     
     def _check_content_coherence(self, old_text, new_text, old_line_num, new_line_num):
         """Vérifie la cohérence entre deux contenus textuels"""
         issues = []
         
         # 1. Vérifier les balises {}
-        old_tags = re.findall(r'\{[^}]*\}', old_text)
-        new_tags = re.findall(r'\{[^}]*\}', new_text)
+        old_tags = REGEX_PATTERNS["tag"].findall(old_text)
+        new_tags = REGEX_PATTERNS["tag"].findall(new_text)
         
         if old_tags != new_tags:
             issues.append({
@@ -369,8 +371,8 @@ class CoherenceChecker:
             })
         
         # 2. Vérifier les variables []
-        old_vars = re.findall(r'\[[^\]]*\]', old_text)
-        new_vars = re.findall(r'\[[^\]]*\]', new_text)
+        old_vars = REGEX_PATTERNS["variable"].findall(old_text)
+        new_vars = REGEX_PATTERNS["variable"].findall(new_text)
         
         if old_vars != new_vars:
             issues.append({
@@ -383,8 +385,8 @@ class CoherenceChecker:
             })
         
         # 3. Vérifier les placeholders ()
-        old_placeholders = re.findall(r'\(\d+\)', old_text)
-        new_placeholders = re.findall(r'\(\d+\)', new_text)
+        old_placeholders = REGEX_PATTERNS["placeholder"].findall(old_text)
+        new_placeholders = REGEX_PATTERNS["placeholder"].findall(new_text)
         
         if old_placeholders != new_placeholders:
             issues.append({
@@ -397,7 +399,7 @@ class CoherenceChecker:
             })
         
         # 4. Vérifier les placeholders malformés
-        malformed = re.findall(r'\(\d+(?!\))', new_text)
+        malformed = REGEX_PATTERNS["malformed_placeholder"].findall(new_text)
         if malformed:
             issues.append({
                 'line': new_line_num,
@@ -409,8 +411,8 @@ class CoherenceChecker:
             })
         
         # 5. Vérifier les balises orphelines
-        orphan_open = re.findall(r'\{[^}]*$', new_text)
-        orphan_close = re.findall(r'^[^{]*\}', new_text)
+        orphan_open = REGEX_PATTERNS["orphan_open"].findall(new_text)
+        orphan_close = REGEX_PATTERNS["orphan_close"].findall(new_text)
         
         if orphan_open or orphan_close:
             issues.append({
@@ -423,8 +425,8 @@ class CoherenceChecker:
             })
         
         # 6. Vérifier les codes spéciaux
-        old_special = re.findall(r'\\n|--|%[^%]*%', old_text)
-        new_special = re.findall(r'\\n|--|%[^%]*%', new_text)
+        old_special = REGEX_PATTERNS["special_sequence"].findall(old_text)
+        new_special = REGEX_PATTERNS["special_sequence"].findall(new_text)
         
         if old_special != new_special:
             issues.append({
@@ -455,7 +457,8 @@ class CoherenceChecker:
             # Créer le dossier d'avertissements du jeu
             os.makedirs(game_warnings_folder, exist_ok=True)
             
-            base_name = os.path.splitext(os.path.basename(original_filepath))[0]
+            from core.extraction import get_file_base_name
+            base_name = get_file_base_name(original_filepath)
             warning_file = os.path.join(game_warnings_folder, f"{base_name}_avertissement.txt")
             
             with open(warning_file, 'w', encoding='utf-8') as f:
@@ -7,18 +7,20 @@ Module d'extraction des textes depuis les fichiers Ren'Py
 """
 
 import os
-import re
 import time
 import json
 from collections import OrderedDict
-from utils.constants import SPECIAL_CODES, PROTECTION_ORDER
-from utils.logging import log_message, anonymize_path
+from utils.constants import PROTECTION_ORDER, REGEX_PATTERNS
+from utils.logging import log_message, log_item, flush_item_summaries, anonymize_path, get_script_subfolders
 
 # Fonction extract_game_name déplacée vers utils/logging.py pour éviter la duplication
 def get_file_base_name(filepath):
     """
     Récupère le nom de base du fichier sans extension pour créer des fichiers uniques
     
+    Les sous-dossiers sous le dossier de langue sont préfixés (chapitre1/script.rpy
+    -> chapitre1__script) : deux scripts de même nom ne partagent pas leurs fichiers.
+    
     Args:
         filepath (str): Chemin du fichier
         
@@ -29,10 +31,10 @@ def get_file_base_name(filepath):
         return "vierge"  # Fallback par défaut
     
     filename = os.path.basename(filepath)
-    base_name = os.path.splitext(filename)[0]
+    base_name = "__".join(get_script_subfolders(filepath) + [os.path.splitext(filename)[0]])
     
     # Nettoyer le nom pour éviter les caractères problématiques
-    safe_name = re.sub(r'[<>:"/\\|?*]', '_', base_name)
+    safe_name = REGEX_PATTERNS["unsafe_filename"].sub('_', base_name)
     
     return safe_name
 
@@ -131,13 +133,15 @@ class TextExtractor:
         try:
             for line in self.file_content:
                 # Rechercher les balises classiques {}, []
-                for tag in re.findall(r'(\{[^}]+\}|\[[^\]]+\])', line):
+                for tag in REGEX_PATTERNS["code_tags"].findall(line):
                     if tag not in self.mapping:
                         self.mapping[tag] = f"({len(self.mapping)+1:02d})"
                 
-                # Appliquer chaque pattern de code spécial
-                for pattern in SPECIAL_CODES:
-                    for match in re.finditer(pattern, line):
+                # Appliquer chaque pattern de code spécial (ligne ignorée si aucun n'est présent)
+                if not REGEX_PATTERNS["special_codes_any"].search(line):
+                    continue
+                for pattern in REGEX_PATTERNS["special_codes"]:
+                    for match in pattern.finditer(line):
                         code = match.group(0)
                         if code not in self.mapping:
                             self.mapping[code] = f"({len(self.mapping)+1:02d})"
@@ -163,7 +167,7 @@ class TextExtractor:
                     continue
                     
                 # Rechercher les textes entre astérisques seulement dans les lignes valides
-                asterix_matches = re.findall(r'\*([^*]+)\*', line)
+                asterix_matches = REGEX_PATTERNS["asterix"].findall(line)
                 for asterix_text in asterix_matches:
                     full_asterix = f"*{asterix_text}*"
                     
@@ -176,8 +180,9 @@ class TextExtractor:
                         self.asterix_texts.append(protected_content + '\n')
                         
                         asterix_counter += 1
-                        log_message("INFO", f"Expression astérisque détectée et protégée: {full_asterix} -> {placeholder}")
+                        log_item("INFO", "Expressions astérisques", f"Expression astérisque détectée et protégée: {full_asterix} -> {placeholder}")
             
+            flush_item_summaries("Expressions astérisques")
             if len(self.asterix_texts) > 0:
                 log_message("INFO", f"Expressions entre astérisques: {len(self.asterix_texts)} détectées avec codes protégés")
 
@@ -289,14 +294,14 @@ class TextExtractor:
                     continue
                 
                 # Extraire TOUS les contenus entre guillemets ET protéger le suffixe
-                quote_matches = re.findall(r'"([^"]*)"', stripped)
+                quote_matches = REGEX_PATTERNS["quoted_text"].findall(stripped)
                 
                 if quote_matches:
                     # Filtrer les contenus pour ne garder que ceux qui ne sont pas des placeholders vides
                     non_empty_quotes = []
                     for content in quote_matches:
                         # Vérifier si c'est un placeholder vide comme (C1), (C2), etc.
-                        if not re.match(r'^\(C\d+\)$', content.strip()) and not re.match(r'^\(ESC\d+\)$', content.strip()):
+                        if not REGEX_PATTERNS["empty_placeholder"].fullmatch(content.strip()):
                             if content.strip():  # Ne pas extraire les lignes vides
                                 non_empty_quotes.append(content)
                     
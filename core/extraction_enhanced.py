@@ -10,9 +10,15 @@ import os
 import re
 import time
 import json
+import shutil
 from collections import OrderedDict
-from utils.constants import SPECIAL_CODES, PROTECTION_ORDER
-from utils.logging import log_message, anonymize_path
+from utils.constants import PROTECTION_ORDER, LARGE_FILES, REGEX_PATTERNS
+from utils.logging import log_message, log_item, flush_item_summaries, anonymize_path, get_script_subfolders
+from utils.performance import perf_span
+from utils.profiling import profiled
+from core.line_buffer import LineOverlay
+from core.positions import PositionTable
+from core.replacement import MappingReplacer
 
 # ✅ CORRECTION : Créer PROTECTION_ORDER_NO_ELLIPSIS correctement
 PROTECTION_ORDER_NO_ELLIPSIS = [
@@ -24,10 +30,45 @@ PROTECTION_ORDER_NO_ELLIPSIS = [
     # ✅ Points de suspension supprimés
 ]
 
+# Textes vides à protéger ; REGEX_PATTERNS["empty_texts"] les trouve tous en une passe
+# (construite sur PROTECTION_ORDER, de même contenu)
+_EMPTY_PATTERNS = [pattern for pattern, _ in PROTECTION_ORDER_NO_ELLIPSIS if pattern != r'\"']
+_EMPTY_TEXT_REGEX = REGEX_PATTERNS["empty_texts"]
+
+_CODE_TAG_REGEX = REGEX_PATTERNS["code_tags"]
+_SPECIAL_CODE_REGEXES = REGEX_PATTERNS["special_codes"]
+_ANY_SPECIAL_CODE_REGEX = REGEX_PATTERNS["special_codes_any"]
+_ASTERIX_REGEX = REGEX_PATTERNS["asterix"]
+_QUOTED_TEXT_REGEX = REGEX_PATTERNS["quoted_text"]
+_LAST_QUOTE_REGEX = REGEX_PATTERNS["last_quote"]
+_EMPTY_PLACEHOLDER_REGEX = REGEX_PATTERNS["empty_placeholder"]
+
+def scan_dialogue_quotes(line):
+    """
+    Textes entre guillemets et suffixe d'une ligne de dialogue
+    
+    Le suffixe est ce qui suit la dernière guillemet non échappée
+    (une guillemet précédée d'une barre oblique est échappée).
+    
+    Args:
+        line (str): Ligne sans espaces de début et de fin
+        
+    Returns:
+        tuple: (textes entre guillemets, suffixe)
+    """
+    quoted = _QUOTED_TEXT_REGEX.findall(line)
+    if not quoted:
+        return quoted, ""
+    last_quote = _LAST_QUOTE_REGEX.match(line)
+    return quoted, line[last_quote.end():] if last_quote else ""
+
 def get_file_base_name(filepath):
     """
     Récupère le nom de base du fichier sans extension pour créer des fichiers uniques
     
+    Les sous-dossiers sous le dossier de langue sont préfixés (chapitre1/script.rpy
+    -> chapitre1__script) : deux scripts de même nom ne partagent pas leurs fichiers.
+    
     Args:
         filepath (str): Chemin du fichier
         
@@ -38,10 +79,10 @@ def get_file_base_name(filepath):
         return "vierge"  # Fallback par défaut
     
     filename = os.path.basename(filepath)
-    base_name = os.path.splitext(filename)[0]
+    base_name = "__".join(get_script_subfolders(filepath) + [os.path.splitext(filename)[0]])
     
     # Nettoyer le nom pour éviter les caractères problématiques
-    safe_name = re.sub(r'[<>:"/\\|?*]', '_', base_name)
+    safe_name = REGEX_PATTERNS["unsafe_filename"].sub('_', base_name)
     
     return safe_name
 
@@ -61,12 +102,11 @@ class EnhancedTextExtractor:
         self.asterix_mapping = OrderedDict()
         self.empty_mapping = OrderedDict()
         self.glossary_mapping = OrderedDict()  # ✅ NOUVEAU : Mapping du glossaire
-        self.positions = []
+        self.position_table = PositionTable()  # Lignes extraites : index, nombre de textes, suffixe
         self.extracted_texts = []
-        self.line_quote_counts = []
-        self.line_suffixes = []
         self.asterix_texts = []
         self.empty_texts = []
+        self._line_offset = 0  # Index de la première ligne chargée (mode streaming)
     
     def load_file_content(self, file_content, original_path):
         """
@@ -76,7 +116,8 @@ class EnhancedTextExtractor:
             file_content (list): Lignes du fichier
             original_path (str): Chemin du fichier original
         """
-        self.file_content = file_content[:]  # Copie pour éviter la modification de l'original
+        # Vue copie à l'écriture : l'original reste partagé et n'est pas modifié
+        self.file_content = LineOverlay(file_content)
         self.original_path = original_path
         self._reset_extraction_data()
     
@@ -86,10 +127,8 @@ class EnhancedTextExtractor:
         self.asterix_mapping.clear()
         self.empty_mapping.clear()
         self.glossary_mapping.clear()  # ✅ NOUVEAU
-        self.positions.clear()
+        self.position_table.clear()
         self.extracted_texts.clear()
-        self.line_quote_counts.clear()
-        self.line_suffixes.clear()
         self.asterix_texts.clear()
         self.empty_texts.clear()
         
@@ -97,11 +136,17 @@ class EnhancedTextExtractor:
         self.extracted_count = 0
         self.asterix_count = 0
         self.empty_count = 0
+        self._line_offset = 0
     
-    def extract_texts(self):
+    @profiled("extraction")
+    def extract_texts(self, write_file=None):
         """
         Fonction principale d'extraction des textes avec support du glossaire
         
+        Args:
+            write_file (callable, optional): Reçoit (chemin, contenu) de chaque fichier
+                                             produit au lieu de l'écrire (pipeline des lots)
+        
         Returns:
             dict: Résultats de l'extraction avec chemins des fichiers créés
         """
@@ -111,21 +156,19 @@ class EnhancedTextExtractor:
         start_time = time.time()
         log_message("INFO", f"Début d'extraction avec glossaire pour {anonymize_path(self.original_path) if self.original_path else 'fichier_inconnu'}")
         
+        file_name = os.path.basename(self.original_path) if self.original_path else None
+        content_size = sum(len(line) for line in self.file_content)
+        
         try:
-            # ✅ NOUVEAU : Étape 1 - Protection des termes du glossaire
-            self._apply_glossary_protection()
-            
-            # Étapes d'extraction existantes
-            self._build_code_mapping()
-            self._build_asterix_mapping()
-            self._apply_empty_text_protection()
-            self._extract_dialogue_texts()
-            
-            # Calcul du temps
-            self.extraction_time = time.time() - start_time
-            
-            # Sauvegarde des fichiers
-            result = self._save_extraction_files()
+            with perf_span("extraction", file_name=file_name, bytes_processed=content_size):
+                self._run_extraction_steps()
+                
+                # Calcul du temps
+                self.extraction_time = time.time() - start_time
+                
+                # Sauvegarde des fichiers
+                with perf_span("sauvegarde_fichiers"):
+                    result = self._save_extraction_files(write_file)
             
             # Statistiques finales
             self.extracted_count = len(self.extracted_texts)
@@ -140,18 +183,114 @@ class EnhancedTextExtractor:
             log_message("ERREUR", "Erreur critique pendant l'extraction avec glossaire", e)
             raise
     
+    def _run_extraction_steps(self):
+        """Applique les étapes d'extraction au contenu chargé"""
+        # ✅ NOUVEAU : Étape 1 - Protection des termes du glossaire
+        with perf_span("protection_glossaire"):
+            self._apply_glossary_protection()
+        
+        # Étapes d'extraction existantes
+        with perf_span("mapping_codes"):
+            self._build_code_mapping()
+        with perf_span("mapping_asterisques"):
+            self._build_asterix_mapping()
+        with perf_span("protection_vides"):
+            self._apply_empty_text_protection()
+        with perf_span("extraction_dialogues"):
+            self._extract_dialogue_texts()
+    
+    @profiled("extraction")
+    def extract_texts_streaming(self, filepath, block_lines=None):
+        """
+        Extraction bloc par bloc d'un fichier lu directement sur le disque
+        
+        Le fichier est découpé aux blocs translate (voir iter_translate_blocks) ;
+        les textes et positions de chaque bloc sont écrits puis libérés, seuls
+        les mappings restent en mémoire. Les fichiers produits sont identiques
+        à ceux de extract_texts().
+        
+        Args:
+            filepath (str): Chemin du fichier .rpy
+            block_lines (int, optional): Taille visée d'un bloc
+                                         (LARGE_FILES["streaming_block_lines"] par défaut)
+        
+        Returns:
+            dict: Résultats de l'extraction avec chemins des fichiers créés
+        """
+        block_lines = block_lines or LARGE_FILES["streaming_block_lines"]
+        self.original_path = filepath
+        self.file_content = []
+        self._reset_extraction_data()
+        
+        start_time = time.time()
+        log_message("INFO", f"Début d'extraction par blocs pour {anonymize_path(filepath)}")
+        
+        writer = None
+        block_count = 0
+        try:
+            with perf_span("extraction", file_name=os.path.basename(filepath),
+                           bytes_processed=os.path.getsize(filepath)):
+                paths = self._prepare_output_paths()
+                writer = _StreamingExtractionWriter(paths)
+                
+                with open(filepath, 'r', encoding='utf-8') as source:
+                    for block in iter_translate_blocks(source, block_lines):
+                        self.file_content = block
+                        self._run_extraction_steps()
+                        
+                        with perf_span("sauvegarde_fichiers"):
+                            writer.write_block(self)
+                        
+                        # Cumuler les compteurs puis libérer les données du bloc
+                        self.extracted_count += len(self.extracted_texts)
+                        self.asterix_count += len(self.asterix_texts)
+                        self.empty_count += len(self.empty_texts)
+                        self._line_offset += len(block)
+                        block_count += 1
+                        for data in (self.position_table, self.extracted_texts,
+                                     self.asterix_texts, self.empty_texts):
+                            data.clear()
+                
+                self.file_content = []
+                
+                with perf_span("sauvegarde_fichiers"):
+                    result = {
+                        'file_base': paths['file_base'],
+                        'glossary_file': None,
+                        'mapping_files': paths['mapping_files'],
+                        'positions_file': paths['positions_file']
+                    }
+                    result.update(writer.finish())
+                    self._write_mapping_files(paths['mapping_files'])
+                    if self.glossary_mapping:
+                        self._write_glossary_file(paths['glossary_file'])
+                        result['glossary_file'] = paths['glossary_file']
+                
+                self.extraction_time = time.time() - start_time
+            
+            log_message("INFO", f"Extraction par blocs réussie en {self.extraction_time:.2f}s: {block_count} blocs, {self._line_offset} lignes, {self.extracted_count} textes, {self.asterix_count} astérisques, {self.empty_count} vides, {len(self.glossary_mapping)} termes de glossaire")
+            return result
+            
+        except Exception as e:
+            if writer is not None:
+                writer.abort()
+            log_message("ERREUR", "Erreur critique pendant l'extraction par blocs", e)
+            raise
+    
     def _apply_glossary_protection(self):
         """Applique la protection du glossaire avec import local"""
         try:
             # Import local pour éviter les imports circulaires
             from .glossary import glossary_manager
             
-            # Appliquer la protection du glossaire
-            protected_lines, glossary_mapping = glossary_manager.protect_glossary_terms(self.file_content)
+            # Appliquer la protection du glossaire (numérotation continue entre les blocs)
+            protected_lines, glossary_mapping = glossary_manager.protect_glossary_terms(
+                self.file_content, counter_start=len(self.glossary_mapping)
+            )
             
             # Mettre à jour le contenu et stocker le mapping
             self.file_content = protected_lines
-            self.glossary_mapping = glossary_mapping
+            self.glossary_mapping.update(glossary_mapping)
             
             if glossary_mapping:
                 log_message("INFO", f"Glossaire appliqué: {len(glossary_mapping)} termes protégés")
@@ -165,13 +304,15 @@ class EnhancedTextExtractor:
         try:
             for line in self.file_content:
                 # Rechercher les balises classiques {}, []
-                for tag in re.findall(r'(\{[^}]+\}|\[[^\]]+\])', line):
+                for tag in _CODE_TAG_REGEX.findall(line):
                     if tag not in self.mapping:
                         self.mapping[tag] = f"({len(self.mapping)+1:02d})"
                 
-                # Appliquer chaque pattern de code spécial
-                for pattern in SPECIAL_CODES:
-                    for match in re.finditer(pattern, line):
+                # Appliquer chaque pattern de code spécial (ligne ignorée si aucun n'est présent)
+                if not _ANY_SPECIAL_CODE_REGEX.search(line):
+                    continue
+                for pattern in _SPECIAL_CODE_REGEXES:
+                    for match in pattern.finditer(line):
                         code = match.group(0)
                         if code not in self.mapping:
                             self.mapping[code] = f"({len(self.mapping)+1:02d})"
@@ -184,7 +325,7 @@ class EnhancedTextExtractor:
     def _build_asterix_mapping(self):
         """Construit le mapping des textes entre astérisques avec protection des codes"""
         try:
-            asterix_counter = 1
+            asterix_counter = len(self.asterix_mapping) + 1
             
             log_message("INFO", "Détection et protection des expressions entre astérisques")
             
@@ -196,7 +337,7 @@ class EnhancedTextExtractor:
                     continue
                     
                 # Rechercher les textes entre astérisques seulement dans les lignes valides
-                asterix_matches = re.findall(r'\*([^*]+)\*', line)
+                asterix_matches = _ASTERIX_REGEX.findall(line)
                 for asterix_text in asterix_matches:
                     full_asterix = f"*{asterix_text}*"
                     
@@ -209,8 +350,9 @@ class EnhancedTextExtractor:
                         self.asterix_texts.append(protected_content + '\n')
                         
                         asterix_counter += 1
-                        log_message("INFO", f"Expression astérisque détectée et protégée: {full_asterix} -> {placeholder}")
+                        log_item("INFO", "Expressions astérisques", f"Expression astérisque détectée et protégée: {full_asterix} -> {placeholder}")
             
+            flush_item_summaries("Expressions astérisques")
             if len(self.asterix_texts) > 0:
                 log_message("INFO", f"Expressions entre astérisques: {len(self.asterix_texts)} détectées avec codes protégés")
 
@@ -237,14 +379,26 @@ class EnhancedTextExtractor:
     def _apply_empty_text_protection(self):
         """Applique la protection complète des guillemets échappés et textes vides (SANS points de suspension)"""
         try:
-            empty_counter = 1
+            empty_counter = len(self.empty_mapping) + 1
             
-            # Variable pour le placeholder des guillemets échappés
-            escape_placeholder = None
+            # Variable pour le placeholder des guillemets échappés (déjà créé si bloc précédent)
+            escape_placeholder = next(
+                (ph for ph, original in self.empty_mapping.items() if original == r'\"'), None
+            )
             
             log_message("INFO", "Protection des codes spéciaux et guillemets échappés")
             
-            # Parcourir chaque ligne pour appliquer la protection dans l'ordre
+            # Motifs vides qui n'ont pas encore de placeholder
+            pending = [pattern for pattern in _EMPTY_PATTERNS if pattern not in self.empty_mapping]
+            
+            def replace(match):
+                body = match.group(1)
+                if body is None:
+                    return escape_placeholder
+                # La guillemet fermante reste dans la ligne (voir _EMPTY_TEXT_REGEX)
+                return '"' + self.empty_mapping['"' + body + '"']
+            
+            # Parcourir chaque ligne : une seule passe de l'expression par ligne
             for i, line in enumerate(self.file_content):
                 # Ignorer les lignes commentées
                 stripped_line = line.strip()
@@ -252,34 +406,28 @@ class EnhancedTextExtractor:
                     stripped_line.lower().startswith('old "')):
                     continue
                 
-                # ✅ CORRECTION : Utiliser PROTECTION_ORDER_NO_ELLIPSIS au lieu de PROTECTION_ORDER
-                for pattern, description in PROTECTION_ORDER_NO_ELLIPSIS:
-                    # Traitement spécial pour les guillemets échappés
-                    if pattern == r'\"':
-                        # Créer le placeholder UNE SEULE FOIS
-                        if escape_placeholder is None:
-                            escape_placeholder = f"(ESC{empty_counter})"
-                            self.empty_mapping[escape_placeholder] = r'\"'
-                            empty_counter += 1
-                            log_message("INFO", f"Placeholder créé pour guillemets échappés: {escape_placeholder}")
-                        
-                        # Remplacer TOUTES les occurrences avec LE MÊME placeholder
-                        while r'\"' in self.file_content[i]:
-                            self.file_content[i] = self.file_content[i].replace(r'\"', escape_placeholder, 1)
-                    
-                    else:
-                        # Traitement normal pour les autres patterns
-                        while pattern in self.file_content[i]:
-                            if pattern not in self.empty_mapping:
-                                placeholder = f"(C{empty_counter})"
-                                self.empty_mapping[pattern] = placeholder
-                                # Stocker le contenu réel pour la reconstruction
-                                content = pattern[1:-1]  # Enlever les guillemets externes
-                                self.empty_texts.append(content + '\n')
-                                empty_counter += 1
-                            
-                            # Remplacer UNE SEULE occurrence à la fois
-                            self.file_content[i] = self.file_content[i].replace(pattern, f'"{self.empty_mapping[pattern]}"', 1)
+                # Créer le placeholder des guillemets échappés UNE SEULE FOIS
+                if escape_placeholder is None:
+                    escape_placeholder = f"(ESC{empty_counter})"
+                    self.empty_mapping[escape_placeholder] = r'\"'
+                    empty_counter += 1
+                    log_message("INFO", f"Placeholder créé pour guillemets échappés: {escape_placeholder}")
+                
+                if '"' not in line:
+                    continue
+                
+                # Nouveaux motifs de la ligne : numérotés dans l'ordre de PROTECTION_ORDER_NO_ELLIPSIS
+                if pending and any(pattern in line for pattern in pending):
+                    found = {'"' + match.group(1) + '"' for match in _EMPTY_TEXT_REGEX.finditer(line)
+                             if match.group(1) is not None}
+                    for pattern in [pattern for pattern in pending if pattern in found]:
+                        self.empty_mapping[pattern] = f"(C{empty_counter})"
+                        # Stocker le contenu réel pour la reconstruction
+                        self.empty_texts.append(pattern[1:-1] + '\n')
+                        empty_counter += 1
+                        pending.remove(pattern)
+                
+                self.file_content[i] = _EMPTY_TEXT_REGEX.sub(replace, line)
             
             protected_count = len(self.empty_texts) + (1 if escape_placeholder else 0)
             log_message("INFO", f"Protection terminée: {protected_count} éléments protégés")
@@ -295,17 +443,14 @@ class EnhancedTextExtractor:
         try:
             extracted_lines = 0
             
+            # Une expression par mapping au lieu d'un str.replace par élément et par ligne
+            codes = MappingReplacer(self.mapping)
+            asterixes = MappingReplacer(self.asterix_mapping)
+            
             for idx, line in enumerate(self.file_content):
-                # Remplacer TOUS les codes spéciaux par des placeholders
-                ph_line = line
-                
-                # D'abord remplacer les balises classiques
-                for tag, ph in self.mapping.items():
-                    ph_line = ph_line.replace(tag, ph)
-                
-                # Puis remplacer les textes entre astérisques par des placeholders
-                for asterix, placeholder in self.asterix_mapping.items():
-                    ph_line = ph_line.replace(asterix, placeholder)
+                # Remplacer TOUS les codes spéciaux par des placeholders :
+                # d'abord les balises classiques, puis les textes entre astérisques
+                ph_line = asterixes.replace(codes.replace(line))
                 
                 stripped = ph_line.strip()
                 
@@ -318,39 +463,19 @@ class EnhancedTextExtractor:
                     stripped.lower().startswith('old "')):
                     continue
                 
-                # Extraire TOUS les contenus entre guillemets ET protéger le suffixe
-                quote_matches = re.findall(r'"([^"]*)"', stripped)
+                # Extraire TOUS les contenus entre guillemets ET le suffixe à protéger
+                quote_matches, suffix = scan_dialogue_quotes(stripped)
                 
                 if quote_matches:
                     # Filtrer les contenus pour ne garder que ceux qui ne sont pas des placeholders vides
                     non_empty_quotes = []
                     for content in quote_matches:
-                        # ✅ CORRECTION : Corriger l'expression régulière
-                        if not re.match(r'^\(C\d+\)$', content.strip()) and not re.match(r'^\(ESC\d+\)$', content.strip()):
-                            if content.strip():  # Ne pas extraire les lignes vides
-                                non_empty_quotes.append(content)
+                        content_stripped = content.strip()
+                        if content_stripped and not _EMPTY_PLACEHOLDER_REGEX.fullmatch(content_stripped):
+                            non_empty_quotes.append(content)
                     
                     if non_empty_quotes:
-                        self.positions.append(idx)
-                        self.line_quote_counts.append(len(non_empty_quotes))
-                        
-                        # Extraire le suffixe après la dernière guillemet fermante
-                        last_quote_pos = -1
-                        in_escape = False
-                        for i, char in enumerate(stripped):
-                            if char == '\\':
-                                in_escape = True
-                                continue
-                            elif char == '"' and not in_escape:
-                                last_quote_pos = i
-                            in_escape = False
-                        
-                        # Extraire tout ce qui suit la dernière guillemet
-                        suffix = ""
-                        if last_quote_pos != -1 and last_quote_pos + 1 < len(stripped):
-                            suffix = stripped[last_quote_pos + 1:]
-                        
-                        self.line_suffixes.append(suffix)
+                        self.position_table.append(self._line_offset + idx, len(non_empty_quotes), suffix)
                         
                         # Ajouter chaque contenu entre guillemets
                         for content in non_empty_quotes:
@@ -364,10 +489,16 @@ class EnhancedTextExtractor:
             log_message("ERREUR", "Erreur lors de l'extraction des textes", e)
             raise
 
-    def _save_extraction_files(self):
-        """Sauvegarde tous les fichiers d'extraction avec la nouvelle structure organisée"""
-        from utils.constants import FOLDERS, ensure_folders_exist
+    def _prepare_output_paths(self):
+        """
+        Crée l'arborescence temporaire du jeu et calcule les chemins de sortie
+        
+        Returns:
+            dict: Chemins des fichiers d'extraction
+        """
+        from utils.constants import ensure_folders_exist
         from utils.logging import extract_game_name
+        from core.workspace import workspace_manager
         
         # S'assurer que les dossiers existent
         ensure_folders_exist()
@@ -375,112 +506,241 @@ class EnhancedTextExtractor:
         file_base = get_file_base_name(self.original_path)
         game_name = extract_game_name(self.original_path)
         
-        result = {
+        # Créer la structure complète du dossier temporaire pour ce jeu
+        workspace_manager.ensure_game_folders(game_name)
+        
+        def artifact(kind):
+            return workspace_manager.get_artifact_path(game_name, file_base, kind)
+        
+        return {
+            'game_name': game_name,
             'file_base': file_base,
-            'main_file': None,
-            'asterix_file': None,
-            'empty_file': None,
-            'glossary_file': None,  # ✅ NOUVEAU
-            'mapping_files': []
+            'mapping_files': [
+                artifact('mapping'),
+                artifact('asterix_mapping'),
+                artifact('empty_mapping'),
+                artifact('glossary_mapping')  # ✅ NOUVEAU
+            ],
+            'positions_file': artifact('positions'),
+            'main_file': artifact('texts'),
+            'asterix_file': artifact('asterix_texts'),
+            'empty_file': artifact('empty_texts'),
+            'glossary_file': artifact('glossary_texts')
         }
+    
+    def _write_mapping_files(self, mapping_files, write_file=None):
+        """Écrit les quatre fichiers de mapping (fichiers_a_ne_pas_traduire)"""
+        write_file = write_file or write_text_file
         
+        # Mapping principal
+        write_file(mapping_files[0], "".join(f"{ph} => {tag}\n" for tag, ph in self.mapping.items()))
+        
+        # Mapping astérisques
+        write_file(mapping_files[1], "".join(
+            f"{placeholder} => {asterix}\n" for asterix, placeholder in self.asterix_mapping.items()))
+        
+        # Mapping textes vides
+        write_file(mapping_files[2], "".join(
+            f"{placeholder} => {empty}\n" for empty, placeholder in self.empty_mapping.items()))
+        
+        # ✅ NOUVEAU : Mapping glossaire
+        write_file(mapping_files[3], "".join(
+            f"{placeholder} => {term_info['original']} => {term_info['translation']}\n"
+            for placeholder, term_info in self.glossary_mapping.items()))
+    
+    def _write_glossary_file(self, glossary_file, write_file=None):
+        """Écrit le fichier des traductions du glossaire (fichiers_a_traduire)"""
+        header = ("# Fichier des termes du glossaire\n"
+                  "# Ces termes seront automatiquement traduits\n"
+                  "# NE PAS MODIFIER ce fichier\n\n")
+        (write_file or write_text_file)(glossary_file, header + "".join(
+            f"{term_info['translation']}\n" for term_info in self.glossary_mapping.values()))
+    
+    def _save_extraction_files(self, write_file=None):
+        """
+        Sauvegarde tous les fichiers d'extraction avec la nouvelle structure organisée
+        
+        Args:
+            write_file (callable, optional): Reçoit (chemin, contenu) de chaque fichier
+                                             au lieu de l'écrire (voir write_text_file)
+        """
+        write_file = write_file or write_text_file
         try:
-            # Créer la structure complète du dossier temporaire pour ce jeu
-            temp_folder = os.path.join(FOLDERS["temp"], game_name)
-            folders_to_create = [
-                temp_folder,
-                os.path.join(temp_folder, "fichiers_a_traduire"),
-                os.path.join(temp_folder, "fichiers_a_ne_pas_traduire"),
-            ]
-            
-            for folder in folders_to_create:
-                os.makedirs(folder, exist_ok=True)
+            paths = self._prepare_output_paths()
+            
+            result = {
+                'file_base': paths['file_base'],
+                'main_file': None,
+                'asterix_file': None,
+                'empty_file': None,
+                'glossary_file': None,  # ✅ NOUVEAU
+                'mapping_files': []
+            }
             
             # Sauvegarder les mappings dans le dossier fichiers_a_ne_pas_traduire
-            mapping_folder = os.path.join(temp_folder, "fichiers_a_ne_pas_traduire")
-            mapping_files = [
-                os.path.join(mapping_folder, f'{file_base}_mapping.txt'),
-                os.path.join(mapping_folder, f'{file_base}_asterix_mapping.txt'),
-                os.path.join(mapping_folder, f'{file_base}_empty_mapping.txt'),
-                os.path.join(mapping_folder, f'{file_base}_glossary_mapping.txt')  # ✅ NOUVEAU
-            ]
-            
-            # Mapping principal
-            with open(mapping_files[0], 'w', encoding='utf-8', newline='') as mf:
-                for tag, ph in self.mapping.items():
-                    mf.write(f"{ph} => {tag}\n")
-            
-            # Mapping astérisques
-            with open(mapping_files[1], 'w', encoding='utf-8', newline='') as amf:
-                for asterix, placeholder in self.asterix_mapping.items():
-                    amf.write(f"{placeholder} => {asterix}\n")
-            
-            # Mapping textes vides
-            with open(mapping_files[2], 'w', encoding='utf-8', newline='') as emf:
-                for empty, placeholder in self.empty_mapping.items():
-                    emf.write(f"{placeholder} => {empty}\n")
-            
-            # ✅ NOUVEAU : Mapping glossaire
-            with open(mapping_files[3], 'w', encoding='utf-8', newline='') as gmf:
-                for placeholder, term_info in self.glossary_mapping.items():
-                    gmf.write(f"{placeholder} => {term_info['original']} => {term_info['translation']}\n")
-            
-            result['mapping_files'] = mapping_files
+            self._write_mapping_files(paths['mapping_files'], write_file)
+            result['mapping_files'] = paths['mapping_files']
             
             # Sauvegarder les positions dans le même dossier
-            position_data = {
-                'positions': self.positions,
-                'quote_counts': self.line_quote_counts,
-                'suffixes': self.line_suffixes
-            }
-            
-            positions_file = os.path.join(mapping_folder, f'{file_base}_positions.json')
-            with open(positions_file, 'w', encoding='utf-8', newline='') as pf:
-                json.dump(position_data, pf, ensure_ascii=False)
-            
-            result['positions_file'] = positions_file
+            write_file(paths['positions_file'], json.dumps(self.position_table.to_dict(), ensure_ascii=False))
+            result['positions_file'] = paths['positions_file']
             
             # Écrire les fichiers de textes dans fichiers_a_traduire
-            translate_folder = os.path.join(temp_folder, "fichiers_a_traduire")
             
             # Fichier principal
-            main_file = os.path.join(translate_folder, f'{file_base}.txt')
-            with open(main_file, 'w', encoding='utf-8', newline='') as vf:
-                vf.writelines(self.extracted_texts)
-            result['main_file'] = main_file
+            write_file(paths['main_file'], "".join(self.extracted_texts))
+            result['main_file'] = paths['main_file']
             
             # Créer fichier astérisques seulement s'il y a du contenu
             if self.asterix_texts:
-                asterix_file = os.path.join(translate_folder, f'{file_base}_asterix.txt')
-                with open(asterix_file, 'w', encoding='utf-8', newline='') as af:
-                    af.writelines(self.asterix_texts)
-                result['asterix_file'] = asterix_file
+                write_file(paths['asterix_file'], "".join(self.asterix_texts))
+                result['asterix_file'] = paths['asterix_file']
             
             # Créer fichier textes vides seulement s'il y a du contenu
             if self.empty_texts:
-                empty_file = os.path.join(translate_folder, f'{file_base}_empty.txt')
-                with open(empty_file, 'w', encoding='utf-8', newline='') as ef:
-                    ef.writelines(self.empty_texts)
-                result['empty_file'] = empty_file
+                write_file(paths['empty_file'], "".join(self.empty_texts))
+                result['empty_file'] = paths['empty_file']
             
             # ✅ NOUVEAU : Créer fichier glossaire seulement s'il y a du contenu
             if self.glossary_mapping:
-                glossary_file = os.path.join(translate_folder, f'{file_base}_glossary.txt')
-                with open(glossary_file, 'w', encoding='utf-8', newline='') as gf:
-                    gf.write("# Fichier des termes du glossaire\n")
-                    gf.write("# Ces termes seront automatiquement traduits\n")
-                    gf.write("# NE PAS MODIFIER ce fichier\n\n")
-                    for placeholder, term_info in self.glossary_mapping.items():
-                        gf.write(f"{term_info['translation']}\n")
-                result['glossary_file'] = glossary_file
-            
-            log_message("INFO", f"Fichiers d'extraction créés dans temporaires/{game_name}/")
+                self._write_glossary_file(paths['glossary_file'], write_file)
+                result['glossary_file'] = paths['glossary_file']
+            
+            log_message("INFO", f"Fichiers d'extraction créés dans temporaires/{paths['game_name']}/")
             return result
             
         except Exception as e:
             log_message("ERREUR", "Erreur lors de la création des fichiers d'extraction", e)
             raise
 
+def write_text_file(path, content):
+    """Écrit un fichier d'extraction (UTF-8, fins de ligne conservées)"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(content)
+
+class _StreamingExtractionWriter:
+    """
+    Écriture incrémentale des fichiers d'extraction (mode streaming)
+    
+    Les textes sont ajoutés aux fichiers à chaque bloc. Les trois listes de
+    positions sont écrites dans des fichiers .part puis assemblées à la fin
+    en un _positions.json identique à celui du mode normal.
+    """
+    
+    POSITION_KEYS = ('positions', 'quote_counts', 'suffixes')
+    
+    def __init__(self, paths):
+        self.paths = paths
+        self._main = open(paths['main_file'], 'w', encoding='utf-8', newline='')
+        self._asterix = None
+        self._empty = None
+        self._parts = {}
+        self._has_items = {}
+        for key in self.POSITION_KEYS:
+            self._parts[key] = open(self._part_path(key), 'w', encoding='utf-8', newline='')
+            self._has_items[key] = False
+    
+    def _part_path(self, key):
+        return f"{self.paths['positions_file']}.{key}.part"
+    
+    def _write_items(self, key, items):
+        """Ajoute des valeurs JSON au fichier .part d'une liste de positions"""
+        if not items:
+            return
+        encoded = ", ".join(json.dumps(item, ensure_ascii=False) for item in items)
+        if self._has_items[key]:
+            self._parts[key].write(", ")
+        self._parts[key].write(encoded)
+        self._has_items[key] = True
+    
+    def write_block(self, extractor):
+        """Écrit les résultats du bloc courant de l'extracteur"""
+        self._main.writelines(extractor.extracted_texts)
+        
+        # Fichiers optionnels créés seulement au premier contenu
+        if extractor.asterix_texts:
+            if self._asterix is None:
+                self._asterix = open(self.paths['asterix_file'], 'w', encoding='utf-8', newline='')
+            self._asterix.writelines(extractor.asterix_texts)
+        
+        if extractor.empty_texts:
+            if self._empty is None:
+                self._empty = open(self.paths['empty_file'], 'w', encoding='utf-8', newline='')
+            self._empty.writelines(extractor.empty_texts)
+        
+        table = extractor.position_table
+        self._write_items('positions', table.positions)
+        self._write_items('quote_counts', table.quote_counts)
+        self._write_items('suffixes', table.suffix_list())
+    
+    def _close_handles(self):
+        for handle in [self._main, self._asterix, self._empty] + list(self._parts.values()):
+            if handle is not None and not handle.closed:
+                handle.close()
+    
+    def _remove_parts(self):
+        for key in self.POSITION_KEYS:
+            try:
+                os.remove(self._part_path(key))
+            except OSError:
+                pass
+    
+    def finish(self):
+        """
+        Ferme les fichiers et assemble le fichier des positions
+        
+        Returns:
+            dict: Chemins des fichiers de textes créés
+        """
+        self._close_handles()
+        
+        with open(self.paths['positions_file'], 'w', encoding='utf-8', newline='') as pf:
+            for index, key in enumerate(self.POSITION_KEYS):
+                pf.write('{' if index == 0 else ', ')
+                pf.write(f'"{key}": [')
+                with open(self._part_path(key), 'r', encoding='utf-8', newline='') as part:
+                    shutil.copyfileobj(part, pf)
+                pf.write(']')
+            pf.write('}')
+        
+        self._remove_parts()
+        return {
+            'main_file': self.paths['main_file'],
+            'asterix_file': self.paths['asterix_file'] if self._asterix is not None else None,
+            'empty_file': self.paths['empty_file'] if self._empty is not None else None
+        }
+    
+    def abort(self):
+        """Ferme les fichiers et supprime les fichiers intermédiaires après une erreur"""
+        self._close_handles()
+        self._remove_parts()
+
+def iter_translate_blocks(lines, block_lines):
+    """
+    Regroupe des lignes en blocs d'environ block_lines lignes
+    
+    Un bloc est coupé au début d'un bloc translate. Le traitement étant ligne
+    par ligne, un bloc est aussi coupé sans attendre au-delà de 4 x block_lines
+    (fichiers sans instruction translate).
+    
+    Args:
+        lines: Itérable de lignes (fichier ouvert, liste...)
+        block_lines (int): Taille visée d'un bloc
+    
+    Yields:
+        list: Lignes du bloc
+    """
+    block = []
+    max_lines = block_lines * 4
+    for line in lines:
+        if block and (len(block) >= max_lines or
+                      (len(block) >= block_lines and line.startswith('translate '))):
+            yield block
+            block = []
+        block.append(line)
+    if block:
+        yield block
+
 # Fonction utilitaire pour compatibilité avec l'ancienne interface
 def extraire_textes_enhanced(file_content, original_path):
     """
@@ -501,4 +761,30 @@ def extraire_textes_enhanced(file_content, original_path):
     # 2) Lancer l'extraction avec glossaire
     extractor = EnhancedTextExtractor()
     extractor.load_file_content(file_content, original_path)
-    return extractor.extract_texts()
\ No newline at end of file
+    return extractor.extract_texts()
+
+def should_stream_extraction(original_path):
+    """Indique si un fichier est assez gros pour l'extraction par blocs"""
+    try:
+        return bool(original_path) and os.path.getsize(original_path) >= LARGE_FILES["streaming_threshold"]
+    except OSError:
+        return False
+
+def extraire_textes_streaming(original_path, block_lines=None):
+    """
+    Extraction par blocs d'un gros fichier, sans charger tout son contenu
+    
+    Args:
+        original_path (str): Chemin du fichier original
+        block_lines (int, optional): Taille visée d'un bloc
+        
+    Returns:
+        tuple: (résultats de l'extraction, extracteur pour les compteurs)
+    """
+    from core.validation import validate_before_extraction, create_safety_backup
+    validate_before_extraction(original_path)
+    create_safety_backup(original_path)
+
+    extractor = EnhancedTextExtractor()
+    result = extractor.extract_texts_streaming(original_path, block_lines)
+    return result, extractor
\ No newline at end of file
@@ -9,17 +9,29 @@ Module de gestion des fichiers et opérations système
 import os
 import sys
 import subprocess
-import glob
+import threading
 from utils.logging import log_message, anonymize_path
 from utils.config import config_manager
 
 class FileManager:
     """Gestionnaire de fichiers pour le Traducteur Ren'Py Pro"""
     
+    # Nombre de fichiers suivants préchargés en arrière-plan en mode dossier
+    PREFETCH_COUNT = 2
+    
     def __init__(self):
         self.opened_files = set()
         self.selected_folder_path = ""
         self.is_folder_mode = False
+        
+        # File de travail du mode dossier (découverte mise en cache)
+        self.work_queue = []
+        self._scanned_dirs = {}
+        
+        # Préchargement : chemin -> {'content', 'mtime', 'size'}
+        self._prefetch_cache = {}
+        self._prefetching = set()
+        self._prefetch_lock = threading.Lock()
     
     def open_single_file(self, initial_dir=None):
         """
@@ -94,8 +106,9 @@ class FileManager:
             self.is_folder_mode = True
             self.opened_files.clear()
             
-            # Chercher les fichiers .rpy
-            rpy_files = glob.glob(os.path.join(folder_path, "*.rpy"))
+            # Découverte récursive des fichiers .rpy (une seule fois, mise en cache)
+            self.refresh_folder(force=True)
+            rpy_files = [entry['path'] for entry in self.work_queue]
             
             if not rpy_files:
                 log_message("WARNING", f"Aucun fichier .rpy trouvé dans {anonymize_path(folder_path)}")
@@ -116,25 +129,68 @@ class FileManager:
                 result['current_file'] = first_file
             
             log_message("INFO", f"Mode dossier activé: {len(rpy_files)} fichiers trouvés dans {anonymize_path(folder_path)}")
+            
+            # Préparer les fichiers suivants pendant le travail sur le premier
+            self.prefetch_next_files()
             return result
             
         except Exception as e:
             log_message("ERREUR", "Erreur lors de l'ouverture du dossier", e)
             raise
     
+    def refresh_folder(self, force=False):
+        """
+        Met à jour la file de travail du mode dossier
+        
+        Le dossier n'est réellement reparcouru que si force=True ou si la date
+        de modification d'un des dossiers parcourus a changé.
+        
+        Args:
+            force (bool): Forcer un nouveau parcours
+            
+        Returns:
+            bool: True si la file a été reconstruite
+        """
+        if not self.selected_folder_path:
+            self.work_queue = []
+            self._scanned_dirs = {}
+            return False
+        
+        if not force and self._scanned_dirs and not self._folder_changed():
+            return False
+        
+        entries, scanned_dirs = scan_rpy_files(self.selected_folder_path)
+        self.work_queue = entries
+        self._scanned_dirs = scanned_dirs
+        project_manager.sync_folder(entries)
+        
+        log_message("INFO", f"Découverte: {len(entries)} fichiers .rpy dans {len(scanned_dirs)} dossier(s) de {anonymize_path(self.selected_folder_path)}")
+        return True
+    
+    def _folder_changed(self):
+        """Vérifie si un des dossiers parcourus a été modifié depuis la découverte"""
+        for directory, mtime in self._scanned_dirs.items():
+            try:
+                if os.stat(directory).st_mtime != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+    
     def get_next_file(self):
         """
         Récupère le prochain fichier dans le mode dossier
         
         Returns:
-            str: Chemin du prochain fichier ou None si terminé
+            dict: Chemin du prochain fichier et nombre restant, ou None si terminé
         """
         if not self.is_folder_mode or not self.selected_folder_path:
             return None
         
-        # Chercher le prochain fichier .rpy non ouvert
-        rpy_files = glob.glob(os.path.join(self.selected_folder_path, "*.rpy"))
-        available_files = [f for f in rpy_files if f not in self.opened_files]
+        # Chercher le prochain fichier .rpy non ouvert dans la file en cache
+        self.refresh_folder()
+        available_files = [entry['path'] for entry in self.work_queue
+                           if entry['path'] not in self.opened_files]
         
         if available_files:
             next_file = available_files[0]
@@ -143,6 +199,8 @@ class FileManager:
             remaining = len(available_files) - 1
             log_message("INFO", f"Fichier suivant ouvert: {anonymize_path(next_file)} ({remaining} restants)")
             
+            self.prefetch_next_files(keep=next_file)
+            
             return {
                 'file': next_file,
                 'remaining': remaining
@@ -160,7 +218,8 @@ class FileManager:
         if not self.is_folder_mode:
             return None
         
-        total_files = len(glob.glob(os.path.join(self.selected_folder_path, "*.rpy")))
+        self.refresh_folder()
+        total_files = len(self.work_queue)
         processed_files = len(self.opened_files)
         remaining_files = total_files - processed_files
         
@@ -168,6 +227,7 @@ class FileManager:
             'total': total_files,
             'processed': processed_files,
             'remaining': remaining_files,
+            'total_size': sum(entry['size'] for entry in self.work_queue),
             'folder_path': self.selected_folder_path
         }
     
@@ -176,19 +236,116 @@ class FileManager:
         self.opened_files.clear()
         self.selected_folder_path = ""
         self.is_folder_mode = False
+        self.work_queue = []
+        self._scanned_dirs = {}
+        with self._prefetch_lock:
+            self._prefetch_cache.clear()
+            self._prefetching.clear()
         log_message("INFO", "Gestionnaire de fichiers réinitialisé")
     
-    def load_file_content(self, filepath):
+    def prefetch_next_files(self, count=None, keep=None):
+        """
+        Précharge et pré-valide en arrière-plan les prochains fichiers du dossier
+        
+        Le contenu lu est conservé pour load_file_content, et la validation
+        (validate_before_extraction) est mise en cache pour l'extraction.
+        
+        Args:
+            count (int, optional): Nombre de fichiers à précharger
+            keep (str, optional): Fichier déjà préchargé à conserver (fichier en cours d'ouverture)
+        """
+        if not self.is_folder_mode or not self.work_queue:
+            return
+        
+        count = self.PREFETCH_COUNT if count is None else count
+        upcoming = [entry for entry in self.work_queue
+                    if entry['path'] not in self.opened_files][:count]
+        upcoming_paths = {entry['path'] for entry in upcoming}
+        if keep:
+            upcoming_paths.add(keep)
+        
+        with self._prefetch_lock:
+            # Oublier les fichiers qui ne sont plus à venir pour borner la mémoire
+            for path in list(self._prefetch_cache):
+                if path not in upcoming_paths:
+                    del self._prefetch_cache[path]
+            
+            to_load = [entry['path'] for entry in upcoming
+                       if entry['path'] not in self._prefetch_cache
+                       and entry['path'] not in self._prefetching]
+            self._prefetching.update(to_load)
+        
+        if to_load:
+            thread = threading.Thread(target=self._prefetch_worker, args=(to_load,),
+                                      name="FilePrefetch", daemon=True)
+            thread.start()
+    
+    def _prefetch_worker(self, paths):
+        """Lit et valide les fichiers demandés (exécuté dans un thread)"""
+        from core.validation import validate_before_extraction
+        
+        for path in paths:
+            try:
+                stats = os.stat(path)
+                with open(path, 'r', encoding='utf-8') as f:
+                    content = f.readlines()
+                
+                with self._prefetch_lock:
+                    if path in self._prefetching:
+                        self._prefetch_cache[path] = {
+                            'content': content,
+                            'mtime': stats.st_mtime,
+                            'size': stats.st_size
+                        }
+                
+                validate_before_extraction(path)
+                log_message("INFO", f"Fichier préchargé: {len(content)} lignes - {anonymize_path(path)}")
+                
+            except Exception as e:
+                log_message("WARNING", f"Préchargement impossible pour {anonymize_path(path)}", e)
+            finally:
+                with self._prefetch_lock:
+                    self._prefetching.discard(path)
+    
+    def _take_prefetched(self, filepath):
+        """Récupère le contenu préchargé d'un fichier s'il est toujours à jour"""
+        with self._prefetch_lock:
+            cached = self._prefetch_cache.pop(filepath, None)
+        
+        if cached is None:
+            return None
+        
+        try:
+            stats = os.stat(filepath)
+        except OSError:
+            return None
+        
+        if stats.st_mtime != cached['mtime'] or stats.st_size != cached['size']:
+            return None
+        return cached['content']
+    
+    def load_file_content(self, filepath, lazy=False):
         """
         Charge le contenu d'un fichier
         
         Args:
             filepath (str): Chemin du fichier
+            lazy (bool): Projeter le fichier en mémoire au lieu de le lire
+                         (lignes décodées à la demande, à fermer avec close())
             
         Returns:
-            list: Lignes du fichier
+            list | MappedTextFile: Lignes du fichier
         """
         try:
+            if lazy:
+                from core.line_buffer import MappedTextFile
+                return MappedTextFile(filepath)
+            
+            content = self._take_prefetched(filepath)
+            if content is not None:
+                log_message("INFO", f"Fichier chargé (préchargé): {len(content)} lignes - {anonymize_path(filepath)}")
+                return content
+            
             with open(filepath, 'r', encoding='utf-8') as f:
                 content = f.readlines()
             
@@ -248,10 +405,35 @@ class FileOpener:
             log_message("WARNING", f"Impossible d'ouvrir {filepath}", e)
 
 class ProjectManager:
-    """Gestionnaire de projets pour le multi-projets"""
+    """Gestionnaire de projets pour le multi-projets (base SQLite par jeu, voir core.project_store)"""
     
     def __init__(self):
-        self.active_projects = {}
+        self._stores = {}
+        self._lock = threading.Lock()
+    
+    def get_store(self, filepath):
+        """
+        Retourne la base du jeu auquel appartient un fichier (ouverte une seule fois)
+        
+        Args:
+            filepath (str): Chemin d'un fichier du jeu
+            
+        Returns:
+            ProjectStore: Base du jeu, ou None si elle est inaccessible
+        """
+        from utils.logging import extract_game_name
+        from core.project_store import ProjectStore
+        
+        game_name = extract_game_name(filepath)
+        with self._lock:
+            store = self._stores.get(game_name)
+            if store is None:
+                try:
+                    store = self._stores[game_name] = ProjectStore(game_name)
+                except Exception as e:
+                    log_message("WARNING", f"Base de projet indisponible pour {game_name}", e)
+                    return None
+            return store
     
     def register_project(self, filepath, project_data):
         """
@@ -262,11 +444,9 @@ class ProjectManager:
             project_data (dict): Données du projet
         """
         project_key = os.path.dirname(filepath)
-        self.active_projects[project_key] = {
-            'main_file': filepath,
-            'data': project_data,
-            'timestamp': os.path.getmtime(filepath)
-        }
+        store = self.get_store(filepath)
+        if store:
+            store.save_project(project_key, filepath, project_data, os.path.getmtime(filepath))
         
         log_message("INFO", f"Projet enregistré: {anonymize_path(project_key)}")
     
@@ -280,103 +460,217 @@ class ProjectManager:
         Returns:
             dict: Informations du projet ou None
         """
-        project_key = os.path.dirname(filepath)
-        return self.active_projects.get(project_key)
+        store = self.get_store(filepath)
+        return store.load_project(os.path.dirname(filepath)) if store else None
     
     def cleanup_old_projects(self, max_age_hours=24):
         """
-        Nettoie les anciens projets de la mémoire
+        Nettoie les anciens projets des bases ouvertes
         
         Args:
             max_age_hours (int): Âge maximum en heures
         """
         import time
-        current_time = time.time()
-        cutoff_time = current_time - (max_age_hours * 3600)
+        cutoff_time = time.time() - (max_age_hours * 3600)
+        
+        with self._lock:
+            stores = list(self._stores.values())
+        removed = sum(store.delete_projects_before(cutoff_time) for store in stores)
+        
+        if removed:
+            log_message("INFO", f"Nettoyage: {removed} anciens projets supprimés")
+    
+    def sync_folder(self, entries):
+        """Enregistre les scripts découverts en mode dossier"""
+        if not entries:
+            return
+        store = self.get_store(entries[0]['path'])
+        if store:
+            try:
+                store.sync_scripts(entries)
+            except Exception as e:
+                log_message("WARNING", "Impossible d'enregistrer les scripts du dossier", e)
+    
+    def record_extraction(self, filepath, extractor, results=None):
+        """
+        Enregistre une extraction réussie (compteurs et temps de l'extracteur)
         
-        to_remove = []
-        for project_key, project_info in self.active_projects.items():
-            if project_info['timestamp'] < cutoff_time:
-                to_remove.append(project_key)
+        Args:
+            filepath (str): Script extrait
+            extractor (EnhancedTextExtractor): Extracteur après extraction
+            results (dict, optional): Résultat de extract_texts()
+        """
+        store = self.get_store(filepath)
+        if not store:
+            return
+        try:
+            counts = {
+                'extracted': extractor.extracted_count,
+                'asterix': extractor.asterix_count,
+                'empty': extractor.empty_count,
+                'glossary': len(extractor.glossary_mapping)
+            }
+            store.record_extraction(filepath, counts, extractor.extraction_time,
+                                    (results or {}).get('main_file'))
+        except Exception as e:
+            log_message("WARNING", "Impossible d'enregistrer l'extraction dans la base de projet", e)
+    
+    def record_rebuild(self, filepath, save_path, reconstruction_time):
+        """Enregistre une reconstruction réussie"""
+        store = self.get_store(filepath)
+        if not store:
+            return
+        try:
+            store.record_rebuild(filepath, save_path, reconstruction_time)
+        except Exception as e:
+            log_message("WARNING", "Impossible d'enregistrer la reconstruction dans la base de projet", e)
+    
+    def get_rebuilt_file_bases(self, game_names):
+        """
+        Noms de base des scripts marqués reconstruits dans la base de chaque jeu
         
-        for project_key in to_remove:
-            del self.active_projects[project_key]
+        Args:
+            game_names (iterable): Jeux de l'espace de travail
+            
+        Returns:
+            dict: Jeu -> ensemble des noms de base (voir get_file_base_name)
+        """
+        from core.extraction_enhanced import get_file_base_name
+        from core.project_store import ProjectStore, STATE_REBUILT, get_store_path
         
-        if to_remove:
-            log_message("INFO", f"Nettoyage: {len(to_remove)} anciens projets supprimés")
+        rebuilt = {}
+        for game_name in game_names:
+            # Pas de base : rien n'a été reconstruit (ne pas en créer une vide)
+            if not os.path.exists(get_store_path(game_name)):
+                continue
+            with self._lock:
+                store = self._stores.get(game_name)
+                if store is None:
+                    try:
+                        store = self._stores[game_name] = ProjectStore(game_name)
+                    except Exception as e:
+                        log_message("WARNING", f"Base de projet indisponible pour {game_name}", e)
+                        continue
+            try:
+                rebuilt[game_name] = {get_file_base_name(row['path'])
+                                      for row in store.files_in_state(STATE_REBUILT)}
+            except Exception as e:
+                log_message("WARNING", f"Impossible de lire les scripts reconstruits de {game_name}", e)
+        return rebuilt
+    
+    def get_game_stats(self, filepath):
+        """
+        Statistiques du jeu d'un fichier (états à jour)
+        
+        Returns:
+            dict: Voir ProjectStore.get_stats, ou None
+        """
+        store = self.get_store(filepath)
+        if not store:
+            return None
+        try:
+            store.refresh_translation_states()
+            return store.get_stats()
+        except Exception as e:
+            log_message("WARNING", "Impossible de lire les statistiques du projet", e)
+            return None
 
 class TempFileManager:
-    """Gestionnaire des fichiers temporaires"""
+    """Gestionnaire des fichiers temporaires (interface de compatibilité sur core.workspace)"""
     
     @staticmethod
-    def list_temp_files(pattern="*_mapping.txt"):
+    def list_temp_files(game_name=None):
         """
-        Liste les fichiers temporaires correspondant au pattern
+        Liste les fichiers de mapping et de positions de l'espace de travail
         
         Args:
-            pattern (str): Pattern de recherche
+            game_name (str, optional): Limiter à un jeu
             
         Returns:
             list: Liste des fichiers temporaires trouvés
         """
+        from core.workspace import workspace_manager, MAPPING_KINDS
         try:
-            temp_files = glob.glob(pattern)
-            temp_files.extend(glob.glob("*_positions.json"))
-            temp_files.extend(glob.glob("*_asterix_mapping.txt"))
-            temp_files.extend(glob.glob("*_empty_mapping.txt"))
-            
-            return list(set(temp_files))  # Supprimer les doublons
-            
+            return workspace_manager.list_artifacts(game_name, MAPPING_KINDS)
         except Exception as e:
             log_message("WARNING", "Erreur lors de la liste des fichiers temporaires", e)
             return []
     
     @staticmethod
-    def cleanup_temp_files(file_base=None):
+    def cleanup_temp_files(file_base=None, dry_run=False):
         """
         Nettoie les fichiers temporaires
         
         Args:
-            file_base (str, optional): Base spécifique à nettoyer
+            file_base (str, optional): Script dont supprimer les mappings (dans tous les jeux).
+                                       Sans argument, évince tous les fichiers (à traduire et
+                                       mappings) des scripts reconstruits ou périmés (voir
+                                       WorkspaceManager.evict). Action explicite, à confirmer
+                                       par l'utilisateur.
+            dry_run (bool): Éviction : calculer le bilan sans rien supprimer
+            
+        Returns:
+            list | dict: Fichiers supprimés, ou bilan de l'éviction
         """
+        from core.workspace import workspace_manager
         try:
             if file_base:
-                # Nettoyer pour un projet spécifique
-                patterns = [
-                    f"{file_base}_mapping.txt",
-                    f"{file_base}_positions.json", 
-                    f"{file_base}_asterix_mapping.txt",
-                    f"{file_base}_empty_mapping.txt"
-                ]
-            else:
-                # Nettoyer tous les fichiers temporaires
-                patterns = [
-                    "*_mapping.txt",
-                    "*_positions.json",
-                    "*_asterix_mapping.txt", 
-                    "*_empty_mapping.txt"
-                ]
-            
-            cleaned_files = []
-            for pattern in patterns:
-                files = glob.glob(pattern)
-                for file in files:
-                    try:
-                        os.remove(file)
-                        cleaned_files.append(file)
-                    except:
-                        pass
-            
-            if cleaned_files:
-                log_message("INFO", f"Fichiers temporaires nettoyés: {len(cleaned_files)}")
+                cleaned_files = workspace_manager.cleanup(file_base=file_base)
+                if cleaned_files:
+                    log_message("INFO", f"Fichiers temporaires nettoyés: {len(cleaned_files)}")
+                return cleaned_files
             
-            return cleaned_files
+            rebuilt_bases = project_manager.get_rebuilt_file_bases(workspace_manager.list_games())
+            return workspace_manager.evict(rebuilt_bases, dry_run=dry_run)
             
         except Exception as e:
             log_message("WARNING", "Erreur lors du nettoyage des fichiers temporaires", e)
             return []
 
 # Utilitaires
+def scan_rpy_files(folder_path):
+    """
+    Parcourt récursivement un dossier (ex: game/tl/<langue>) avec os.scandir
+    
+    Les fichiers *_translated.rpy produits par la reconstruction sont ignorés.
+    
+    Args:
+        folder_path (str): Dossier racine
+        
+    Returns:
+        tuple: (liste triée des fichiers {'path', 'rel_path', 'size', 'mtime'},
+                dict dossier -> date de modification pour détecter les changements)
+    """
+    entries = []
+    scanned_dirs = {}
+    pending = [folder_path]
+    
+    while pending:
+        directory = pending.pop()
+        try:
+            scanned_dirs[directory] = os.stat(directory).st_mtime
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif (entry.is_file() and entry.name.lower().endswith('.rpy')
+                              and not entry.name.lower().endswith('_translated.rpy')):
+                            stats = entry.stat()
+                            entries.append({
+                                'path': entry.path,
+                                'rel_path': os.path.relpath(entry.path, folder_path),
+                                'size': stats.st_size,
+                                'mtime': stats.st_mtime
+                            })
+                    except OSError:
+                        continue
+        except OSError as e:
+            log_message("WARNING", f"Impossible de parcourir {anonymize_path(directory)}", e)
+    
+    entries.sort(key=lambda entry: entry['rel_path'].lower())
+    return entries, scanned_dirs
+
 def ensure_directory_exists(directory):
     """
     S'assure qu'un dossier existe, le crée sinon
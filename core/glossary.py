@@ -8,10 +8,127 @@ Système de gestion du glossaire pour la traduction automatique
 
 import os
 import json
-import re
 from collections import OrderedDict
-from utils.constants import FOLDERS
-from utils.logging import log_message
+from utils.constants import FOLDERS, REGEX_PATTERNS, GLOSSARY_SEARCH
+from utils.logging import log_message, log_item, flush_item_summaries
+from core.line_buffer import LineOverlay
+
+class GlossarySearchIndex:
+    """
+    Index des n-grammes du glossaire pour la recherche de sous-chaîne
+    
+    Chaque n-gramme (GLOSSARY_SEARCH["ngram_size"] caractères, en minuscules)
+    d'un original ou d'une traduction pointe vers les entrées qui le
+    contiennent. Une recherche ne vérifie que les entrées qui ont tous les
+    n-grammes du terme cherché ; un terme plus court qu'un n-gramme (ou trop
+    fréquent) parcourt les textes déjà mis en minuscules. Pendant la saisie,
+    un terme qui prolonge le précédent ne filtre que les résultats précédents.
+    """
+    
+    def __init__(self, ngram_size=None):
+        self.ngram_size = ngram_size or GLOSSARY_SEARCH["ngram_size"]
+        self._texts = {}    # Original -> (original, traduction) en minuscules
+        self._grams = {}    # N-gramme -> originaux qui le contiennent
+        self._entries = {}  # Glossaire indexé (ordre des résultats)
+        self._ranks = None  # Original -> rang dans le glossaire (construit à la demande)
+        self._last_search = None  # (terme, résultats) de la dernière recherche
+    
+    def __len__(self):
+        return len(self._texts)
+    
+    @property
+    def entries(self):
+        """Glossaire indexé"""
+        return self._entries
+    
+    @entries.setter
+    def entries(self, entries):
+        # Le glossaire est retrié après chaque modification : nouvel ordre des résultats
+        self._entries = entries
+        self._ranks = None
+        self._last_search = None
+    
+    def _ngrams(self, text):
+        size = self.ngram_size
+        return {text[start:start + size] for start in range(len(text) - size + 1)}
+    
+    def add(self, original, translation):
+        """Indexe une entrée (remplace l'entrée de même original)"""
+        self.remove(original)
+        texts = (original.lower(), translation.lower())
+        self._texts[original] = texts
+        for gram in self._ngrams(texts[0]) | self._ngrams(texts[1]):
+            self._grams.setdefault(gram, set()).add(original)
+        self._ranks = None
+        self._last_search = None
+    
+    def remove(self, original):
+        """Retire une entrée de l'index"""
+        texts = self._texts.pop(original, None)
+        if texts is None:
+            return
+        for gram in self._ngrams(texts[0]) | self._ngrams(texts[1]):
+            owners = self._grams.get(gram)
+            if owners is not None:
+                owners.discard(original)
+                if not owners:
+                    del self._grams[gram]
+        self._ranks = None
+        self._last_search = None
+    
+    def rebuild(self, entries):
+        """Indexe tout le glossaire"""
+        self._texts.clear()
+        self._grams.clear()
+        for original, translation in entries.items():
+            self.add(original, translation)
+        self.entries = entries
+    
+    def search(self, term):
+        """
+        Cherche un texte dans les originaux et les traductions
+        
+        Args:
+            term (str): Texte cherché (sans distinction de casse)
+        
+        Returns:
+            list: Originaux des entrées trouvées, dans l'ordre du glossaire
+        """
+        term = term.lower()
+        
+        if self._last_search is not None and self._last_search[0] in term:
+            # Le terme contient le précédent : ses résultats contiennent les nouveaux
+            matches = self._filter(term, self._last_search[1])
+        elif len(term) < self.ngram_size:
+            matches = self._filter(term, self._entries)
+        else:
+            matches = self._search_ngrams(term)
+        
+        self._last_search = (term, matches)
+        return matches
+    
+    def _filter(self, term, originals):
+        """Originaux (dans l'ordre donné) dont l'un des textes contient le terme"""
+        texts = self._texts
+        return [original for original in originals
+                if term in texts[original][0] or term in texts[original][1]]
+    
+    def _search_ngrams(self, term):
+        owner_sets = sorted((self._grams.get(gram, ()) for gram in self._ngrams(term)), key=len)
+        if not owner_sets[0]:
+            return []
+        # N-grammes fréquents : parcourir dans l'ordre coûte moins que trier
+        if len(owner_sets[0]) * 4 > len(self._texts):
+            return self._filter(term, self._entries)
+        
+        # Intersection en partant de l'ensemble le plus petit
+        candidates = set(owner_sets[0]).intersection(*owner_sets[1:])
+        matches = self._filter(term, candidates)
+        
+        if self._ranks is None:
+            self._ranks = {original: rank for rank, original in enumerate(self._entries)}
+        matches.sort(key=self._ranks.__getitem__)
+        return matches
 
 class GlossaryManager:
     """Gestionnaire principal du glossaire"""
@@ -21,6 +138,7 @@ class GlossaryManager:
         self.glossary = OrderedDict()
         self.temp_placeholders = {}
         self.placeholder_counter = 0
+        self._search_index = GlossarySearchIndex()
         self.load_glossary()
     
     def load_glossary(self):
@@ -31,6 +149,7 @@ class GlossaryManager:
                     data = json.load(f)
                     # Trier par longueur décroissante pour traiter les termes les plus longs en premier
                     self.glossary = OrderedDict(sorted(data.items(), key=lambda x: len(x[0]), reverse=True))
+                self._search_index.rebuild(self.glossary)
                 log_message("INFO", f"Glossaire chargé: {len(self.glossary)} entrées")
             else:
                 self.glossary = OrderedDict()
@@ -73,6 +192,8 @@ class GlossaryManager:
             
             # Retrier par longueur
             self.glossary = OrderedDict(sorted(self.glossary.items(), key=lambda x: len(x[0]), reverse=True))
+            self._search_index.add(original, translation)
+            self._search_index.entries = self.glossary
             
             return self.save_glossary()
             
@@ -85,6 +206,7 @@ class GlossaryManager:
         try:
             if original in self.glossary:
                 translation = self.glossary.pop(original)
+                self._search_index.remove(original)
                 log_message("INFO", f"Entrée supprimée: '{original}' -> '{translation}'")
                 return self.save_glossary()
             return False
@@ -97,17 +219,14 @@ class GlossaryManager:
         return dict(self.glossary)
     
     def search_entries(self, search_term):
-        """Recherche des entrées dans le glossaire"""
+        """Recherche des entrées dans le glossaire (original ou traduction, sans casse)"""
         try:
-            search_term = search_term.lower()
-            results = []
-            
-            for original, translation in self.glossary.items():
-                if (search_term in original.lower() or 
-                    search_term in translation.lower()):
-                    results.append((original, translation))
+            index = self._search_index
+            if index.entries is not self.glossary or len(index) != len(self.glossary):
+                # Glossaire remplacé sans passer par le gestionnaire : réindexer
+                index.rebuild(self.glossary)
             
-            return results
+            return [(original, self.glossary[original]) for original in index.search(search_term)]
         except Exception as e:
             log_message("ERREUR", f"Erreur lors de la recherche dans le glossaire", e)
             return []
@@ -121,15 +240,27 @@ class GlossaryManager:
             'shortest_term': min(self.glossary.keys(), key=len) if self.glossary else ""
         }
     
-    def protect_glossary_terms(self, file_content):
-        """Protège les termes du glossaire dans le contenu avec des placeholders"""
+    def protect_glossary_terms(self, file_content, counter_start=0):
+        """
+        Protège les termes du glossaire dans le contenu avec des placeholders
+        
+        Args:
+            file_content (list | LineOverlay): Lignes à protéger
+            counter_start (int): Dernier numéro de placeholder déjà attribué
+                                 (pour traiter un fichier bloc par bloc)
+        
+        Returns:
+            tuple: (LineOverlay des lignes protégées, mapping des placeholders)
+        """
         try:
             if not self.glossary:
                 return file_content, {}
             
-            protected_content = file_content[:]
+            # Seules les lignes contenant un terme sont copiées
+            protected_content = LineOverlay(file_content)
             glossary_mapping = {}
-            self.placeholder_counter = 0
+            # Compteur local : plusieurs fichiers peuvent être protégés en parallèle (lots)
+            placeholder_counter = counter_start
             
             # Traiter chaque ligne
             for i, line in enumerate(protected_content):
@@ -141,8 +272,8 @@ class GlossaryManager:
                 for original, translation in self.glossary.items():
                     if original in line:
                         # Créer un placeholder unique
-                        self.placeholder_counter += 1
-                        placeholder = f"(GLOSS{self.placeholder_counter:03d})"
+                        placeholder_counter += 1
+                        placeholder = f"(GLOSS{placeholder_counter:03d})"
                         
                         # Stocker le mapping
                         glossary_mapping[placeholder] = {
@@ -153,8 +284,10 @@ class GlossaryManager:
                         # Remplacer dans la ligne
                         protected_content[i] = protected_content[i].replace(original, placeholder)
                         
-                        log_message("INFO", f"Terme protégé: '{original}' -> {placeholder}")
+                        log_item("INFO", "Termes protégés", f"Terme protégé: '{original}' -> {placeholder}")
             
+            flush_item_summaries("Termes protégés")
+            self.placeholder_counter = placeholder_counter
             return protected_content, glossary_mapping
             
         except Exception as e:
@@ -184,7 +317,7 @@ class GlossaryManager:
                     issues.append(f"Terme très court: '{original}' (peut causer des remplacements indésirables)")
                 
                 # Vérifier les caractères spéciaux
-                if re.search(r'[{}[\]()"]', original):
+                if REGEX_PATTERNS["glossary_special"].search(original):
                     issues.append(f"Terme contenant des caractères spéciaux: '{original}'")
         
         except Exception as e:
@@ -240,6 +373,7 @@ class GlossaryManager:
             
             # Retrier par longueur
             self.glossary = OrderedDict(sorted(self.glossary.items(), key=lambda x: len(x[0]), reverse=True))
+            self._search_index.rebuild(self.glossary)
             
             success = self.save_glossary()
             if success:
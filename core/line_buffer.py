@@ -0,0 +1,341 @@
+# core/line_buffer.py
+# Line Buffer Module
+# Created for Traducteur Ren'Py Pro v2.4.4
+
+"""
+Accès aux lignes des gros scripts sans les charger en mémoire
+
+Le fichier est projeté en mémoire (mmap), l'encodage et le BOM sont détectés
+une seule fois depuis les octets, puis chaque ligne est décodée à la demande
+grâce à un index des positions de début de ligne.
+
+Les étapes qui réécrivent des lignes travaillent sur une LineOverlay : la
+séquence d'origine reste partagée et seules les lignes modifiées sont
+stockées.
+
+L'écriture passe par atomic_write : un script n'est jamais laissé tronqué.
+"""
+
+import codecs
+import contextlib
+import itertools
+import mmap
+import os
+import shutil
+from array import array
+from utils.constants import LARGE_FILES
+from utils.logging import log_message, anonymize_path
+
+# Taille des blocs lus pour la détection d'encodage
+_DETECTION_CHUNK = 1024 * 1024
+
+# Création exclusive des fichiers temporaires : le mode 0o666 passé à os.open
+# est filtré par le umask du processus (comme un open classique)
+_TEMP_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_EXCL
+               | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_NOINHERIT', 0))
+
+# BOM reconnus : (préfixe, encodage, taille du préfixe à ignorer)
+_BOMS = [
+    (codecs.BOM_UTF8, 'utf-8', len(codecs.BOM_UTF8)),
+    (codecs.BOM_UTF16_LE, 'utf-16-le', len(codecs.BOM_UTF16_LE)),
+    (codecs.BOM_UTF16_BE, 'utf-16-be', len(codecs.BOM_UTF16_BE)),
+]
+
+def detect_encoding(data):
+    """
+    Détecte l'encodage d'un contenu binaire (bytes ou mmap)
+    
+    Args:
+        data: Contenu binaire indexable
+    
+    Returns:
+        tuple: (encodage, taille du BOM à ignorer)
+    """
+    head = bytes(data[:4])
+    for bom, encoding, bom_size in _BOMS:
+        if head.startswith(bom):
+            return encoding, bom_size
+    
+    # Pas de BOM : vérifier que tout le contenu est de l'UTF-8 valide, bloc par bloc
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        for start in range(0, len(data), _DETECTION_CHUNK):
+            decoder.decode(data[start:start + _DETECTION_CHUNK])
+        decoder.decode(b'', final=True)
+        return 'utf-8', 0
+    except UnicodeDecodeError:
+        # Même repli que FileValidator.is_renpy_file
+        return 'latin-1', 0
+
+class MappedTextFile:
+    """
+    Séquence de lignes en lecture seule adossée à un fichier projeté en mémoire
+    
+    Se comporte comme la liste renvoyée par readlines() (len, index, slices,
+    itération) : les fins de ligne \\r\\n sont rendues comme \\n.
+    """
+    
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.encoding = 'utf-8'
+        self.size = 0
+        self._file = None
+        self._map = None
+        self._data_start = 0
+        self._offsets = array('Q')
+        self._decoded = None  # Repli UTF-16 : lignes décodées en mémoire
+        self._open()
+    
+    def _open(self):
+        """Projette le fichier en mémoire et construit l'index des lignes"""
+        self.size = os.path.getsize(self.filepath)
+        self._file = open(self.filepath, 'rb')
+        
+        if self.size == 0:
+            return
+        
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.encoding, self._data_start = detect_encoding(self._map)
+        
+        if self.encoding.startswith('utf-16'):
+            # Les sauts de ligne ne sont pas des octets isolés en UTF-16
+            text = self._map[self._data_start:].decode(self.encoding)
+            self._decoded = text.replace('\r\n', '\n').splitlines(keepends=True)
+            self.close()
+            return
+        
+        self._build_index()
+        log_message("INFO", f"Fichier projeté en mémoire: {len(self)} lignes ({self.encoding}) - {anonymize_path(self.filepath)}")
+    
+    def _build_index(self):
+        """Enregistre la position de début de chaque ligne"""
+        mapped = self._map
+        offsets = self._offsets
+        end = len(mapped)
+        position = self._data_start
+        
+        while position < end:
+            offsets.append(position)
+            newline = mapped.find(b'\n', position)
+            if newline == -1:
+                break
+            position = newline + 1
+    
+    def _line_bounds(self, index):
+        """Retourne les positions (début, fin) d'une ligne"""
+        start = self._offsets[index]
+        if index + 1 < len(self._offsets):
+            end = self._offsets[index + 1]
+        else:
+            end = len(self._map)
+        return start, end
+    
+    def _decode_line(self, index):
+        """Décode une seule ligne depuis la projection"""
+        start, end = self._line_bounds(index)
+        raw = self._map[start:end]
+        if raw.endswith(b'\r\n'):
+            raw = raw[:-2] + b'\n'
+        return raw.decode(self.encoding)
+    
+    def __len__(self):
+        if self._decoded is not None:
+            return len(self._decoded)
+        return len(self._offsets)
+    
+    def __getitem__(self, index):
+        if self._decoded is not None:
+            return self._decoded[index]
+        
+        if isinstance(index, slice):
+            return [self._decode_line(i) for i in range(*index.indices(len(self)))]
+        
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index de ligne hors limites")
+        return self._decode_line(index)
+    
+    def __iter__(self):
+        if self._decoded is not None:
+            yield from self._decoded
+            return
+        for index in range(len(self)):
+            yield self._decode_line(index)
+    
+    def line_offset(self, index):
+        """Position en octets du début d'une ligne dans le fichier"""
+        if self._decoded is not None:
+            raise ValueError("Positions en octets indisponibles pour un fichier UTF-16")
+        return self._offsets[index]
+    
+    def copy(self):
+        """Copie décodée complète (équivalent de readlines())"""
+        return list(self)
+    
+    def close(self):
+        """Libère la projection et le fichier"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+class LineOverlay:
+    """
+    Vue modifiable d'une séquence de lignes partagée (copie à l'écriture)
+    
+    La séquence de base (liste de readlines() ou MappedTextFile) n'est jamais
+    modifiée : une ligne réécrite est rangée dans un dictionnaire de
+    modifications (index -> ligne). Les protections (glossaire, textes vides)
+    ne touchent qu'une partie des lignes ; chaque étape ne garde donc que ses
+    lignes modifiées au lieu d'une copie complète du script.
+    """
+    
+    __slots__ = ('_base', '_patches')
+    
+    def __init__(self, base):
+        """
+        Args:
+            base (list | MappedTextFile | LineOverlay): Lignes partagées ; une
+                vue reçue en base partage la même base et copie ses modifications
+        """
+        if isinstance(base, LineOverlay):
+            self._base = base._base
+            self._patches = dict(base._patches)
+        else:
+            self._base = base
+            self._patches = {}
+    
+    @property
+    def base(self):
+        """Séquence de lignes partagée"""
+        return self._base
+    
+    @property
+    def patches(self):
+        """Lignes modifiées (index -> ligne)"""
+        return self._patches
+    
+    def _check_index(self, index):
+        if index < 0:
+            index += len(self._base)
+        if not 0 <= index < len(self._base):
+            raise IndexError("index de ligne hors limites")
+        return index
+    
+    def __len__(self):
+        return len(self._base)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        
+        index = self._check_index(index)
+        line = self._patches.get(index)
+        return self._base[index] if line is None else line
+    
+    def __setitem__(self, index, line):
+        index = self._check_index(index)
+        if line == self._base[index]:
+            # Retour à la ligne d'origine : plus rien à conserver
+            self._patches.pop(index, None)
+        else:
+            self._patches[index] = line
+    
+    def __iter__(self):
+        # Recherche à chaque ligne : une ligne réécrite pendant le parcours est vue
+        return map(self._patches.get, itertools.count(), self._base)
+    
+    def __repr__(self):
+        return f"LineOverlay({len(self)} lignes, {len(self._patches)} modifiées)"
+    
+    def copy(self):
+        """Nouvelle vue sur la même base (les modifications sont copiées, pas les lignes)"""
+        return LineOverlay(self)
+    
+    def tolist(self):
+        """Lignes complètes dans une liste (équivalent de readlines())"""
+        return list(self)
+
+@contextlib.contextmanager
+def open_script_lines(filepath, lazy=None):
+    """
+    Ouvre un script sous forme de séquence de lignes
+    
+    Les fichiers au-delà de LARGE_FILES["mmap_threshold"] (ou si lazy=True)
+    sont projetés en mémoire ; les autres sont lus avec readlines().
+    
+    Args:
+        filepath (str): Chemin du fichier
+        lazy (bool, optional): Forcer (True) ou interdire (False) la projection
+    
+    Yields:
+        list | MappedTextFile: Lignes du fichier
+    """
+    if lazy is None:
+        lazy = os.path.getsize(filepath) >= LARGE_FILES["mmap_threshold"]
+    
+    if not lazy:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            yield f.readlines()
+        return
+    
+    mapped = MappedTextFile(filepath)
+    try:
+        yield mapped
+    finally:
+        mapped.close()
+
+def _create_temp_file(directory, name):
+    """Crée un fichier temporaire au nom unique dans directory : (descripteur, chemin)"""
+    for _ in range(100):
+        temp_path = os.path.join(directory, f".{name}.{os.urandom(4).hex()}.tmp")
+        try:
+            return os.open(temp_path, _TEMP_FLAGS, 0o666), temp_path
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"Aucun nom de fichier temporaire disponible dans {directory}")
+
+@contextlib.contextmanager
+def atomic_write(filepath, encoding='utf-8'):
+    """
+    Écrit un fichier texte de façon atomique
+    
+    Le contenu est écrit dans un fichier temporaire du même dossier, synchronisé
+    sur le disque (fsync) puis substitué à la cible avec os.replace. En cas
+    d'erreur, la cible reste intacte et le fichier temporaire est supprimé.
+    
+    Args:
+        filepath (str): Fichier cible
+        encoding (str): Encodage d'écriture
+    
+    Yields:
+        file: Fichier temporaire ouvert en écriture (newline='')
+    """
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, temp_path = _create_temp_file(directory, os.path.basename(filepath))
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding, newline='') as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        
+        # Conserver les permissions du fichier remplacé (sinon : 0o666 moins le umask)
+        if os.path.exists(filepath):
+            shutil.copymode(filepath, temp_path)
+        os.replace(temp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,136 @@
+# core/positions.py
+# Position Table Module
+# Created for Traducteur Ren'Py Pro v2.4.4
+
+"""
+Table compacte des lignes extraites (fichier _positions.json)
+
+Pour chaque ligne extraite : index de la ligne, nombre de textes entre
+guillemets et suffixe après la dernière guillemet. Les nombres sont rangés
+dans des array('I') et chaque suffixe distinct (presque toujours vide ou
+"with dissolve"...) n'est stocké qu'une fois : quelques octets par ligne
+au lieu de trois objets Python.
+"""
+
+from array import array
+
+class PositionEntry:
+    """Ligne extraite : index dans le fichier, nombre de textes et suffixe"""
+    
+    __slots__ = ('position', 'quote_count', 'suffix')
+    
+    def __init__(self, position, quote_count, suffix=""):
+        self.position = position
+        self.quote_count = quote_count
+        self.suffix = suffix
+    
+    def __repr__(self):
+        return f"PositionEntry({self.position}, {self.quote_count}, {self.suffix!r})"
+
+class PositionTable:
+    """Colonnes des lignes extraites, dans l'ordre du fichier"""
+    
+    def __init__(self):
+        self.positions = array('I')
+        self.quote_counts = array('I')
+        self._suffix_ids = array('I')
+        self._suffixes = [""]          # Suffixes distincts
+        self._suffix_index = {"": 0}   # Suffixe -> rang dans _suffixes
+        self._line_index = None        # Index de ligne -> rang (construit à la demande)
+    
+    def __len__(self):
+        return len(self.positions)
+    
+    def __getitem__(self, index):
+        return PositionEntry(self.positions[index], self.quote_counts[index],
+                             self._suffixes[self._suffix_ids[index]])
+    
+    def __iter__(self):
+        suffixes = self._suffixes
+        for position, quote_count, suffix_id in zip(self.positions, self.quote_counts, self._suffix_ids):
+            yield PositionEntry(position, quote_count, suffixes[suffix_id])
+    
+    def _suffix_id(self, suffix):
+        suffix_id = self._suffix_index.get(suffix)
+        if suffix_id is None:
+            suffix_id = self._suffix_index[suffix] = len(self._suffixes)
+            self._suffixes.append(suffix)
+        return suffix_id
+    
+    def append(self, position, quote_count, suffix=""):
+        """Ajoute une ligne extraite"""
+        self.positions.append(position)
+        self.quote_counts.append(quote_count)
+        self._suffix_ids.append(self._suffix_id(suffix))
+        self._line_index = None
+    
+    def extend(self, other, convert_suffix=None):
+        """
+        Ajoute les lignes d'une autre table
+        
+        Args:
+            other (PositionTable): Table à ajouter (positions déjà décalées)
+            convert_suffix (callable, optional): Transformation des suffixes (renumérotation)
+        """
+        ids = array('I', (self._suffix_id(convert_suffix(suffix) if convert_suffix else suffix)
+                          for suffix in other._suffixes))
+        self.positions.extend(other.positions)
+        self.quote_counts.extend(other.quote_counts)
+        self._suffix_ids.extend(ids[suffix_id] for suffix_id in other._suffix_ids)
+        self._line_index = None
+    
+    def clear(self):
+        """Vide la table"""
+        del self.positions[:]
+        del self.quote_counts[:]
+        del self._suffix_ids[:]
+        self._suffixes = [""]
+        self._suffix_index = {"": 0}
+        self._line_index = None
+    
+    def suffix_list(self):
+        """Suffixes ligne par ligne (liste du fichier _positions.json)"""
+        suffixes = self._suffixes
+        return [suffixes[suffix_id] for suffix_id in self._suffix_ids]
+    
+    def find_line(self, line_index):
+        """
+        Rang de la ligne extraite à l'index donné du fichier
+        
+        Returns:
+            int: Rang dans la table, ou None si la ligne n'a pas été extraite
+        """
+        if self._line_index is None:
+            self._line_index = {}
+            for rank, position in enumerate(self.positions):
+                self._line_index.setdefault(position, rank)
+        return self._line_index.get(line_index)
+    
+    def to_dict(self):
+        """Contenu du fichier _positions.json"""
+        return {
+            'positions': self.positions.tolist(),
+            'quote_counts': self.quote_counts.tolist(),
+            'suffixes': self.suffix_list()
+        }
+    
+    @classmethod
+    def from_data(cls, data):
+        """
+        Table lue depuis le contenu d'un fichier _positions.json
+        
+        Args:
+            data (dict | list): Format actuel, ou ancien format (liste des positions seule)
+        """
+        table = cls()
+        if isinstance(data, list):
+            positions, quote_counts, suffixes = data, [1] * len(data), [""] * len(data)
+        else:
+            positions = data['positions']
+            quote_counts = data['quote_counts']
+            suffixes = data.get('suffixes', [""] * len(positions))
+        
+        table.positions = array('I', positions)
+        table.quote_counts = array('I', quote_counts)
+        table._suffix_ids = array('I', (table._suffix_id(suffix) for suffix in suffixes))
+        return table
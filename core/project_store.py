@@ -0,0 +1,297 @@
+# core/project_store.py
+# Project Store Module
+# Created for Traducteur Ren'Py Pro v2.4.4
+
+"""
+Base de projet persistante (SQLite), une par jeu
+
+Chaque script du jeu y est enregistré avec l'empreinte de son contenu, son
+état (découvert, extrait, traduit, reconstruit), ses compteurs et ses temps.
+Les lots, reprises et statistiques de l'interface lisent cette base au lieu
+de reparcourir les dossiers.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from utils.constants import FILE_NAMES
+from utils.logging import log_message, anonymize_path
+
+# États successifs d'un script
+STATE_DISCOVERED = 'discovered'
+STATE_EXTRACTED = 'extracted'
+STATE_TRANSLATED = 'translated'
+STATE_REBUILT = 'rebuilt'
+
+# Taille des blocs lus pour le calcul des empreintes
+_HASH_CHUNK = 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scripts (
+    path TEXT PRIMARY KEY,
+    rel_path TEXT,
+    size INTEGER,
+    mtime REAL,
+    content_hash TEXT,
+    state TEXT NOT NULL DEFAULT 'discovered',
+    extracted_count INTEGER NOT NULL DEFAULT 0,
+    asterix_count INTEGER NOT NULL DEFAULT 0,
+    empty_count INTEGER NOT NULL DEFAULT 0,
+    glossary_count INTEGER NOT NULL DEFAULT 0,
+    extraction_time REAL,
+    reconstruction_time REAL,
+    main_file TEXT,
+    save_path TEXT,
+    rebuilt_hash TEXT,
+    extracted_at REAL,
+    translated_at REAL,
+    rebuilt_at REAL,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_scripts_state ON scripts(state);
+CREATE INDEX IF NOT EXISTS idx_scripts_hash ON scripts(content_hash);
+CREATE TABLE IF NOT EXISTS projects (
+    project_key TEXT PRIMARY KEY,
+    main_file TEXT,
+    data TEXT,
+    timestamp REAL
+);
+CREATE INDEX IF NOT EXISTS idx_projects_timestamp ON projects(timestamp);
+"""
+
+def compute_file_hash(filepath):
+    """
+    Calcule l'empreinte SHA-256 du contenu d'un fichier (lecture par blocs)
+    
+    Args:
+        filepath (str): Chemin du fichier
+    
+    Returns:
+        str: Empreinte hexadécimale, ou None si le fichier est illisible
+    """
+    try:
+        digest = hashlib.sha256()
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    except OSError as e:
+        log_message("WARNING", f"Empreinte impossible pour {anonymize_path(filepath)}", e)
+        return None
+
+def get_store_path(game_name):
+    """Chemin de la base SQLite d'un jeu"""
+    safe_name = "".join(c if c.isalnum() or c in "-_." else "_" for c in game_name)
+    return os.path.join(FILE_NAMES["projects_folder"], f"{safe_name or 'projet'}.db")
+
+class ProjectStore:
+    """Base SQLite des scripts d'un jeu"""
+    
+    def __init__(self, game_name, db_path=None):
+        self.game_name = game_name
+        self.db_path = db_path or get_store_path(game_name)
+        self._lock = threading.Lock()
+        
+        folder = os.path.dirname(self.db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+    
+    def close(self):
+        """Ferme la connexion"""
+        with self._lock:
+            self._conn.close()
+    
+    def _execute(self, query, params=()):
+        with self._lock, self._conn:
+            return self._conn.execute(query, params)
+    
+    def _query(self, query, params=()):
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(query, params).fetchall()]
+    
+    # --- Scripts ---
+    
+    def sync_scripts(self, entries):
+        """
+        Enregistre les scripts découverts (voir scan_rpy_files)
+        
+        Les scripts inconnus sont ajoutés à l'état 'discovered' ; la taille et la
+        date des scripts connus sont mises à jour sans toucher à leur état.
+        
+        Args:
+            entries (list): Dictionnaires {'path', 'rel_path', 'size', 'mtime'}
+        """
+        now = time.time()
+        rows = [(os.path.abspath(e['path']), e.get('rel_path'), e.get('size'), e.get('mtime'), now)
+                for e in entries]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """INSERT INTO scripts (path, rel_path, size, mtime, updated_at)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(path) DO UPDATE SET
+                       rel_path = COALESCE(excluded.rel_path, rel_path),
+                       size = excluded.size, mtime = excluded.mtime""",
+                rows
+            )
+    
+    def record_extraction(self, filepath, counts, extraction_time, main_file=None, content_hash=None):
+        """
+        Enregistre une extraction réussie
+        
+        Args:
+            filepath (str): Script extrait
+            counts (dict): 'extracted', 'asterix', 'empty', 'glossary'
+            extraction_time (float): Durée en secondes
+            main_file (str, optional): Fichier de textes à traduire
+            content_hash (str, optional): Empreinte déjà calculée
+        """
+        path = os.path.abspath(filepath)
+        stats = os.stat(path)
+        now = time.time()
+        self._execute(
+            """INSERT INTO scripts (path, size, mtime, content_hash, state, extracted_count,
+                                    asterix_count, empty_count, glossary_count, extraction_time,
+                                    main_file, extracted_at, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(path) DO UPDATE SET
+                   size = excluded.size, mtime = excluded.mtime,
+                   content_hash = excluded.content_hash, state = excluded.state,
+                   extracted_count = excluded.extracted_count,
+                   asterix_count = excluded.asterix_count,
+                   empty_count = excluded.empty_count,
+                   glossary_count = excluded.glossary_count,
+                   extraction_time = excluded.extraction_time,
+                   main_file = excluded.main_file,
+                   extracted_at = excluded.extracted_at,
+                   translated_at = NULL, rebuilt_at = NULL, rebuilt_hash = NULL,
+                   updated_at = excluded.updated_at""",
+            (path, stats.st_size, stats.st_mtime, content_hash or compute_file_hash(path),
+             STATE_EXTRACTED, counts.get('extracted', 0), counts.get('asterix', 0),
+             counts.get('empty', 0), counts.get('glossary', 0), extraction_time,
+             main_file, now, now)
+        )
+    
+    def record_rebuild(self, filepath, save_path, reconstruction_time):
+        """
+        Enregistre une reconstruction réussie
+        
+        Args:
+            filepath (str): Script d'origine
+            save_path (str): Fichier reconstruit (identique en mode écrasement)
+            reconstruction_time (float): Durée en secondes
+        """
+        path = os.path.abspath(filepath)
+        now = time.time()
+        self._execute(
+            """INSERT INTO scripts (path, state, reconstruction_time, save_path, rebuilt_hash,
+                                    translated_at, rebuilt_at, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(path) DO UPDATE SET
+                   state = excluded.state,
+                   reconstruction_time = excluded.reconstruction_time,
+                   save_path = excluded.save_path,
+                   rebuilt_hash = excluded.rebuilt_hash,
+                   translated_at = COALESCE(translated_at, excluded.translated_at),
+                   rebuilt_at = excluded.rebuilt_at,
+                   updated_at = excluded.updated_at""",
+            (path, STATE_REBUILT, reconstruction_time, os.path.abspath(save_path),
+             compute_file_hash(save_path), now, now, now)
+        )
+    
+    def refresh_translation_states(self):
+        """
+        Passe à l'état 'translated' les scripts extraits dont le fichier de
+        textes a été modifié depuis l'extraction
+        
+        Returns:
+            int: Nombre de scripts mis à jour
+        """
+        updated = 0
+        for row in self.files_in_state(STATE_EXTRACTED):
+            main_file = row.get('main_file')
+            try:
+                if main_file and os.path.getmtime(main_file) > (row['extracted_at'] or 0) + 1:
+                    self._execute(
+                        "UPDATE scripts SET state = ?, translated_at = ?, updated_at = ? WHERE path = ?",
+                        (STATE_TRANSLATED, os.path.getmtime(main_file), time.time(), row['path'])
+                    )
+                    updated += 1
+            except OSError:
+                continue
+        return updated
+    
+    def get_script(self, filepath):
+        """Ligne d'un script, ou None s'il est inconnu"""
+        rows = self._query("SELECT * FROM scripts WHERE path = ?", (os.path.abspath(filepath),))
+        return rows[0] if rows else None
+    
+    def files_in_state(self, *states):
+        """Scripts dans l'un des états donnés (requête indexée)"""
+        placeholders = ", ".join("?" for _ in states)
+        return self._query(
+            f"SELECT * FROM scripts WHERE state IN ({placeholders}) ORDER BY rel_path, path",
+            states
+        )
+    
+    def files_extracted_not_rebuilt(self):
+        """Scripts extraits (ou traduits) mais pas encore reconstruits"""
+        return self.files_in_state(STATE_EXTRACTED, STATE_TRANSLATED)
+    
+    def get_stats(self):
+        """
+        Statistiques du jeu
+        
+        Returns:
+            dict: total, nombre par état, textes extraits et temps cumulés
+        """
+        with self._lock:
+            by_state = {row['state']: row['count'] for row in self._conn.execute(
+                "SELECT state, COUNT(*) AS count FROM scripts GROUP BY state")}
+            totals = self._conn.execute(
+                """SELECT COUNT(*) AS total, COALESCE(SUM(extracted_count), 0) AS texts,
+                          COALESCE(SUM(extraction_time), 0) AS extraction_time,
+                          COALESCE(SUM(reconstruction_time), 0) AS reconstruction_time
+                   FROM scripts""").fetchone()
+        
+        return {
+            'total': totals['total'],
+            'by_state': by_state,
+            'rebuilt': by_state.get(STATE_REBUILT, 0),
+            'pending_rebuild': by_state.get(STATE_EXTRACTED, 0) + by_state.get(STATE_TRANSLATED, 0),
+            'texts': totals['texts'],
+            'extraction_time': totals['extraction_time'],
+            'reconstruction_time': totals['reconstruction_time']
+        }
+    
+    # --- Projets actifs ---
+    
+    def save_project(self, project_key, main_file, project_data, timestamp):
+        """Enregistre un projet actif"""
+        self._execute(
+            "INSERT OR REPLACE INTO projects (project_key, main_file, data, timestamp) VALUES (?, ?, ?, ?)",
+            (project_key, main_file, json.dumps(project_data, ensure_ascii=False, default=str), timestamp)
+        )
+    
+    def load_project(self, project_key):
+        """Projet actif enregistré, ou None"""
+        rows = self._query("SELECT * FROM projects WHERE project_key = ?", (project_key,))
+        if not rows:
+            return None
+        row = rows[0]
+        return {
+            'main_file': row['main_file'],
+            'data': json.loads(row['data']) if row['data'] else {},
+            'timestamp': row['timestamp']
+        }
+    
+    def delete_projects_before(self, cutoff_time):
+        """Supprime les projets plus anciens que cutoff_time"""
+        return self._execute("DELETE FROM projects WHERE timestamp < ?", (cutoff_time,)).rowcount
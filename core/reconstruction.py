@@ -12,7 +12,9 @@ import time
 import json
 from collections import OrderedDict
 from utils.logging import log_message
+from utils.profiling import profiled
 from core.extraction import get_file_base_name
+from core.positions import PositionTable
 
 class FileReconstructor:
     """Classe principale pour la reconstruction des fichiers"""
@@ -26,9 +28,7 @@ class FileReconstructor:
         self.mapping = {}
         self.asterix_mapping = {}
         self.empty_mapping = {}
-        self.positions = []
-        self.quote_counts = []
-        self.suffixes = []
+        self.position_table = PositionTable()
         self.translations = []
         self.asterix_translations = []
         self.empty_translations = []
@@ -60,14 +60,13 @@ class FileReconstructor:
         self.mapping.clear()
         self.asterix_mapping.clear()
         self.empty_mapping.clear()
-        self.positions.clear()
-        self.quote_counts.clear()
-        self.suffixes.clear()
+        self.position_table.clear()
         self.translations.clear()
         self.asterix_translations.clear()
         self.empty_translations.clear()
         self.reconstruction_time = 0
     
+    @profiled("reconstruction")
     def reconstruct_file(self, save_mode='new_file'):
         """
         Fonction principale de reconstruction
@@ -167,15 +166,8 @@ class FileReconstructor:
         with open(positions_file, "r", encoding="utf-8") as pf:
             position_data = json.load(pf)
 
-        # Rétrocompatibilité ancien format
-        if isinstance(position_data, list):
-            self.positions = position_data
-            self.quote_counts = [1] * len(self.positions)
-            self.suffixes = [""] * len(self.positions)
-        else:
-            self.positions = position_data['positions']
-            self.quote_counts = position_data['quote_counts']
-            self.suffixes = position_data.get('suffixes', [""] * len(self.positions))
+        # Table compacte (gère aussi l'ancien format : liste des positions seule)
+        self.position_table = PositionTable.from_data(position_data)
 
         log_message("INFO", f"Mappings chargés depuis {mapping_folder}")
     
@@ -278,10 +270,11 @@ class FileReconstructor:
             current_line = line
             
             # Si cette ligne correspond à une position extraite
-            if i in self.positions:
-                pos_index = self.positions.index(i)
-                quote_count = self.quote_counts[pos_index]
-                suffix = self.suffixes[pos_index]
+            pos_index = self.position_table.find_line(i)
+            if pos_index is not None:
+                entry = self.position_table[pos_index]
+                quote_count = entry.quote_count
+                suffix = entry.suffix
                 
                 if translation_index < len(self.translations):
                     # Préparer les traductions pour cette ligne
@@ -408,34 +401,15 @@ class FileReconstructor:
     
     def _cleanup_temp_files(self):
         """CORRIGÉ : Nettoie les fichiers temporaires dans la nouvelle structure"""
-        from utils.constants import FOLDERS
         from core.extraction import get_file_base_name
         from utils.logging import extract_game_name
+        from core.workspace import workspace_manager
 
         file_base = get_file_base_name(self.original_path)
         game_name = extract_game_name(self.original_path)
         
-        # ✅ CORRECTION : Nettoyer dans la nouvelle structure
-        temp_root = FOLDERS["temp"]
-        mapping_folder = os.path.join(temp_root, game_name, "fichiers_a_ne_pas_traduire")
-        
-        temp_files = [
-            os.path.join(mapping_folder, f"{file_base}_mapping.txt"),
-            os.path.join(mapping_folder, f"{file_base}_positions.json"),
-            os.path.join(mapping_folder, f"{file_base}_asterix_mapping.txt"),
-            os.path.join(mapping_folder, f"{file_base}_empty_mapping.txt")
-        ]
-        
-        cleaned_count = 0
-        for temp_file in temp_files:
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-                    cleaned_count += 1
-            except Exception as e:
-                log_message("WARNING", f"Impossible de supprimer {temp_file}", e)
-        
-        log_message("INFO", f"Fichiers temporaires nettoyés pour {file_base}: {cleaned_count} fichiers")
+        # Mappings et positions du script (voir core.workspace.MAPPING_KINDS)
+        workspace_manager.cleanup_file(game_name, file_base)
 
 # Fonction de validation des traductions
 def validate_translations(original_count, translation_count, asterix_count=0, empty_count=0):
@@ -12,6 +12,12 @@ import time
 import json
 from collections import OrderedDict
 from utils.logging import log_message
+from utils.performance import perf_span
+from utils.profiling import profiled
+from core.line_buffer import LineOverlay, atomic_write
+from core.positions import PositionTable
+from core.replacement import MappingReplacer
+from core.workspace import workspace_manager, MAPPING_FOLDER, TRANSLATE_FOLDER
 
 
 class EnhancedFileReconstructor:
@@ -27,9 +33,7 @@ class EnhancedFileReconstructor:
         self.asterix_mapping = {}
         self.empty_mapping = {}
         self.glossary_mapping = {}  # ✅ NOUVEAU : Mapping du glossaire
-        self.positions = []
-        self.quote_counts = []
-        self.suffixes = []
+        self.position_table = PositionTable()
         self.translations = []
         self.asterix_translations = []
         self.empty_translations = []
@@ -38,16 +42,14 @@ class EnhancedFileReconstructor:
     def load_file_content(self, file_content, original_path):
         """Charge le contenu avec extraction du nom de jeu"""
         from utils.logging import extract_game_name
-        from utils.constants import FOLDERS
 
-        self.file_content = file_content[:]
+        self.file_content = LineOverlay(file_content)
         self.original_path = original_path
 
         # Extraire et stocker le nom du jeu
         self.game_name = extract_game_name(original_path)
-        temp_root = FOLDERS["temp"]
-        self.mapping_folder = os.path.join(temp_root, self.game_name, "fichiers_a_ne_pas_traduire")
-        self.translate_folder = os.path.join(temp_root, self.game_name, "fichiers_a_traduire")
+        self.mapping_folder = workspace_manager.get_game_folder(self.game_name, MAPPING_FOLDER)
+        self.translate_folder = workspace_manager.get_game_folder(self.game_name, TRANSLATE_FOLDER)
 
         # S'assurer que les dossiers existent
         from utils.constants import ensure_game_structure
@@ -61,15 +63,14 @@ class EnhancedFileReconstructor:
         self.asterix_mapping.clear()
         self.empty_mapping.clear()
         self.glossary_mapping.clear()  # ✅ NOUVEAU
-        self.positions.clear()
-        self.quote_counts.clear()
-        self.suffixes.clear()
+        self.position_table.clear()
         self.translations.clear()
         self.asterix_translations.clear()
         self.empty_translations.clear()
         self.glossary_translations.clear()  # ✅ NOUVEAU
         self.reconstruction_time = 0
     
+    @profiled("reconstruction")
     def reconstruct_file(self, save_mode='new_file'):
         """
         Fonction principale de reconstruction avec support du glossaire
@@ -84,20 +85,26 @@ class EnhancedFileReconstructor:
             raise ValueError("Contenu du fichier ou chemin original manquant")
         
         start_time = time.time()
+        content_size = sum(len(line) for line in self.file_content)
         
         try:
-            # Charger les fichiers de configuration
-            self._load_mapping_files()
-            self._load_translation_files()
-            
-            # Reconstruire le contenu
-            reconstructed_content = self._rebuild_content()
-            
-            # Sauvegarder le fichier
-            save_path = self._save_reconstructed_file(reconstructed_content, save_mode)
-            
-            # Nettoyer les fichiers temporaires
-            self._cleanup_temp_files()
+            with perf_span("reconstruction", file_name=os.path.basename(self.original_path),
+                           bytes_processed=content_size):
+                # Charger les fichiers de configuration
+                with perf_span("chargement_mappings"):
+                    self._load_mapping_files()
+                with perf_span("chargement_traductions"):
+                    self._load_translation_files()
+                
+                # Reconstruire et sauvegarder : les lignes sont restaurées au fil de
+                # l'écriture (générateur), d'où une seule étape pour les deux
+                with perf_span("reconstruction_ecriture"):
+                    reconstructed_content = self._rebuild_content()
+                    save_path = self._save_reconstructed_file(reconstructed_content, save_mode)
+                
+                # Nettoyer les fichiers temporaires
+                with perf_span("nettoyage_temporaires"):
+                    self._cleanup_temp_files()
             
             # Calcul du temps
             self.reconstruction_time = time.time() - start_time
@@ -117,7 +124,6 @@ class EnhancedFileReconstructor:
     
     def _load_mapping_files(self):
         """Charge les mappings depuis la nouvelle structure (avec glossaire)"""
-        from utils.constants import FOLDERS
         from core.extraction_enhanced import get_file_base_name
         from utils.logging import extract_game_name
 
@@ -125,12 +131,11 @@ class EnhancedFileReconstructor:
         game_name = extract_game_name(self.original_path)
         
         # Utiliser la nouvelle structure
-        temp_root = FOLDERS["temp"]
-        mapping_folder = os.path.join(temp_root, game_name, "fichiers_a_ne_pas_traduire")
+        mapping_folder = workspace_manager.get_game_folder(game_name, MAPPING_FOLDER)
 
         # Vérifier que les fichiers existent
-        mapping_file = os.path.join(mapping_folder, f"{file_base}_mapping.txt")
-        positions_file = os.path.join(mapping_folder, f"{file_base}_positions.json")
+        mapping_file = workspace_manager.get_artifact_path(game_name, file_base, 'mapping')
+        positions_file = workspace_manager.get_artifact_path(game_name, file_base, 'positions')
 
         if not os.path.exists(mapping_file) or not os.path.exists(positions_file):
             raise FileNotFoundError(
@@ -148,7 +153,7 @@ class EnhancedFileReconstructor:
                     self.mapping[placeholder] = tag
 
         # Charger le mapping des astérisques (si existe)
-        asterix_file = os.path.join(mapping_folder, f"{file_base}_asterix_mapping.txt")
+        asterix_file = workspace_manager.get_artifact_path(game_name, file_base, 'asterix_mapping')
         if os.path.exists(asterix_file):
             with open(asterix_file, "r", encoding="utf-8") as amf:
                 for line in amf:
@@ -157,7 +162,7 @@ class EnhancedFileReconstructor:
                         self.asterix_mapping[placeholder] = asterix
 
         # Charger le mapping des textes vides (si existe)
-        empty_file = os.path.join(mapping_folder, f"{file_base}_empty_mapping.txt")
+        empty_file = workspace_manager.get_artifact_path(game_name, file_base, 'empty_mapping')
         if os.path.exists(empty_file):
             with open(empty_file, "r", encoding="utf-8") as emf:
                 for line in emf:
@@ -166,7 +171,7 @@ class EnhancedFileReconstructor:
                         self.empty_mapping[placeholder] = empty
 
         # ✅ NOUVEAU : Charger le mapping du glossaire (si existe)
-        glossary_file = os.path.join(mapping_folder, f"{file_base}_glossary_mapping.txt")
+        glossary_file = workspace_manager.get_artifact_path(game_name, file_base, 'glossary_mapping')
         if os.path.exists(glossary_file):
             with open(glossary_file, "r", encoding="utf-8") as gmf:
                 for line in gmf:
@@ -185,21 +190,13 @@ class EnhancedFileReconstructor:
         with open(positions_file, "r", encoding="utf-8") as pf:
             position_data = json.load(pf)
 
-        # Rétrocompatibilité ancien format
-        if isinstance(position_data, list):
-            self.positions = position_data
-            self.quote_counts = [1] * len(self.positions)
-            self.suffixes = [""] * len(self.positions)
-        else:
-            self.positions = position_data['positions']
-            self.quote_counts = position_data['quote_counts']
-            self.suffixes = position_data.get('suffixes', [""] * len(self.positions))
+        # Table compacte (gère aussi l'ancien format : liste des positions seule)
+        self.position_table = PositionTable.from_data(position_data)
 
         log_message("INFO", f"Mappings chargés depuis {mapping_folder} (avec glossaire: {len(self.glossary_mapping)} termes)")
     
     def _load_translation_files(self):
         """Charge les traductions depuis la nouvelle structure (avec glossaire)"""
-        from utils.constants import FOLDERS
         from core.extraction_enhanced import get_file_base_name
         from utils.logging import extract_game_name
 
@@ -207,11 +204,10 @@ class EnhancedFileReconstructor:
         game_name = extract_game_name(self.original_path)
         
         # Utiliser la nouvelle structure
-        temp_root = FOLDERS["temp"]
-        translate_folder = os.path.join(temp_root, game_name, "fichiers_a_traduire")
+        translate_folder = workspace_manager.get_game_folder(game_name, TRANSLATE_FOLDER)
 
         # Fichier principal
-        main_trans_path = os.path.join(translate_folder, f"{file_base}.txt")
+        main_trans_path = workspace_manager.get_artifact_path(game_name, file_base, 'texts')
         if not os.path.exists(main_trans_path):
             raise FileNotFoundError(f"Fichier de traduction manquant : {main_trans_path}")
         
@@ -219,7 +215,7 @@ class EnhancedFileReconstructor:
             self.translations = [line.rstrip("\n") for line in mf]
 
         # Fichier astérisques (si présent)
-        asterix_trans_path = os.path.join(translate_folder, f"{file_base}_asterix.txt")
+        asterix_trans_path = workspace_manager.get_artifact_path(game_name, file_base, 'asterix_texts')
         if os.path.exists(asterix_trans_path):
             with open(asterix_trans_path, "r", encoding="utf-8") as af:
                 self.asterix_translations = [line.rstrip("\n") for line in af]
@@ -227,7 +223,7 @@ class EnhancedFileReconstructor:
             self.asterix_translations = []
 
         # Fichier vides (si présent)
-        empty_trans_path = os.path.join(translate_folder, f"{file_base}_empty.txt")
+        empty_trans_path = workspace_manager.get_artifact_path(game_name, file_base, 'empty_texts')
         if os.path.exists(empty_trans_path):
             with open(empty_trans_path, "r", encoding="utf-8") as ef:
                 self.empty_translations = [line.rstrip("\n") for line in ef]
@@ -235,7 +231,7 @@ class EnhancedFileReconstructor:
             self.empty_translations = []
 
         # ✅ NOUVEAU : Fichier glossaire (si présent)
-        glossary_trans_path = os.path.join(translate_folder, f"{file_base}_glossary.txt")
+        glossary_trans_path = workspace_manager.get_artifact_path(game_name, file_base, 'glossary_texts')
         if os.path.exists(glossary_trans_path):
             with open(glossary_trans_path, "r", encoding="utf-8") as gf:
                 # Ignorer les lignes de commentaire
@@ -249,7 +245,12 @@ class EnhancedFileReconstructor:
         log_message("INFO", f"Traductions chargées depuis {translate_folder} (glossaire: {len(self.glossary_translations)} termes)")
     
     def _rebuild_content(self):
-        """Reconstruit le contenu du fichier avec les traductions et le glossaire"""
+        """
+        Prépare la reconstruction du contenu avec les traductions et le glossaire
+        
+        Returns:
+            generator: Lignes reconstruites, produites une par une pendant l'écriture
+        """
         # Créer un mapping des placeholders astérisques vers leurs traductions
         asterix_trans_mapping = {}
         if self.asterix_translations and self.asterix_mapping:
@@ -308,18 +309,30 @@ class EnhancedFileReconstructor:
                         empty_text_mapping[f'"{placeholder}"'] = translated_empty
                         translation_index -= 1
         
-        # Reconstruire ligne par ligne
-        output_lines = []
+        return self._iter_rebuilt_lines(restore_mapping, asterix_trans_mapping,
+                                        glossary_trans_mapping, empty_text_mapping)
+    
+    def _iter_rebuilt_lines(self, restore_mapping, asterix_trans_mapping,
+                            glossary_trans_mapping, empty_text_mapping):
+        """Reconstruit ligne par ligne sans garder de copie complète du résultat"""
         translation_index = 0
         
+        # Une expression par mapping au lieu d'un str.replace par placeholder et par texte
+        restore = MappingReplacer(restore_mapping)
+        asterix_restore = MappingReplacer(asterix_trans_mapping)
+        glossary_restore = MappingReplacer(glossary_trans_mapping)
+        escape_restore = MappingReplacer({placeholder: original for placeholder, original in restore_mapping.items()
+                                          if placeholder.startswith("(ESC")})
+        
         for i, line in enumerate(self.file_content):
             current_line = line
             
             # Si cette ligne correspond à une position extraite
-            if i in self.positions:
-                pos_index = self.positions.index(i)
-                quote_count = self.quote_counts[pos_index]
-                suffix = self.suffixes[pos_index]
+            pos_index = self.position_table.find_line(i)
+            if pos_index is not None:
+                entry = self.position_table[pos_index]
+                quote_count = entry.quote_count
+                suffix = entry.suffix
                 
                 if translation_index < len(self.translations):
                     # Préparer les traductions pour cette ligne
@@ -329,16 +342,13 @@ class EnhancedFileReconstructor:
                             translation = self.translations[translation_index + j]
                             
                             # Restaurer TOUS les placeholders dans la traduction
-                            for placeholder, original in restore_mapping.items():
-                                translation = translation.replace(placeholder, original)
+                            translation = restore.replace(translation)
                             
                             # Restaurer les astérisques traduites
-                            for asterix_ph, translated_asterix in asterix_trans_mapping.items():
-                                translation = translation.replace(asterix_ph, translated_asterix)
+                            translation = asterix_restore.replace(translation)
                             
                             # ✅ NOUVEAU : Restaurer les termes du glossaire traduits
-                            for glossary_ph, glossary_translation in glossary_trans_mapping.items():
-                                translation = translation.replace(glossary_ph, glossary_translation)
+                            translation = glossary_restore.replace(translation)
                                 
                             line_translations.append(translation)
                         else:
@@ -364,15 +374,15 @@ class EnhancedFileReconstructor:
                         if line.endswith('\n'):
                             new_line += '\n'
                         
-                        output_lines.append(new_line)
+                        yield new_line
                     else:
                         # Fallback : garder la ligne modifiée
-                        output_lines.append(current_line)
+                        yield current_line
                     
                     translation_index += quote_count
                 else:
                     # Pas assez de traductions, garder la ligne modifiée
-                    output_lines.append(current_line)
+                    yield current_line
             else:
                 # Ligne normale : restaurer les placeholders empty qui ne sont pas dans les traductions
                 # Traiter d'abord les textes vides traduits
@@ -380,17 +390,12 @@ class EnhancedFileReconstructor:
                     current_line = current_line.replace(pattern, replacement)
                 
                 # Puis restaurer les autres placeholders (comme les guillemets échappés)
-                for placeholder, original in restore_mapping.items():
-                    if placeholder.startswith("(ESC"):
-                        current_line = current_line.replace(placeholder, original)
+                current_line = escape_restore.replace(current_line)
                 
                 # ✅ NOUVEAU : Restaurer les termes du glossaire dans les lignes non extraites
-                for glossary_ph, glossary_translation in glossary_trans_mapping.items():
-                    current_line = current_line.replace(glossary_ph, glossary_translation)
+                current_line = glossary_restore.replace(current_line)
                 
-                output_lines.append(current_line)
-        
-        return output_lines
+                yield current_line
 
     def _restore_codes_in_asterix(self, asterix_content):
         """Restaure les codes protégés dans un texte astérisque traduit"""
@@ -409,7 +414,12 @@ class EnhancedFileReconstructor:
             return asterix_content  # Retourner l'original en cas d'erreur
 
     def _save_reconstructed_file(self, content, save_mode):
-        """Sauvegarde le fichier reconstruit"""
+        """
+        Sauvegarde le fichier reconstruit
+        
+        Les lignes sont écrites au fil de l'eau dans un fichier temporaire du même
+        dossier, qui remplace la cible seulement une fois complet (voir atomic_write).
+        """
         # Déterminer le chemin de sauvegarde
         if save_mode == 'overwrite':
             save_path = self.original_path
@@ -417,8 +427,11 @@ class EnhancedFileReconstructor:
             save_path = self.original_path.replace(".rpy", "_translated.rpy")
         
         # Sauvegarder le fichier traduit
-        with open(save_path, "w", encoding="utf-8", newline='') as wf:
+        with atomic_write(save_path) as wf:
             wf.writelines(content)
+            # Lignes toutes écrites : libérer la projection du script source
+            # avant de le remplacer (impossible sous Windows tant qu'il est projeté)
+            self._release_source()
         
         # Si mode nouveau fichier, commenter l'original
         if save_mode == 'new_file':
@@ -429,23 +442,24 @@ class EnhancedFileReconstructor:
         log_message("INFO", f"Fichier reconstruit sauvegardé: {save_path}")
         return save_path
     
+    def _release_source(self):
+        """Ferme le fichier source s'il est projeté en mémoire (MappedTextFile)"""
+        close = getattr(self.file_content.base, 'close', None)
+        if close:
+            close()
+    
     def _comment_original_file(self):
         """Commente toutes les lignes du fichier original"""
         try:
-            with open(self.original_path, 'r', encoding='utf-8') as f:
-                original_lines = f.readlines()
-            
-            commented_lines = []
-            for line in original_lines:
-                # Si la ligne n'est pas vide, la commenter
-                if line.strip():
-                    commented_lines.append(f"# {line}")
-                else:
-                    commented_lines.append(line)
-            
-            # Sauvegarder le fichier commenté
-            with open(self.original_path, 'w', encoding='utf-8', newline='') as f:
-                f.writelines(commented_lines)
+            # Écrire le fichier commenté à côté puis remplacer l'original
+            with atomic_write(self.original_path) as out:
+                with open(self.original_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        # Si la ligne n'est pas vide, la commenter
+                        if line.strip():
+                            out.write(f"# {line}")
+                        else:
+                            out.write(line)
             
             return True
         except Exception as e:
@@ -454,35 +468,15 @@ class EnhancedFileReconstructor:
     
     def _cleanup_temp_files(self):
         """Nettoie les fichiers temporaires dans la nouvelle structure"""
-        from utils.constants import FOLDERS
         from core.extraction_enhanced import get_file_base_name
         from utils.logging import extract_game_name
+        from core.workspace import workspace_manager
 
         file_base = get_file_base_name(self.original_path)
         game_name = extract_game_name(self.original_path)
         
-        # Nettoyer dans la nouvelle structure
-        temp_root = FOLDERS["temp"]
-        mapping_folder = os.path.join(temp_root, game_name, "fichiers_a_ne_pas_traduire")
-        
-        temp_files = [
-            os.path.join(mapping_folder, f"{file_base}_mapping.txt"),
-            os.path.join(mapping_folder, f"{file_base}_positions.json"),
-            os.path.join(mapping_folder, f"{file_base}_asterix_mapping.txt"),
-            os.path.join(mapping_folder, f"{file_base}_empty_mapping.txt"),
-            os.path.join(mapping_folder, f"{file_base}_glossary_mapping.txt")  # ✅ NOUVEAU
-        ]
-        
-        cleaned_count = 0
-        for temp_file in temp_files:
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-                    cleaned_count += 1
-            except Exception as e:
-                log_message("WARNING", f"Impossible de supprimer {temp_file}", e)
-        
-        log_message("INFO", f"Fichiers temporaires nettoyés pour {file_base}: {cleaned_count} fichiers")
+        # Mappings et positions du script (voir core.workspace.MAPPING_KINDS)
+        workspace_manager.cleanup_file(game_name, file_base)
 
 # Fonction utilitaire pour compatibilité
 def reconstruire_fichier_enhanced(file_content, original_path, save_mode='new_file'):
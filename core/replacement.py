@@ -0,0 +1,161 @@
+# core/replacement.py
+# Mapping Replacement Module
+# Created for Traducteur Ren'Py Pro v2.4.4
+
+"""
+Remplacement des clés d'un mapping en une seule expression compilée
+
+Les codes et placeholders étaient remplacés par une boucle de str.replace
+sur tout le mapping, pour chaque ligne. MappingReplacer compile les clés en
+une alternation (arbre des préfixes communs, la clé la plus longue d'abord)
+et remplace en une passe, avec une recherche dans le dictionnaire pour
+chaque occurrence.
+
+Le résultat reste celui des remplacements successifs dans l'ordre du
+mapping. Ils diffèrent seulement quand deux clés se chevauchent dans le
+texte ou quand une valeur insérée forme une autre clé avec le texte voisin :
+les clés qui le permettent sont repérées à la construction, et un texte où
+l'expression en trouve une repasse par les remplacements successifs.
+"""
+
+import re
+
+def _proper_prefixes(text):
+    return (text[:end] for end in range(1, len(text)))
+
+def _proper_suffixes(text):
+    return (text[start:] for start in range(1, len(text)))
+
+def _build_trie(words):
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[None] = word
+    return trie
+
+def _trie_pattern(node):
+    """Expression d'un nœud de l'arbre : à chaque embranchement, la suite la plus longue d'abord"""
+    chain = ""
+    # Suivre sans groupe les caractères sans embranchement
+    while None not in node and len(node) == 1:
+        char, node = next(iter(node.items()))
+        chain += re.escape(char)
+    
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in node.items() if char is not None]
+    if not branches:
+        return chain
+    body = "|".join(branches)
+    if None in node:
+        return f"{chain}(?:{body})?"
+    return f"{chain}(?:{body})"
+
+class MappingReplacer:
+    """Remplace toutes les clés d'un mapping (ordre du mapping en cas de conflit)"""
+    
+    def __init__(self, mapping):
+        """
+        Args:
+            mapping (dict): Clé à remplacer -> remplacement, dans l'ordre d'application
+        """
+        self._items = list(mapping.items())
+        self._mapping = dict(self._items)
+        self._regex = None
+        self._conflicting = frozenset()
+        
+        # Une clé vide n'a pas d'équivalent en expression (str.replace l'insère partout)
+        keys = list(self._mapping)
+        if not keys or not all(keys):
+            return
+        
+        self._regex = re.compile(_trie_pattern(_build_trie(keys)))
+        self._conflicting = self._overlapping_keys(keys) | self._creating_keys(keys)
+    
+    def _overlapping_keys(self, keys):
+        """
+        Clés qui contiennent une autre clé ou dont la fin commence une autre clé
+        
+        Quand deux occurrences se chevauchent dans un texte, la première
+        trouvée par l'expression est l'une de ces clés.
+        """
+        # Début de clé -> clé, ou None s'il commence plusieurs clés
+        prefix_owners = {}
+        for key in keys:
+            for prefix in _proper_prefixes(key):
+                prefix_owners[prefix] = key if prefix_owners.get(prefix, key) == key else None
+        
+        overlapping = set()
+        for key in keys:
+            if len(key) > 1 and (self._regex.search(key, 1) or self._regex.search(key, 0, len(key) - 1)):
+                overlapping.add(key)
+                continue
+            # Une clé qui se chevauche elle-même ("--" dans "---") est remplacée pareil
+            for suffix in _proper_suffixes(key):
+                if suffix in prefix_owners and prefix_owners[suffix] != key:
+                    overlapping.add(key)
+                    break
+        return overlapping
+    
+    def _creating_keys(self, keys):
+        """Clés dont la valeur, une fois insérée, peut former une clé avec le texte voisin"""
+        key_prefixes = {prefix for key in keys for prefix in _proper_prefixes(key)}
+        key_suffixes = {suffix for key in keys for suffix in _proper_suffixes(key)}
+        
+        creating = set()
+        for key, value in self._items:
+            if (not value or self._regex.search(value)
+                    or any(suffix in key_prefixes for suffix in _proper_suffixes(value))
+                    or any(prefix in key_suffixes for prefix in _proper_prefixes(value))):
+                creating.add(key)
+        
+        # Valeurs contenues dans une clé
+        value_trie = _build_trie(value for value in self._mapping.values() if value)
+        owners = {}
+        for key, value in self._items:
+            owners.setdefault(value, []).append(key)
+        for key in keys:
+            for start in range(len(key)):
+                node = value_trie
+                for char in key[start:]:
+                    node = node.get(char)
+                    if node is None:
+                        break
+                    if None in node:
+                        creating.update(owners[node[None]])
+        return creating
+    
+    def replace_sequential(self, text):
+        """Remplacements successifs dans l'ordre du mapping (comportement de référence)"""
+        for key, value in self._items:
+            text = text.replace(key, value)
+        return text
+    
+    def replace(self, text):
+        """
+        Remplace toutes les clés du mapping dans le texte
+        
+        Args:
+            text (str): Ligne ou texte à traiter
+        
+        Returns:
+            str: Texte avec les remplacements
+        """
+        if self._regex is None:
+            return self.replace_sequential(text)
+        
+        mapping = self._mapping
+        if not self._conflicting:
+            return self._regex.sub(lambda match: mapping[match.group()], text)
+        
+        conflicting = self._conflicting
+        conflicts = []
+        
+        def lookup(match):
+            key = match.group()
+            if key in conflicting:
+                conflicts.append(key)
+            return mapping[key]
+        
+        result = self._regex.sub(lookup, text)
+        return self.replace_sequential(text) if conflicts else result
@@ -7,36 +7,23 @@ Module de validation des fichiers et de sécurité
 """
 
 import os
-import re
+import copy
 import shutil
 import datetime
-from utils.constants import FOLDERS
+import threading
+from collections import OrderedDict
+from utils.constants import FOLDERS, RENPY_PATTERNS, REGEX_PATTERNS
 from utils.logging import log_message
+from utils.performance import timed_span, add_span_bytes
 
 class FileValidator:
     """Classe pour la validation des fichiers Ren'Py"""
     
-    # Patterns typiques des fichiers Ren'Py
-    RENPY_PATTERNS = [
-        r'label\s+\w+:',                    # Labels Ren'Py
-        r'menu:',                           # Menus
-        r'scene\s+\w+',                     # Changements de scène
-        r'show\s+\w+',                      # Affichage de personnages
-        r'hide\s+\w+',                      # Masquage de personnages
-        r'\w+\s+".*"',                      # Dialogues (personnage + texte)
-        r'translate\s+\w+\s+\w+:',          # Blocs de traduction
-        r'old\s+".*"',                      # Anciennes traductions
-        r'new\s+".*"',                      # Nouvelles traductions
-        r'\$\s+.*',                         # Code Python intégré
-        r'if\s+.*:',                        # Conditions
-        r'jump\s+\w+',                      # Sauts
-        r'call\s+\w+',                      # Appels
-        r'return',                          # Retours
-        r'with\s+\w+',                      # Transitions
-        r'pause\s*\d*\.?\d*',               # Pauses
-    ]
+    # Patterns typiques des fichiers Ren'Py (voir utils/constants.py)
+    RENPY_PATTERNS = RENPY_PATTERNS
     
     @classmethod
+    @timed_span("validation")
     def is_renpy_file(cls, filepath):
         """
         Vérifie si un fichier est un vrai fichier Ren'Py
@@ -67,6 +54,7 @@ class FileValidator:
             
             # Informations sur le fichier
             file_stats = os.stat(filepath)
+            add_span_bytes(file_stats.st_size)
             result['file_info'] = {
                 'size': file_stats.st_size,
                 'modified': datetime.datetime.fromtimestamp(file_stats.st_mtime),
@@ -96,22 +84,24 @@ class FileValidator:
             lines = content.split('\n')
             pattern_matches = 0
             dialogue_lines = 0
+            first_pattern = REGEX_PATTERNS["renpy_first"]
+            dialogue = REGEX_PATTERNS["dialogue"]
             
             for line in lines:
                 line = line.strip()
                 if not line or line.startswith('#'):
                     continue
                 
-                # Vérifier chaque pattern
-                for pattern in cls.RENPY_PATTERNS:
-                    if re.search(pattern, line, re.IGNORECASE):
-                        if pattern not in result['patterns_found']:
-                            result['patterns_found'].append(pattern)
-                        pattern_matches += 1
-                        break
+                # Premier pattern de RENPY_PATTERNS présent dans la ligne (une seule recherche)
+                match = first_pattern.match(line)
+                if match:
+                    pattern = RENPY_PATTERNS[match.lastindex - 1]
+                    if pattern not in result['patterns_found']:
+                        result['patterns_found'].append(pattern)
+                    pattern_matches += 1
                 
-                # Compter les lignes de dialogue potentielles
-                if re.search(r'\w+\s+".*"', line) or re.search(r'".*"', line):
+                # Compter les lignes de dialogue potentielles ('\w+\s+".*"' implique '".*"')
+                if dialogue.search(line):
                     dialogue_lines += 1
             
             # Calcul de la confiance
@@ -153,6 +143,7 @@ class BackupManager:
     """CORRIGÉ : Gestionnaire de sauvegardes avec structure organisée"""
     
     @staticmethod
+    @timed_span("sauvegarde")
     def create_backup(filepath, backup_suffix=".backup"):
         """Crée une sauvegarde dans l'arborescence organisée"""
         result = {
@@ -182,12 +173,14 @@ class BackupManager:
             
             # Générer un nom de backup unique
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            base_name = os.path.splitext(os.path.basename(filepath))[0]
+            from core.extraction import get_file_base_name
+            base_name = get_file_base_name(filepath)
             backup_filename = f"{base_name}_{timestamp}{backup_suffix}"
             backup_path = os.path.join(game_backup_folder, backup_filename)
             
             # Créer la sauvegarde
             shutil.copy2(filepath, backup_path)
+            add_span_bytes(os.path.getsize(backup_path))
             
             result['success'] = True
             result['backup_path'] = backup_path
@@ -259,7 +252,8 @@ class BackupManager:
                 return backups
             
             # Obtenir le nom de base du fichier pour filtrer les sauvegardes
-            base_name = os.path.splitext(os.path.basename(filepath))[0]
+            from core.extraction import get_file_base_name
+            base_name = get_file_base_name(filepath)
             
             # Lister tous les fichiers dans le dossier de sauvegarde
             for filename in os.listdir(backup_folder):
@@ -409,7 +403,7 @@ class TranslationValidator:
                 # Détecter les placeholders non traduits
                 untranslated_count = 0
                 for line_num, content in non_empty_lines:
-                    if re.search(r'\(\d{2}\)', content):
+                    if REGEX_PATTERNS["code_placeholder"].search(content):
                         untranslated_count += 1
                 
                 if untranslated_count > 0:
@@ -543,6 +537,7 @@ class TranslationValidator:
         
         return validation_results
 
+    @timed_span("validation_traductions")
     def validate_all_files_with_paths(self, main_file_path, asterix_file_path, empty_file_path,
                                      extracted_count, asterix_count=0, empty_count=0):
         """Valide tous les fichiers avec chemins complets spécifiés"""
@@ -644,10 +639,45 @@ class TranslationValidator:
 # ===== FONCTIONS UTILITAIRES AU NIVEAU RACINE =====
 # Ces fonctions sont maintenant accessibles pour l'import direct
 
+# Cache des validations : chemin -> (mtime, taille, résultat), borné en LRU
+_VALIDATION_CACHE_SIZE = 64
+_validation_cache = OrderedDict()
+_validation_lock = threading.Lock()
+
+def _get_cached_validation(filepath):
+    """Retourne une copie du résultat mis en cache si le fichier n'a pas changé"""
+    try:
+        stats = os.stat(filepath)
+    except OSError:
+        return None, None
+    
+    key = os.path.abspath(filepath)
+    signature = (stats.st_mtime, stats.st_size)
+    with _validation_lock:
+        cached = _validation_cache.get(key)
+        if cached and cached[0] == signature:
+            _validation_cache.move_to_end(key)
+            return copy.deepcopy(cached[1]), signature
+    return None, signature
+
+def _store_validation(filepath, signature, validation):
+    """Met en cache un résultat de validation"""
+    if signature is None:
+        return
+    key = os.path.abspath(filepath)
+    with _validation_lock:
+        _validation_cache[key] = (signature, copy.deepcopy(validation))
+        _validation_cache.move_to_end(key)
+        while len(_validation_cache) > _VALIDATION_CACHE_SIZE:
+            _validation_cache.popitem(last=False)
+
 def validate_before_extraction(filepath):
     """
     Validation complète avant extraction
     
+    Le résultat est mis en cache tant que le fichier (date, taille) ne change
+    pas : une validation faite par le préchargement du mode dossier est réutilisée.
+    
     Args:
         filepath (str): Chemin du fichier à valider
         
@@ -655,6 +685,10 @@ def validate_before_extraction(filepath):
         dict: Résultat de la validation avec recommandations
     """
     try:
+        cached, signature = _get_cached_validation(filepath)
+        if cached is not None:
+            return cached
+        
         validator = FileValidator()
         validation = validator.is_renpy_file(filepath)
         
@@ -669,6 +703,7 @@ def validate_before_extraction(filepath):
                 "Ce fichier ne semble pas être un fichier Ren'Py valide"
             )
         
+        _store_validation(filepath, signature, validation)
         return validation
         
     except Exception as e:
@@ -0,0 +1,342 @@
+# core/workspace.py
+# Temporary Workspace Module
+# Created for Traducteur Ren'Py Pro v2.4.4
+
+"""
+Gestion de l'espace de travail temporaire (temporaires/<jeu>/)
+
+Centralise l'organisation des fichiers produits par l'extraction, tient un
+index des fichiers de chaque jeu (tailles, dates) et nettoie en masse :
+fichiers d'un script, et éviction explicite des scripts reconstruits ou
+périmés (ancienneté maximale, taille totale plafonnée).
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+from utils.constants import FOLDERS, WORKSPACE_CONFIG
+from utils.logging import log_message, anonymize_path
+
+TRANSLATE_FOLDER = "fichiers_a_traduire"
+MAPPING_FOLDER = "fichiers_a_ne_pas_traduire"
+
+# Type de fichier -> (sous-dossier, suffixe ajouté au nom de base du script)
+ARTIFACTS = OrderedDict([
+    ('mapping', (MAPPING_FOLDER, '_mapping.txt')),
+    ('asterix_mapping', (MAPPING_FOLDER, '_asterix_mapping.txt')),
+    ('empty_mapping', (MAPPING_FOLDER, '_empty_mapping.txt')),
+    ('glossary_mapping', (MAPPING_FOLDER, '_glossary_mapping.txt')),
+    ('positions', (MAPPING_FOLDER, '_positions.json')),
+    ('texts', (TRANSLATE_FOLDER, '.txt')),
+    ('asterix_texts', (TRANSLATE_FOLDER, '_asterix.txt')),
+    ('empty_texts', (TRANSLATE_FOLDER, '_empty.txt')),
+    ('glossary_texts', (TRANSLATE_FOLDER, '_glossary.txt')),
+])
+
+# Fichiers supprimés après une reconstruction réussie
+MAPPING_KINDS = ('mapping', 'positions', 'asterix_mapping', 'empty_mapping', 'glossary_mapping')
+
+def _suffixes_by_folder():
+    """Suffixes de chaque sous-dossier, du plus long au plus court"""
+    result = {}
+    for kind, (folder, suffix) in ARTIFACTS.items():
+        result.setdefault(folder, []).append((suffix, kind))
+    for suffixes in result.values():
+        suffixes.sort(key=lambda item: len(item[0]), reverse=True)
+    return result
+
+_SUFFIXES = _suffixes_by_folder()
+
+def parse_artifact_name(folder, filename):
+    """
+    Identifie un fichier de l'espace de travail
+    
+    Args:
+        folder (str): Sous-dossier (fichiers_a_traduire ou fichiers_a_ne_pas_traduire)
+        filename (str): Nom du fichier
+    
+    Returns:
+        tuple: (nom de base du script, type) ou (None, None) si inconnu
+    """
+    for suffix, kind in _SUFFIXES.get(folder, []):
+        if filename.endswith(suffix) and len(filename) > len(suffix):
+            return filename[:-len(suffix)], kind
+    return None, None
+
+class WorkspaceManager:
+    """Organisation, index et nettoyage des fichiers temporaires par jeu"""
+    
+    def __init__(self, root=None):
+        self.root = root or FOLDERS["temp"]
+        self._index = {}
+        self._lock = threading.Lock()
+    
+    # --- Organisation ---
+    
+    def get_game_folder(self, game_name, folder=None):
+        """Dossier d'un jeu (ou l'un de ses sous-dossiers)"""
+        if folder:
+            return os.path.join(self.root, game_name, folder)
+        return os.path.join(self.root, game_name)
+    
+    def ensure_game_folders(self, game_name):
+        """Crée les dossiers de travail d'un jeu"""
+        for folder in (TRANSLATE_FOLDER, MAPPING_FOLDER):
+            os.makedirs(self.get_game_folder(game_name, folder), exist_ok=True)
+    
+    def get_artifact_path(self, game_name, file_base, kind):
+        """
+        Chemin d'un fichier de travail
+        
+        Args:
+            game_name (str): Nom du jeu
+            file_base (str): Nom de base du script (voir get_file_base_name)
+            kind (str): Type de fichier (clé de ARTIFACTS)
+        """
+        folder, suffix = ARTIFACTS[kind]
+        return os.path.join(self.get_game_folder(game_name, folder), f"{file_base}{suffix}")
+    
+    # --- Index ---
+    
+    def list_games(self):
+        """Jeux présents dans l'espace de travail"""
+        try:
+            with os.scandir(self.root) as it:
+                return sorted(entry.name for entry in it if entry.is_dir(follow_symlinks=False))
+        except OSError:
+            return []
+    
+    def _folder_mtimes(self, game_name):
+        mtimes = {}
+        for folder in (TRANSLATE_FOLDER, MAPPING_FOLDER):
+            try:
+                mtimes[folder] = os.stat(self.get_game_folder(game_name, folder)).st_mtime
+            except OSError:
+                mtimes[folder] = None
+        return mtimes
+    
+    def get_game_index(self, game_name, force=False):
+        """
+        Index des fichiers de travail d'un jeu
+        
+        Le jeu n'est reparcouru que si force=True, après invalidate() ou si la
+        date d'un de ses dossiers a changé.
+        
+        Returns:
+            dict: {'artifacts': {nom_de_base: {type: {'path', 'size', 'mtime'}}},
+                   'others': [...], 'size': taille totale}
+        """
+        mtimes = self._folder_mtimes(game_name)
+        with self._lock:
+            cached = self._index.get(game_name)
+            if cached and not force and cached['dirs'] == mtimes:
+                return cached
+        
+        artifacts = {}
+        others = []
+        total_size = 0
+        for folder in (TRANSLATE_FOLDER, MAPPING_FOLDER):
+            try:
+                with os.scandir(self.get_game_folder(game_name, folder)) as it:
+                    for entry in it:
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        try:
+                            stats = entry.stat()
+                        except OSError:
+                            continue
+                        info = {'path': entry.path, 'size': stats.st_size, 'mtime': stats.st_mtime}
+                        total_size += stats.st_size
+                        file_base, kind = parse_artifact_name(folder, entry.name)
+                        if kind:
+                            artifacts.setdefault(file_base, {})[kind] = info
+                        else:
+                            others.append(info)
+            except OSError:
+                continue
+        
+        index = {'dirs': mtimes, 'artifacts': artifacts, 'others': others, 'size': total_size}
+        with self._lock:
+            self._index[game_name] = index
+        return index
+    
+    def invalidate(self, game_name=None):
+        """Oublie l'index d'un jeu (ou de tous) après une écriture"""
+        with self._lock:
+            if game_name is None:
+                self._index.clear()
+            else:
+                self._index.pop(game_name, None)
+    
+    def list_artifacts(self, game_name=None, kinds=None):
+        """
+        Liste les fichiers de travail indexés
+        
+        Args:
+            game_name (str, optional): Limiter à un jeu
+            kinds (iterable, optional): Limiter à certains types
+        
+        Returns:
+            list: Chemins des fichiers
+        """
+        games = [game_name] if game_name else self.list_games()
+        paths = []
+        for game in games:
+            for files in self.get_game_index(game)['artifacts'].values():
+                paths.extend(info['path'] for kind, info in files.items()
+                             if kinds is None or kind in kinds)
+        return sorted(paths)
+    
+    def get_usage(self):
+        """Taille et nombre de scripts en cours par jeu"""
+        usage = {}
+        for game in self.list_games():
+            index = self.get_game_index(game)
+            usage[game] = {'size': index['size'], 'files': len(index['artifacts'])}
+        return usage
+    
+    # --- Nettoyage ---
+    
+    def _remove_paths(self, paths):
+        removed = 0
+        for path in paths:
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                log_message("WARNING", f"Impossible de supprimer {anonymize_path(path)}", e)
+        return removed
+    
+    def cleanup_file(self, game_name, file_base, kinds=MAPPING_KINDS):
+        """
+        Supprime les fichiers de travail d'un script
+        
+        Args:
+            game_name (str): Nom du jeu
+            file_base (str): Nom de base du script
+            kinds (iterable): Types à supprimer (mappings et positions par défaut)
+        
+        Returns:
+            int: Nombre de fichiers supprimés
+        """
+        removed = self._remove_paths(self.get_artifact_path(game_name, file_base, kind) for kind in kinds)
+        self.invalidate(game_name)
+        log_message("INFO", f"Fichiers temporaires nettoyés pour {file_base}: {removed} fichiers")
+        return removed
+    
+    def cleanup(self, game_name=None, file_base=None, kinds=MAPPING_KINDS):
+        """
+        Nettoyage en masse des fichiers de travail indexés
+        
+        Args:
+            game_name (str, optional): Limiter à un jeu
+            file_base (str, optional): Limiter à un script (dans tous les jeux si game_name est absent)
+            kinds (iterable): Types à supprimer
+        
+        Returns:
+            list: Chemins supprimés
+        """
+        games = [game_name] if game_name else self.list_games()
+        removed = []
+        for game in games:
+            artifacts = self.get_game_index(game)['artifacts']
+            paths = [info['path']
+                     for base, files in artifacts.items() if file_base is None or base == file_base
+                     for kind, info in files.items() if kind in kinds]
+            self._remove_paths(paths)
+            removed.extend(paths)
+            self.invalidate(game)
+        return removed
+    
+    def evict(self, rebuilt_bases, max_age_days=None, max_total_mb=None, dry_run=False):
+        """
+        Éviction des fichiers de travail périmés (action explicite, après confirmation)
+        
+        Un script est évinçable s'il est marqué reconstruit dans rebuilt_bases ou
+        si aucun de ses fichiers n'a été modifié depuis max_age_days : tous ses
+        fichiers (à traduire et mappings) peuvent alors être supprimés. Les
+        scripts périmés sont supprimés, puis les plus anciens des autres scripts
+        évinçables tant que leur taille totale dépasse max_total_mb. Les scripts
+        en cours (non reconstruits, modifiés récemment) et les fichiers inconnus
+        ne sont jamais supprimés : ils sont listés dans 'skipped' avec la raison.
+        
+        Args:
+            rebuilt_bases (dict): Jeu -> noms de base des scripts reconstruits
+                                  (voir ProjectManager.get_rebuilt_file_bases)
+            max_age_days (float, optional): WORKSPACE_CONFIG["max_age_days"] par défaut
+            max_total_mb (float, optional): WORKSPACE_CONFIG["max_total_mb"] par défaut
+            dry_run (bool): Calculer le bilan sans rien supprimer (aperçu avant confirmation)
+        
+        Returns:
+            dict: {'removed_scripts', 'removed_files', 'freed_bytes', 'remaining_bytes',
+                   'skipped': [{'game', 'name', 'bytes', 'reason'}]}
+                  remaining_bytes : taille des fichiers évinçables conservés
+        """
+        if max_age_days is None:
+            max_age_days = WORKSPACE_CONFIG["max_age_days"]
+        if max_total_mb is None:
+            max_total_mb = WORKSPACE_CONFIG["max_total_mb"]
+        
+        cutoff = time.time() - max_age_days * 86400
+        groups = []
+        skipped = []
+        evictable_size = 0
+        for game in self.list_games():
+            index = self.get_game_index(game, force=True)
+            rebuilt = rebuilt_bases.get(game, ())
+            for file_base, files in index['artifacts'].items():
+                mtime = max(info['mtime'] for info in files.values())
+                size = sum(info['size'] for info in files.values())
+                if file_base in rebuilt or mtime < cutoff:
+                    groups.append((mtime, size, game, [info['path'] for info in files.values()]))
+                    evictable_size += size
+                else:
+                    skipped.append({'game': game, 'name': file_base, 'bytes': size,
+                                    'reason': f"en cours (non reconstruit, modifié depuis moins de {max_age_days:g} jours)"})
+            for info in index['others']:
+                skipped.append({'game': game, 'name': os.path.basename(info['path']),
+                                'bytes': info['size'], 'reason': "fichier inconnu"})
+        
+        # Les plus anciens d'abord : les scripts périmés, puis selon le plafond
+        groups.sort(key=lambda group: group[0])
+        max_bytes = max_total_mb * 1024 * 1024
+        removed_scripts = 0
+        removed_files = 0
+        freed = 0
+        touched_games = set()
+        for mtime, size, game, paths in groups:
+            if mtime >= cutoff and evictable_size - freed <= max_bytes:
+                break
+            removed_files += len(paths) if dry_run else self._remove_paths(paths)
+            removed_scripts += 1
+            freed += size
+            touched_games.add(game)
+        
+        if not dry_run:
+            for game in touched_games:
+                self.invalidate(game)
+                self._remove_empty_game(game)
+            
+            if removed_files:
+                log_message("INFO", f"Espace de travail: {removed_scripts} scripts, {removed_files} fichiers supprimés ({freed / (1024 * 1024):.1f} Mo libérés)")
+            if skipped:
+                log_message("INFO", f"Espace de travail: {len(skipped)} éléments conservés (scripts en cours ou fichiers inconnus)")
+        return {'removed_scripts': removed_scripts, 'removed_files': removed_files, 'freed_bytes': freed,
+                'remaining_bytes': evictable_size - freed, 'skipped': skipped}
+    
+    def _remove_empty_game(self, game_name):
+        """Retire le dossier d'un jeu s'il ne contient plus rien"""
+        try:
+            for folder in (TRANSLATE_FOLDER, MAPPING_FOLDER):
+                path = self.get_game_folder(game_name, folder)
+                if os.path.isdir(path) and not os.listdir(path):
+                    os.rmdir(path)
+            os.rmdir(self.get_game_folder(game_name))
+        except OSError:
+            pass
+
+# Instance globale
+workspace_manager = WorkspaceManager()
@@ -34,7 +34,7 @@ from utils.constants import VERSION, THEMES, WINDOW_CONFIG, MESSAGES, FILE_NAMES
 from ui.glossary_ui import show_glossary_manager
 
 # Gestion des fichiers
-from core.file_manager import file_manager, FileOpener, TempFileManager
+from core.file_manager import file_manager, project_manager, FileOpener, TempFileManager
 
 # Extraction & nommage
 from core.extraction import (
@@ -60,7 +60,9 @@ from core.coherence_checker import check_file_coherence
 
 # Interface utilisateur
 from ui.backup_manager import show_backup_manager
-from ui.interface import SaveModeDialog
+from ui.interface import SaveModeDialog, LazyTextPreview
+from ui.themes import theme_manager
+from utils.performance import flush_performance_report
 
 # Imports du tutoriel (avec fallback de sécurité)
 try:
@@ -136,6 +138,7 @@ class TraducteurRenPyPro:
         self.label_chemin = None
         self.label_stats = None
         self.text_area = None
+        self.text_preview = None
         self.bouton_auto_open = None
         self.bouton_validation = None
         self.bouton_theme = None
@@ -396,7 +399,7 @@ class TraducteurRenPyPro:
         """Crée l'en-tête de l'application - VERSION THÈME UNIFORME"""
         theme = THEMES["dark"] if config_manager.is_dark_mode_enabled() else THEMES["light"]
         
-        frame_header = tk.Frame(self.root, height=80, bg=theme["bg"])
+        frame_header = theme_manager.register(tk.Frame(self.root, height=80, bg=theme["bg"]), "background")
         frame_header.pack(fill='x', padx=20, pady=(20, 10))
         frame_header.pack_propagate(False)
         
@@ -419,6 +422,8 @@ class TraducteurRenPyPro:
             fg=theme["fg"]
         )
         self.subtitle_label.pack(side='left', padx=(20, 0))
+        theme_manager.register(self.title_label, "title")
+        theme_manager.register(self.subtitle_label, "subtitle")
         
         # Bouton thème
         self.bouton_theme = tk.Button(
@@ -483,12 +488,17 @@ class TraducteurRenPyPro:
             fg=theme["fg"]
         )
         self.label_stats.pack(side='right')
+        
+        # Mis à jour par theme_manager à chaque changement de thème
+        theme_manager.register(self.frame_info, "info_frame")
+        theme_manager.register(self.label_chemin, "path_label")
+        theme_manager.register(self.label_stats, "stats_label")
 
     def create_open_frame(self):
         """Crée le frame des boutons d'ouverture - VERSION THÈME UNIFORME"""
         theme = THEMES["dark"] if config_manager.is_dark_mode_enabled() else THEMES["light"]
         
-        frame_open = tk.Frame(self.root, bg=theme["bg"], height=50)
+        frame_open = theme_manager.register(tk.Frame(self.root, bg=theme["bg"], height=50), "background")
         frame_open.pack(padx=20, pady=5)
         
         # 4 colonnes : 2 boutons bleus, 2 boutons rouges
@@ -555,11 +565,11 @@ class TraducteurRenPyPro:
         """Crée le frame des actions principales - VERSION AVEC GLOSSAIRE"""
         theme = THEMES["dark"] if config_manager.is_dark_mode_enabled() else THEMES["light"]
         
-        frame_actions = tk.Frame(self.root, height=80, bg=theme["bg"])
+        frame_actions = theme_manager.register(tk.Frame(self.root, height=80, bg=theme["bg"]), "background")
         frame_actions.pack(padx=20, pady=5)
         
-        # ✅ MODIFICATION : 10 colonnes au lieu de 9 pour inclure le glossaire
-        for col in range(10):
+        # 11 colonnes : glossaire et purge de l'espace de travail inclus
+        for col in range(11):
             frame_actions.columnconfigure(col, weight=1, uniform="grp_act")
         
         # Boutons principaux
@@ -597,6 +607,7 @@ class TraducteurRenPyPro:
         utilitaires = [
             ("🧹 Nettoyer", self.nettoyer_page, '#ffc107'),
             ("📁 Temporaire", self.ouvrir_dossier_temporaire, '#ffc107'),
+            ("🗑️ Purger", self.purger_espace_travail, '#dc3545'),
             ("⚠️ Avertissements", self.ouvrir_avertissements, '#ffc107'),
             (f"📂 Auto : {'ON' if config_manager.is_auto_open_enabled() else 'OFF'}", 
             self.handle_toggle_auto_open, '#ffc107'),
@@ -734,15 +745,20 @@ class TraducteurRenPyPro:
                 if not backup_result['success']:
                     log_message("WARNING", f"Sauvegarde échouée: {backup_result['error']}")
             
-            # ✅ CORRECTION : Utiliser l'import de fonction au lieu de self
-            from core.extraction_enhanced import extraire_textes_enhanced as extract_func
-            self.extraction_results = extract_func(self.file_content, self.original_path)
-            
-            # Mise à jour des compteurs
-            from core.extraction_enhanced import EnhancedTextExtractor
-            extractor = EnhancedTextExtractor()
-            extractor.load_file_content(self.file_content, self.original_path)
-            results = extractor.extract_texts()
+            from core.extraction_enhanced import should_stream_extraction, extraire_textes_streaming
+            if self.text_mode == "file" and should_stream_extraction(self.original_path):
+                # Gros fichier : extraction par blocs directement depuis le disque
+                results, extractor = extraire_textes_streaming(self.original_path)
+            else:
+                # ✅ CORRECTION : Utiliser l'import de fonction au lieu de self
+                from core.extraction_enhanced import extraire_textes_enhanced as extract_func
+                self.extraction_results = extract_func(self.file_content, self.original_path)
+                
+                # Mise à jour des compteurs
+                from core.extraction_enhanced import EnhancedTextExtractor
+                extractor = EnhancedTextExtractor()
+                extractor.load_file_content(self.file_content, self.original_path)
+                results = extractor.extract_texts()
             
             self.extraction_results = results
             self.last_extraction_time = extractor.extraction_time
@@ -750,6 +766,9 @@ class TraducteurRenPyPro:
             self.extraction_results['asterix_count'] = extractor.asterix_count
             self.extraction_results['empty_count'] = extractor.empty_count
             
+            if self.text_mode == "file" and self.original_path:
+                project_manager.record_extraction(self.original_path, extractor, results)
+            
             # Gestion de l'ouverture des fichiers
             files_to_open = [f for f in [
                 self.extraction_results.get('main_file'),
@@ -857,9 +876,16 @@ class TraducteurRenPyPro:
             
             start_time = time.time()
             from core.reconstruction_enhanced import reconstruire_fichier_enhanced as reconstruct_func
-            result = reconstruct_func(self.file_content, self.original_path, save_mode)
+            try:
+                result = reconstruct_func(self.file_content, self.original_path, save_mode)
+            finally:
+                self._reload_mapped_content()
             self.last_reconstruction_time = time.time() - start_time
             
+            if result and self.text_mode == "file":
+                project_manager.record_rebuild(self.original_path, result['save_path'],
+                                               self.last_reconstruction_time)
+            
             if result:
                 # Contrôle de cohérence si validation activée
                 if config_manager.is_validation_enabled():
@@ -974,7 +1000,7 @@ class TraducteurRenPyPro:
         """Crée la zone de contenu - VERSION AMÉLIORÉE avec numéros de ligne"""
         theme = THEMES["dark"] if config_manager.is_dark_mode_enabled() else THEMES["light"]
         
-        frame_content = tk.Frame(self.root, bg=theme["bg"])
+        frame_content = theme_manager.register(tk.Frame(self.root, bg=theme["bg"]), "background")
         frame_content.pack(expand=True, fill='both', padx=20, pady=(0, 10))
         
         # ScrolledText
@@ -985,6 +1011,9 @@ class TraducteurRenPyPro:
             fg=theme["entry_fg"]
         )
         self.text_area.pack(expand=True, fill='both')
+        theme_manager.register(self.text_area, "text_area")
+        # Aperçu par fenêtre : seules les lignes proches de la vue sont insérées
+        self.text_preview = LazyTextPreview(self.text_area)
         # Configuration mode initial
         try:
             self.configure_input_mode()
@@ -1024,68 +1053,24 @@ class TraducteurRenPyPro:
     # =============================================================================
 
     def toggle_dark_mode(self):
-        """✅ BASCULEMENT DE THÈME CORRIGÉ - Application complète"""
+        """Bascule entre thème clair et sombre sans recréer l'interface"""
         try:
             # 1. Met à jour la config
             config_manager.toggle_dark_mode()
 
-            # 2. ✅ NOUVEAU : Appliquer le thème immédiatement au theme_manager
+            # 2. Styles TTK et widgets enregistrés auprès du theme_manager, en un seul lot
             from ui.themes import theme_manager
             new_theme = "dark" if config_manager.is_dark_mode_enabled() else "light"
             theme_manager.set_theme(new_theme)
             theme = theme_manager.get_theme()
 
-            # 3. ✅ APPLIQUER LE THÈME À LA FENÊTRE PRINCIPALE EN PREMIER
+            # 3. Fenêtre principale et libellé du bouton de thème
             self.root.configure(bg=theme["bg"])
+            if self.bouton_theme:
+                self.bouton_theme.config(text="☀️ Mode Clair" if new_theme == "dark" else "🌙 Mode Sombre")
 
-            # 4. Sauvegarder l'état avant de recréer
-            current_file_content = self.file_content.copy() if self.file_content else []
-            current_original_path = self.original_path
-            current_extraction_results = self.extraction_results
-            current_last_extraction_time = self.last_extraction_time
-            current_last_reconstruction_time = self.last_reconstruction_time
-            current_save_mode = self._save_mode
-            current_text_mode = getattr(self, 'text_mode', 'empty')
-            current_input_mode = getattr(self, 'input_mode', 'drag_drop')
-            current_source_info = getattr(self, 'source_info', None)
-            current_clipboard_counter = getattr(self, 'clipboard_counter', 0)
-
-            # 5. ✅ DÉTRUIRE ET RECRÉER L'INTERFACE COMPLÈTEMENT
-            for widget in self.root.winfo_children():
-                widget.destroy()
-
-            # 6. Recréer l'interface avec le nouveau thème
-            self.create_interface()
-
-            # 7. ✅ FORCER L'APPLICATION DU THÈME À TOUS LES WIDGETS
-            self.appliquer_theme_complet()
-
-            # 8. Restaurer l'état complet
-            self.file_content = current_file_content
-            self.original_path = current_original_path
-            self.extraction_results = current_extraction_results
-            self.last_extraction_time = current_last_extraction_time
-            self.last_reconstruction_time = current_last_reconstruction_time
-            self._save_mode = current_save_mode
-            self.text_mode = current_text_mode
-            self.input_mode = current_input_mode
-            self.source_info = current_source_info
-            self.clipboard_counter = current_clipboard_counter
-
-            # 9. Restaurer l'affichage si un fichier était chargé
-            if self.original_path and self.file_content:
-                self.label_chemin.config(text=f"📄 {self.original_path}")
-                self.text_area.delete('1.0', tk.END)
-                self.text_area.insert(tk.END, ''.join(self.file_content))
-                line_count = len(self.file_content)
-                self.label_stats.config(text=f"📊 {line_count} lignes chargées")
-            
-            # 10. Reconfigurer le mode d'entrée
-            try:
-                self.configure_input_mode()
-                self._update_drag_drop_display()
-            except Exception as e:
-                print(f"⚠️ DEBUG - Erreur reconfig après toggle theme: {e}")
+            # 4. Couleurs de texte des boutons (non thématisés)
+            self._update_button_text_colors(theme)
             
             print(f"✅ DEBUG - Basculement vers thème {new_theme} terminé avec succès")
             
@@ -1104,7 +1089,7 @@ class TraducteurRenPyPro:
         try:
             from ui.themes import theme_manager
             
-            # S'assurer que le theme manager utilise le bon thème
+            # S'assurer que le theme manager utilise le bon thème (met à jour les widgets enregistrés)
             current_mode = "dark" if config_manager.is_dark_mode_enabled() else "light"
             theme_manager.set_theme(current_mode)
             theme = theme_manager.get_theme()
@@ -1134,9 +1119,6 @@ class TraducteurRenPyPro:
                 except Exception as e:
                     print(f"⚠️ DEBUG - Erreur configuration frame_info: {e}")
 
-            # NOUVEAU : Appliquer le thème à TOUS les frames
-            self._apply_theme_to_all_frames(theme)
-
             # Zone de texte avec couleurs du thème
             if self.text_area:
                 try:
@@ -1164,7 +1146,7 @@ class TraducteurRenPyPro:
             log_message("WARNING", f"Erreur application du thème", e)
 
     def appliquer_theme_complet(self):
-        """✅ Application complète du thème - CORRECTION ERREUR"""
+        """Application complète du thème actuel (fenêtre et widgets enregistrés)"""
         try:
             from ui.themes import theme_manager
             theme = theme_manager.get_theme()
@@ -1172,35 +1154,10 @@ class TraducteurRenPyPro:
             # Appliquer à la fenêtre principale
             self.root.configure(bg=theme["bg"])
 
-            # ✅ MISE À JOUR SPÉCIFIQUE DES WIDGETS PRINCIPAUX
-            widgets_to_update = [
-                (self.title_label, "title"),
-                (self.subtitle_label, "subtitle"), 
-                (self.label_chemin, "path_label"),
-                (self.label_stats, "stats_label")
-            ]
+            # Widgets enregistrés à leur création (en-tête, infos, frames, zone de texte)
+            updated = theme_manager.apply_to_registered()
 
-            for widget, widget_type in widgets_to_update:
-                if widget:
-                    theme_manager.apply_to_widget(widget, widget_type)
-
-            # ✅ MISE À JOUR DE LA ZONE DE TEXTE
-            if self.text_area:
-                self.text_area.configure(
-                    bg=theme["entry_bg"],
-                    fg=theme["entry_fg"],
-                    selectbackground=theme["select_bg"],
-                    selectforeground=theme["select_fg"],
-                    insertbackground=theme["entry_fg"],
-                    highlightbackground=theme["frame_bg"],
-                    highlightcolor=theme["accent"]
-                )
-
-            # ✅ MISE À JOUR DES FRAMES
-            if self.frame_info:
-                self.frame_info.configure(bg=theme["frame_bg"])
-
-            print(f"✅ DEBUG - Thème {theme_manager.current_theme} appliqué complètement")
+            print(f"✅ DEBUG - Thème {theme_manager.current_theme} appliqué complètement ({updated} widgets)")
 
         except Exception as e:
             print(f"⚠️ DEBUG - Erreur appliquer_theme_complet: {e}")
@@ -1234,42 +1191,6 @@ class TraducteurRenPyPro:
         except Exception as e:
             print(f"⚠️ DEBUG - Erreur _update_button_text_colors: {e}")
 
-    def _apply_theme_to_all_frames(self, theme):
-        """Applique le thème à tous les frames de l'interface"""
-        try:
-            # Liste de tous les frames à thématiser
-            frames_to_theme = []
-            
-            # Parcourir tous les widgets enfants de la fenêtre principale
-            for widget in self.root.winfo_children():
-                if isinstance(widget, tk.Frame):
-                    frames_to_theme.append(widget)
-                    # Parcourir les enfants des frames
-                    self._collect_frames_recursive(widget, frames_to_theme)
-            
-            # Appliquer le thème à tous les frames trouvés
-            for frame in frames_to_theme:
-                try:
-                    frame.configure(bg=theme["bg"])
-                except Exception as e:
-                    print(f"⚠️ DEBUG - Erreur thème frame: {e}")
-            
-            print(f"✅ DEBUG - Thème appliqué à {len(frames_to_theme)} frames")
-            
-        except Exception as e:
-            print(f"⚠️ DEBUG - Erreur _apply_theme_to_all_frames: {e}")
-
-    def _collect_frames_recursive(self, parent, frame_list):
-        """Collecte récursivement tous les frames enfants"""
-        try:
-            for child in parent.winfo_children():
-                if isinstance(child, tk.Frame):
-                    frame_list.append(child)
-                    # Récursion pour les enfants
-                    self._collect_frames_recursive(child, frame_list)
-        except Exception as e:
-            print(f"⚠️ DEBUG - Erreur récursion frames: {e}")
-
     # =============================================================================
     # MÉTHODES DE GESTION DES MODES D'ENTRÉE
     # =============================================================================
@@ -1421,6 +1342,7 @@ class TraducteurRenPyPro:
             virtual_name = f"clipboard_{self.clipboard_counter}_{timestamp}.rpy"
             
             # Charger le contenu dans les variables
+            self._release_file_content()
             self.file_content = lines
             self.original_path = virtual_name
             self.text_mode = "clipboard"
@@ -1433,8 +1355,7 @@ class TraducteurRenPyPro:
             
             # Mettre à jour l'interface
             self.text_area.configure(state='normal')
-            self.text_area.delete('1.0', tk.END)
-            self.text_area.insert('1.0', content)
+            self.text_preview.load(lines)
             
             # Mise à jour des labels
             self.label_chemin.config(text=f"📋 Contenu du presse-papier ({len(lines)} lignes)")
@@ -1592,7 +1513,7 @@ class TraducteurRenPyPro:
                 
                 try:
                     self.text_area.configure(state='normal')
-                    self.text_area.delete('1.0', tk.END)
+                    self.text_preview.clear()
                     
                     # Message unifié mode + auto-open + fallback D&D
                     invitation_text = self._get_unified_invitation_text()
@@ -1744,9 +1665,18 @@ class TraducteurRenPyPro:
             start_time = time.time()
             reconstructor = FileReconstructor()
             reconstructor.load_file_content(self.file_content, self.original_path)
-            result = reconstructor.reconstruct_file(save_mode)
+            # Contenu copié par le reconstructeur : le fichier source peut être libéré
+            self._release_file_content()
+            try:
+                result = reconstructor.reconstruct_file(save_mode)
+            finally:
+                self._reload_mapped_content()
             self.last_reconstruction_time = time.time() - start_time
             
+            if result and self.text_mode == "file":
+                project_manager.record_rebuild(self.original_path, result['save_path'],
+                                               self.last_reconstruction_time)
+            
             if result:
                 # Contrôle de cohérence si validation activée
                 if config_manager.is_validation_enabled():
@@ -1848,23 +1778,26 @@ class TraducteurRenPyPro:
         
         theme = THEMES["dark"] if config_manager.is_dark_mode_enabled() else THEMES["light"]
         dialog.configure(bg=theme["bg"])
+        theme_manager.register(dialog)
         
         result = {'mode': None}
         
         # Interface du dialog
-        title_frame = tk.Frame(dialog, bg=theme["bg"])
+        title_frame = theme_manager.register(tk.Frame(dialog, bg=theme["bg"]), "background")
         title_frame.pack(fill='x', padx=20, pady=20)
         
         title_label = tk.Label(title_frame, text="💾 Choisissez le mode de sauvegarde",
                 font=('Segoe UI Emoji', 14, 'bold'), bg=theme["bg"], fg=theme["fg"])
+        theme_manager.register(title_label)
         title_label.pack()
         
         subtitle_label = tk.Label(title_frame, text="Ce choix sera mémorisé pour cette session",
                 font=('Segoe UI Emoji', 9), bg=theme["bg"], fg=theme["fg"])
+        theme_manager.register(subtitle_label)
         subtitle_label.pack(pady=(5, 0))
         
         # Options
-        options_frame = tk.Frame(dialog, bg=theme["bg"])
+        options_frame = theme_manager.register(tk.Frame(dialog, bg=theme["bg"]), "background")
         options_frame.pack(fill='both', expand=True, padx=20)
         
         def choisir_mode(mode):
@@ -1873,35 +1806,40 @@ class TraducteurRenPyPro:
             dialog.destroy()
         
         # Option 1: Écraser
-        option1_frame = tk.Frame(options_frame, bg=theme["frame_bg"], relief='solid', bd=1)
+        option1_frame = theme_manager.register(tk.Frame(options_frame, bg=theme["frame_bg"], relief='solid', bd=1))
         option1_frame.pack(fill='x', pady=10)
         
         btn_overwrite = tk.Button(option1_frame, text="🔄 Écraser le fichier original",
                  font=('Segoe UI Emoji', 11, 'bold'), bg=theme.get("warning", "#ffc107"), fg='#000000',
                  bd=0, pady=15, command=lambda: choisir_mode('overwrite'))
+        theme_manager.register(btn_overwrite, {"bg": "warning"})
         btn_overwrite.pack(fill='x', padx=10, pady=10)
         
         label_overwrite = tk.Label(option1_frame, text="⚠️ Le fichier original sera remplacé par la traduction",
                 font=('Segoe UI Emoji', 9), bg=theme["frame_bg"], fg=theme["fg"])
+        theme_manager.register(label_overwrite, "stats_label")
         label_overwrite.pack(pady=(0, 10))
         
         # Option 2: Créer nouveau fichier
-        option2_frame = tk.Frame(options_frame, bg=theme["frame_bg"], relief='solid', bd=1)
+        option2_frame = theme_manager.register(tk.Frame(options_frame, bg=theme["frame_bg"], relief='solid', bd=1))
         option2_frame.pack(fill='x', pady=10)
         
         btn_new_file = tk.Button(option2_frame, text="📝 Créer un nouveau fichier",
                  font=('Segoe UI Emoji', 11, 'bold'), bg=theme["accent"], fg='#000000',
                  bd=0, pady=15, command=lambda: choisir_mode('new_file'))
+        theme_manager.register(btn_new_file, {"bg": "accent"})
         btn_new_file.pack(fill='x', padx=10, pady=10)
         
         label_new_file = tk.Label(option2_frame, text="✅ Garde l'original et crée un fichier traduit séparé\n💡 L'original sera automatiquement commenté",
                 font=('Segoe UI Emoji', 9), bg=theme["frame_bg"], fg=theme["fg"], justify='left')
+        theme_manager.register(label_new_file, "stats_label")
         label_new_file.pack(pady=(0, 10))
         
         # Bouton annuler
         btn_cancel = tk.Button(dialog, text="❌ Annuler", font=('Segoe UI Emoji', 10),
                  bg=theme.get("danger", "#dc3545"), fg='#000000', bd=0, pady=8,
                  command=dialog.destroy)
+        theme_manager.register(btn_cancel, {"bg": "danger"})
         btn_cancel.pack(pady=10)
         
         dialog.wait_window()
@@ -1930,6 +1868,17 @@ class TraducteurRenPyPro:
             else:
                 self.nettoyer_page()
 
+    def _get_loaded_stats_text(self, filepath, line_count):
+        """Texte du label de statistiques après chargement (avancement du jeu en mode dossier)"""
+        text = f"📊 {line_count} lignes chargées"
+        if file_manager.is_folder_mode:
+            stats = project_manager.get_game_stats(filepath)
+            if stats and stats['total']:
+                text += f" | 📁 {stats['rebuilt']}/{stats['total']} reconstruits"
+                if stats['pending_rebuild']:
+                    text += f", {stats['pending_rebuild']} en attente"
+        return text
+
     def ouvrir_fichier_unique(self):
         """Ouvre un fichier .rpy unique"""
         try:
@@ -1971,7 +1920,11 @@ class TraducteurRenPyPro:
     def charger_fichier(self, filepath):
         """Charge un fichier dans l'interface"""
         try:
-            self.file_content = file_manager.load_file_content(filepath)
+            # Gros fichier : projeté en mémoire, l'aperçu ne décode que les lignes affichées
+            from core.extraction_enhanced import should_stream_extraction
+            content = file_manager.load_file_content(filepath, lazy=should_stream_extraction(filepath))
+            self._release_file_content()
+            self.file_content = content
             self.original_path = filepath
             
             # Définir le mode
@@ -1987,11 +1940,10 @@ class TraducteurRenPyPro:
             
             # Réactiver l'édition et charger le contenu
             self.text_area.configure(state='normal')
-            self.text_area.delete('1.0', tk.END)
-            self.text_area.insert(tk.END, ''.join(self.file_content))
+            self.text_preview.load(self.file_content)
             
             line_count = len(self.file_content)
-            self.label_stats.config(text=f"📊 {line_count} lignes chargées")
+            self.label_stats.config(text=self._get_loaded_stats_text(filepath, line_count))
             
             # Mettre à jour l'affichage
             self._update_drag_drop_display()
@@ -2002,6 +1954,21 @@ class TraducteurRenPyPro:
             log_message("ERREUR", f"Impossible de charger le fichier {filepath}", e)
             messagebox.showerror("❌ Erreur", f"Impossible de charger le fichier:\n{str(e)}")
 
+    def _release_file_content(self):
+        """Ferme la projection mémoire du fichier chargé (gros fichiers uniquement)"""
+        close = getattr(self.file_content, 'close', None)
+        if close:
+            close()
+    
+    def _reload_mapped_content(self):
+        """Rouvre un gros fichier après sa reconstruction, qui a libéré sa projection"""
+        if not hasattr(self.file_content, 'close'):
+            return
+        
+        self._release_file_content()
+        self.file_content = file_manager.load_file_content(self.original_path, lazy=True)
+        self.text_preview.load(self.file_content)
+    
     def _handle_dropped_file(self, filepath):
         """Gère un fichier déposé par Drag & Drop"""
         try:
@@ -2151,6 +2118,57 @@ class TraducteurRenPyPro:
             print(f"⚠️ Erreur lors du basculement Auto-Ouverture : {e}")
             log_message("ERREUR", "Erreur basculement Auto-Open", e)
 
+    def purger_espace_travail(self):
+        """Supprime, après confirmation, les fichiers de travail des scripts reconstruits ou périmés"""
+        try:
+            preview = TempFileManager.cleanup_temp_files(dry_run=True)
+            if not preview or not preview.get('removed_files'):
+                messagebox.showinfo(
+                    "🗑️ Purger l'espace de travail",
+                    "Aucun fichier périmé à supprimer." + self._resume_fichiers_ignores(preview)
+                )
+                return
+            
+            if not messagebox.askyesno(
+                "🗑️ Purger l'espace de travail",
+                f"Supprimer les fichiers de travail de {preview['removed_scripts']} scripts "
+                f"({preview['removed_files']} fichiers, {preview['freed_bytes'] / (1024 * 1024):.1f} Mo) ?\n\n"
+                "• Scripts reconstruits ou non modifiés depuis longtemps\n"
+                "• Fichiers à traduire (fichiers_a_traduire) et mappings compris\n\n"
+                "Ces scripts devront être réextraits avant toute nouvelle reconstruction."
+                + self._resume_fichiers_ignores(preview)
+            ):
+                return
+            
+            result = TempFileManager.cleanup_temp_files()
+            if not result or not result.get('removed_files'):
+                messagebox.showinfo("🗑️ Purger l'espace de travail", "Aucun fichier périmé à supprimer.")
+                return
+            
+            messagebox.showinfo(
+                "🗑️ Purger l'espace de travail",
+                f"{result['removed_files']} fichiers de {result['removed_scripts']} scripts supprimés "
+                f"({result['freed_bytes'] / (1024 * 1024):.1f} Mo libérés)."
+                + self._resume_fichiers_ignores(result)
+            )
+        except Exception as e:
+            log_message("ERREUR", "Erreur lors de la purge de l'espace de travail", e)
+            messagebox.showerror("❌ Erreur", f"Impossible de purger l'espace de travail :\n{str(e)}")
+    
+    def _resume_fichiers_ignores(self, result):
+        """Résumé des éléments conservés par la purge, regroupés par raison"""
+        if not result or not result.get('skipped'):
+            return ""
+        
+        reasons = {}
+        for item in result['skipped']:
+            count, size = reasons.get(item['reason'], (0, 0))
+            reasons[item['reason']] = (count + 1, size + item['bytes'])
+        
+        lines = [f"• {count} × {reason} ({size / (1024 * 1024):.1f} Mo)"
+                 for reason, (count, size) in reasons.items()]
+        return "\n\nConservés :\n" + "\n".join(lines)
+    
     def ouvrir_dossier_temporaire(self):
         """CORRIGÉ : Ouvre le dossier temporaire avec structure complète"""
         try:
@@ -2279,9 +2297,10 @@ class TraducteurRenPyPro:
             # Appliquer le thème
             theme = THEMES["dark"] if config_manager.is_dark_mode_enabled() else THEMES["light"]
             list_window.configure(bg=theme["bg"])
+            theme_manager.register(list_window)
             
             # En-tête
-            header_frame = tk.Frame(list_window, bg=theme["bg"])
+            header_frame = theme_manager.register(tk.Frame(list_window, bg=theme["bg"]), "background")
             header_frame.pack(fill='x', padx=10, pady=10)
             
             title_label = tk.Label(
@@ -2291,14 +2310,15 @@ class TraducteurRenPyPro:
                 bg=theme["bg"],
                 fg=theme["fg"]
             )
+            theme_manager.register(title_label)
             title_label.pack()
             
             # Liste
-            list_frame = tk.Frame(list_window, bg=theme["bg"])
+            list_frame = theme_manager.register(tk.Frame(list_window, bg=theme["bg"]), "background")
             list_frame.pack(fill='both', expand=True, padx=10, pady=5)
             
             # Listbox avec scrollbar
-            listbox_frame = tk.Frame(list_frame, bg=theme["bg"])
+            listbox_frame = theme_manager.register(tk.Frame(list_frame, bg=theme["bg"]), "background")
             listbox_frame.pack(fill='both', expand=True)
             
             listbox = tk.Listbox(
@@ -2309,6 +2329,7 @@ class TraducteurRenPyPro:
                 selectbackground=theme.get("select_bg", "#007acc"),
                 selectforeground=theme.get("select_fg", "#ffffff")
             )
+            theme_manager.register(listbox, {"bg": "entry_bg", "fg": "entry_fg", "selectbackground": "select_bg", "selectforeground": "select_fg"})
             
             scrollbar_list = tk.Scrollbar(listbox_frame, orient="vertical", command=listbox.yview)
             listbox.configure(yscrollcommand=scrollbar_list.set)
@@ -2328,7 +2349,7 @@ class TraducteurRenPyPro:
                 listbox.selection_set(0)
             
             # Boutons
-            button_frame = tk.Frame(list_window, bg=theme["bg"])
+            button_frame = theme_manager.register(tk.Frame(list_window, bg=theme["bg"]), "background")
             button_frame.pack(fill='x', padx=10, pady=10)
             
             def open_selected():
@@ -2350,6 +2371,7 @@ class TraducteurRenPyPro:
                 fg="#000000",
                 command=open_selected
             )
+            theme_manager.register(btn_open_file, {"bg": "accent"})
             btn_open_file.pack(side='left')
             
             btn_open_folder = tk.Button(
@@ -2368,6 +2390,7 @@ class TraducteurRenPyPro:
                 fg="#000000",
                 command=list_window.destroy
             )
+            theme_manager.register(btn_close, {"bg": "danger"})
             btn_close.pack(side='right')
             
             # Double-clic pour ouvrir
@@ -2393,9 +2416,10 @@ class TraducteurRenPyPro:
             # Appliquer le thème
             theme = THEMES["dark"] if config_manager.is_dark_mode_enabled() else THEMES["light"]
             issues_window.configure(bg=theme["bg"])
+            theme_manager.register(issues_window)
             
             # En-tête
-            header_frame = tk.Frame(issues_window, bg=theme["bg"])
+            header_frame = theme_manager.register(tk.Frame(issues_window, bg=theme["bg"]), "background")
             header_frame.pack(fill='x', padx=10, pady=10)
             
             title_label = tk.Label(
@@ -2405,6 +2429,7 @@ class TraducteurRenPyPro:
                 bg=theme["bg"],
                 fg=theme.get("danger", "#dc3545")
             )
+            theme_manager.register(title_label, {"bg": "bg", "fg": "danger"})
             title_label.pack()
             
             count_label = tk.Label(
@@ -2414,10 +2439,11 @@ class TraducteurRenPyPro:
                 bg=theme["bg"],
                 fg=theme["fg"]
             )
+            theme_manager.register(count_label)
             count_label.pack(pady=(5, 0))
             
             # Zone de texte avec scrollbar
-            text_frame = tk.Frame(issues_window, bg=theme["bg"])
+            text_frame = theme_manager.register(tk.Frame(issues_window, bg=theme["bg"]), "background")
             text_frame.pack(fill='both', expand=True, padx=10, pady=5)
             
             text_area = ScrolledText(
@@ -2429,6 +2455,7 @@ class TraducteurRenPyPro:
                 selectbackground=theme.get("select_bg", "#007acc"),
                 selectforeground=theme.get("select_fg", "#ffffff")
             )
+            theme_manager.register(text_area)
             text_area.pack(fill='both', expand=True)
             
             # Formater et insérer les problèmes
@@ -2458,7 +2485,7 @@ class TraducteurRenPyPro:
             text_area.configure(state='disabled')  # Lecture seule
             
             # Boutons
-            button_frame = tk.Frame(issues_window, bg=theme["bg"])
+            button_frame = theme_manager.register(tk.Frame(issues_window, bg=theme["bg"]), "background")
             button_frame.pack(fill='x', padx=10, pady=10)
             
             info_label = tk.Label(
@@ -2468,6 +2495,7 @@ class TraducteurRenPyPro:
                 bg=theme["bg"],
                 fg=theme["fg"]
             )
+            theme_manager.register(info_label)
             info_label.pack(side='left')
             
             btn_close = tk.Button(
@@ -2478,6 +2506,7 @@ class TraducteurRenPyPro:
                 fg="#000000",
                 command=issues_window.destroy
             )
+            theme_manager.register(btn_close, {"bg": "accent"})
             btn_close.pack(side='right')
             
         except Exception as e:
@@ -2631,6 +2660,7 @@ class TraducteurRenPyPro:
                 return
         
         # Nettoyer les données
+        self._release_file_content()
         self.file_content = []
         self.original_path = None
         self.extraction_results = None
@@ -2642,7 +2672,7 @@ class TraducteurRenPyPro:
             self.source_info = None
         
         # Nettoyer l'interface
-        self.text_area.delete('1.0', tk.END)
+        self.text_preview.clear()
         self.label_chemin.config(text="📄 Aucun fichier sélectionné")
         self.label_stats.config(text="📊 Prêt")
         
@@ -2671,11 +2701,7 @@ class TraducteurRenPyPro:
 
         try:
             log_message("INFO", f"=== FERMETURE DU TRADUCTEUR REN'PY PRO v{VERSION} ===")
-            
-            try:
-                TempFileManager.cleanup_temp_files()
-            except:
-                pass
+            flush_performance_report()
             
             self.root.destroy()
         except Exception as e:
@@ -2709,8 +2735,55 @@ def get_current_game_name():
         return extract_game_name(app_instance.original_path)
     return "Projet_Inconnu"
 
+def run_batch_cli(args):
+    """
+    Traitement par lots sans interface (voir core/batch.py)
+    
+    Exemples:
+        python main.py --batch extract "MonJeu/game/tl/french"
+        python main.py --batch rebuild "MonJeu/game/tl/french" --resume
+    """
+    from core.batch import run_batch
+    
+    def show_progress(index, total, entry, status):
+        print(f"[{index}/{total}] {status:8} {entry['rel_path']}")
+    
+    summary = run_batch(args.dossier, args.batch, resume=args.resume,
+                        save_mode=args.save_mode, progress_callback=show_progress,
+                        workers=args.workers)
+    
+    print(f"\n✅ Lot terminé en {summary['duration']:.2f}s : {summary['processed']} traités, "
+          f"{summary['skipped']} déjà faits, {summary['failed']} en échec")
+    for error in summary['errors']:
+        print(f"❌ {error['path']} : {error['error']}")
+    if summary['checkpoint']:
+        print(f"📝 Journal de reprise : {summary['checkpoint']}")
+    return 1 if summary['failed'] else 0
+
+def parse_arguments(argv=None):
+    """Options de ligne de commande (mode lot)"""
+    import argparse
+    parser = argparse.ArgumentParser(description=f"Traducteur Ren'Py Pro v{VERSION}")
+    parser.add_argument('--batch', choices=['extract', 'rebuild'],
+                        help="Traiter tous les .rpy d'un dossier sans interface")
+    parser.add_argument('dossier', nargs='?', help="Dossier à traiter en mode lot")
+    parser.add_argument('--resume', action='store_true',
+                        help="Reprendre le lot précédent (fichiers terminés et inchangés ignorés)")
+    parser.add_argument('--save-mode', choices=['new_file', 'overwrite'], default='new_file',
+                        help="Mode de sauvegarde de la reconstruction")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Nombre de threads de traitement du lot")
+    args, _ = parser.parse_known_args(argv)
+    if args.batch and not args.dossier:
+        parser.error("--batch nécessite un dossier")
+    return args
+
 def main():
     """Fonction principale"""
+    args = parse_arguments()
+    if args.batch:
+        sys.exit(run_batch_cli(args))
+    
     print("🎬 Lancement de main()")
     app = TraducteurRenPyPro()
     print("✅ Classe instanciée")
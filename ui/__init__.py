@@ -6,7 +6,7 @@ Contient l'interface graphique, les thèmes et le tutoriel
 
 from .themes import theme_manager
 from .tutorial import show_tutorial, check_first_launch
-from .interface import SaveModeDialog, ProgressDialog, AboutDialog
+from .interface import SaveModeDialog, ProgressDialog, AboutDialog, LazyTextPreview
 
 __all__ = [
     'theme_manager',
@@ -14,5 +14,6 @@ __all__ = [
     'check_first_launch',
     'SaveModeDialog',
     'ProgressDialog', 
-    'AboutDialog'
+    'AboutDialog',
+    'LazyTextPreview'
 ]
\ No newline at end of file
@@ -51,6 +51,7 @@ class BackupDialog:
         # Appliquer le thème
         theme = theme_manager.get_dialog_theme()
         self.dialog.configure(bg=theme["bg"])
+        theme_manager.register(self.dialog)
         
         self._create_content(theme)
         self._load_backups()
@@ -58,7 +59,7 @@ class BackupDialog:
     def _create_content(self, theme):
         """Crée le contenu du dialogue"""
         # En-tête
-        header_frame = tk.Frame(self.dialog, bg=theme["bg"])
+        header_frame = theme_manager.register(tk.Frame(self.dialog, bg=theme["bg"]), "background")
         header_frame.pack(fill='x', padx=20, pady=20)
         
         title_label = tk.Label(
@@ -68,6 +69,7 @@ class BackupDialog:
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(title_label)
         title_label.pack()
         
         # ✅ CORRECTION : Afficher le jeu détecté
@@ -79,16 +81,17 @@ class BackupDialog:
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(info_label)
         info_label.pack(pady=(5, 0))
         
         # Frame principal avec scrollbar
-        main_frame = tk.Frame(self.dialog, bg=theme["bg"])
+        main_frame = theme_manager.register(tk.Frame(self.dialog, bg=theme["bg"]), "background")
         main_frame.pack(fill='both', expand=True, padx=20)
         
         # Canvas et scrollbar pour la liste des sauvegardes
-        canvas = tk.Canvas(main_frame, bg=theme["frame_bg"], highlightthickness=0)
+        canvas = theme_manager.register(tk.Canvas(main_frame, bg=theme["frame_bg"], highlightthickness=0), {"bg": "frame_bg"})
         scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-        self.scrollable_frame = tk.Frame(canvas, bg=theme["frame_bg"])
+        self.scrollable_frame = theme_manager.register(tk.Frame(canvas, bg=theme["frame_bg"]))
         
         self.scrollable_frame.bind(
             "<Configure>",
@@ -109,10 +112,11 @@ class BackupDialog:
             bg=theme["frame_bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(self.no_backup_label, "stats_label")
         self.no_backup_label.pack(pady=50)
         
         # Boutons en bas
-        button_frame = tk.Frame(self.dialog, bg=theme["bg"])
+        button_frame = theme_manager.register(tk.Frame(self.dialog, bg=theme["bg"]), "background")
         button_frame.pack(fill='x', padx=20, pady=(0, 20))
         
         # Bouton actualiser
@@ -128,6 +132,7 @@ class BackupDialog:
             padx=15,
             command=self._refresh_backups
         )
+        theme_manager.register(refresh_btn, {"bg": "accent"})
         refresh_btn.pack(side='left')
         
         # Bouton fermer
@@ -143,6 +148,7 @@ class BackupDialog:
             padx=15,
             command=self.dialog.destroy
         )
+        theme_manager.register(close_btn, {"bg": "danger"})
         close_btn.pack(side='right')
         
         # Permettre le scroll avec la molette
@@ -182,7 +188,8 @@ class BackupDialog:
                 return backups
             
             # Obtenir le nom de base du fichier pour filtrer les sauvegardes
-            base_name = os.path.splitext(os.path.basename(self.filepath))[0]
+            from core.extraction import get_file_base_name
+            base_name = get_file_base_name(self.filepath)
             
             # Lister tous les fichiers dans le dossier de sauvegarde
             for filename in os.listdir(backup_folder):
@@ -233,6 +240,7 @@ class BackupDialog:
             bg=theme["frame_bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(loading_label, "stats_label")
         loading_label.pack(pady=50)
         
         self.dialog.update()
@@ -262,6 +270,7 @@ class BackupDialog:
                 fg=theme["fg"],
                 justify='center'
             )
+            theme_manager.register(no_backup_label, "stats_label")
             no_backup_label.pack(pady=50)
             return
         
@@ -278,14 +287,15 @@ class BackupDialog:
             relief='solid', 
             bd=1
         )
+        theme_manager.register(item_frame, "background")
         item_frame.pack(fill='x', padx=10, pady=5)
         
         # Frame d'informations
-        info_frame = tk.Frame(item_frame, bg=theme["bg"])
+        info_frame = theme_manager.register(tk.Frame(item_frame, bg=theme["bg"]), "background")
         info_frame.pack(fill='x', padx=15, pady=10)
         
         # Icône et nom
-        name_frame = tk.Frame(info_frame, bg=theme["bg"])
+        name_frame = theme_manager.register(tk.Frame(info_frame, bg=theme["bg"]), "background")
         name_frame.pack(fill='x')
         
         # Icône selon le type de sauvegarde
@@ -298,6 +308,7 @@ class BackupDialog:
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(icon_label)
         icon_label.pack(side='left')
         
         name_label = tk.Label(
@@ -307,10 +318,11 @@ class BackupDialog:
             bg=theme["bg"],
             fg=theme["accent"]
         )
+        theme_manager.register(name_label, {"bg": "bg", "fg": "accent"})
         name_label.pack(side='left', padx=(5, 0))
         
         # Informations détaillées
-        details_frame = tk.Frame(info_frame, bg=theme["bg"])
+        details_frame = theme_manager.register(tk.Frame(info_frame, bg=theme["bg"]), "background")
         details_frame.pack(fill='x', pady=(5, 0))
         
         # Date de création
@@ -322,6 +334,7 @@ class BackupDialog:
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(created_label)
         created_label.pack(anchor='w')
         
         # Taille du fichier
@@ -333,6 +346,7 @@ class BackupDialog:
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(size_label)
         size_label.pack(anchor='w')
         
         # Jeu associé
@@ -343,6 +357,7 @@ class BackupDialog:
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(game_label)
         game_label.pack(anchor='w')
         
         # Ancienneté
@@ -361,10 +376,11 @@ class BackupDialog:
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(age_label)
         age_label.pack(anchor='w')
         
         # Boutons d'action
-        action_frame = tk.Frame(item_frame, bg=theme["bg"])
+        action_frame = theme_manager.register(tk.Frame(item_frame, bg=theme["bg"]), "background")
         action_frame.pack(fill='x', padx=15, pady=(0, 10))
         
         # Bouton restaurer
@@ -380,6 +396,7 @@ class BackupDialog:
             padx=12,
             command=lambda: self._restore_backup(backup)
         )
+        theme_manager.register(restore_btn, {"bg": "accent"})
         restore_btn.pack(side='left', padx=(0, 10))
         
         # Bouton supprimer
@@ -395,6 +412,7 @@ class BackupDialog:
             padx=12,
             command=lambda: self._delete_backup(backup)
         )
+        theme_manager.register(delete_btn, {"bg": "danger"})
         delete_btn.pack(side='left')
         
         # Badge "plus récent" pour la première sauvegarde
@@ -408,6 +426,7 @@ class BackupDialog:
                 padx=8,
                 pady=2
             )
+            theme_manager.register(recent_badge, {"bg": "warning"})
             recent_badge.pack(side='right')
         
         # Badge type de sauvegarde
@@ -421,6 +440,7 @@ class BackupDialog:
                 padx=8,
                 pady=2
             )
+            theme_manager.register(safety_badge, {"bg": "accent"})
             safety_badge.pack(side='right', padx=(0, 10))
     
     def _restore_backup(self, backup):
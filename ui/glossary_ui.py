@@ -12,7 +12,8 @@ import os
 from collections import OrderedDict
 from core.glossary import glossary_manager
 from utils.logging import log_message
-from utils.constants import FOLDERS
+from utils.constants import FOLDERS, GLOSSARY_SEARCH
+from ui.themes import theme_manager
 
 class GlossaryDialog:
     """Dialogue de gestion du glossaire"""
@@ -33,6 +34,12 @@ class GlossaryDialog:
         self.original_var = tk.StringVar()
         self.translation_var = tk.StringVar()
         self.selected_item = None
+        
+        # Liste affichée : résultats complets, lignes insérées (original -> traduction)
+        self.results = []
+        self.shown_rows = {}
+        self.visible_count = GLOSSARY_SEARCH["page_rows"]
+        self._search_job = None
 
     def show(self):
         """Affiche le dialogue du glossaire"""
@@ -56,6 +63,7 @@ class GlossaryDialog:
         from utils.constants import THEMES
         theme = THEMES["dark"] if config_manager.is_dark_mode_enabled() else THEMES["light"]
         self.dialog.configure(bg=theme["bg"])
+        theme_manager.register(self.dialog)
         
         self.create_interface(theme)
         self.refresh_glossary_list()
@@ -66,7 +74,7 @@ class GlossaryDialog:
     def create_interface(self, theme):
         """Crée l'interface du gestionnaire de glossaire"""
         # En-tête
-        header_frame = tk.Frame(self.dialog, bg=theme["bg"])
+        header_frame = theme_manager.register(tk.Frame(self.dialog, bg=theme["bg"]), "background")
         header_frame.pack(fill='x', padx=10, pady=10)
         
         title_label = tk.Label(
@@ -76,6 +84,7 @@ class GlossaryDialog:
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(title_label)
         title_label.pack(side='left')
         
         # Statistiques
@@ -87,10 +96,11 @@ class GlossaryDialog:
             bg=theme["bg"],
             fg=theme["accent"]
         )
+        theme_manager.register(stats_label, {"bg": "bg", "fg": "accent"})
         stats_label.pack(side='right')
         
         # Barre de recherche
-        search_frame = tk.Frame(self.dialog, bg=theme["bg"])
+        search_frame = theme_manager.register(tk.Frame(self.dialog, bg=theme["bg"]), "background")
         search_frame.pack(fill='x', padx=10, pady=5)
         
         search_label = tk.Label(
@@ -100,6 +110,7 @@ class GlossaryDialog:
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(search_label)
         search_label.pack(side='left')
         
         self.search_entry = tk.Entry(
@@ -111,14 +122,15 @@ class GlossaryDialog:
             relief='flat',
             bd=5
         )
+        theme_manager.register(self.search_entry, "entry")
         self.search_entry.pack(side='left', fill='x', expand=True, padx=(10, 0))
         
         # Frame principal avec deux colonnes
-        main_frame = tk.Frame(self.dialog, bg=theme["bg"])
+        main_frame = theme_manager.register(tk.Frame(self.dialog, bg=theme["bg"]), "background")
         main_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
         # Colonne gauche : Liste du glossaire
-        left_frame = tk.Frame(main_frame, bg=theme["bg"])
+        left_frame = theme_manager.register(tk.Frame(main_frame, bg=theme["bg"]), "background")
         left_frame.pack(side='left', fill='both', expand=True)
         
         list_label = tk.Label(
@@ -128,6 +140,7 @@ class GlossaryDialog:
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(list_label)
         list_label.pack(anchor='w', pady=(0, 5))
         
         # Treeview pour la liste
@@ -144,19 +157,19 @@ class GlossaryDialog:
         self.tree.column('original', width=200)
         self.tree.column('translation', width=200)
         
-        # Scrollbar pour la liste
-        tree_scrollbar = ttk.Scrollbar(left_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=tree_scrollbar.set)
+        # Scrollbar pour la liste (les lignes suivantes sont insérées en arrivant en bas)
+        self.tree_scrollbar = ttk.Scrollbar(left_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.on_tree_scroll)
         
         self.tree.pack(side='left', fill='both', expand=True)
-        tree_scrollbar.pack(side='right', fill='y')
+        self.tree_scrollbar.pack(side='right', fill='y')
         
         # Événements pour la sélection
         self.tree.bind('<<TreeviewSelect>>', self.on_item_select)
         self.tree.bind('<Double-1>', self.on_item_double_click)
         
         # Colonne droite : Édition
-        right_frame = tk.Frame(main_frame, bg=theme["bg"], width=300)
+        right_frame = theme_manager.register(tk.Frame(main_frame, bg=theme["bg"], width=300), "background")
         right_frame.pack(side='right', fill='y', padx=(10, 0))
         right_frame.pack_propagate(False)
         
@@ -167,6 +180,7 @@ class GlossaryDialog:
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(edit_label)
         edit_label.pack(anchor='w', pady=(0, 10))
         
         # Champ Original
@@ -177,6 +191,7 @@ class GlossaryDialog:
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(original_label)
         original_label.pack(anchor='w')
         
         self.original_entry = tk.Entry(
@@ -188,6 +203,7 @@ class GlossaryDialog:
             relief='flat',
             bd=5
         )
+        theme_manager.register(self.original_entry, "entry")
         self.original_entry.pack(fill='x', pady=(0, 10))
         
         # Champ Traduction
@@ -198,6 +214,7 @@ class GlossaryDialog:
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(translation_label)
         translation_label.pack(anchor='w')
         
         self.translation_entry = tk.Entry(
@@ -209,10 +226,11 @@ class GlossaryDialog:
             relief='flat',
             bd=5
         )
+        theme_manager.register(self.translation_entry, "entry")
         self.translation_entry.pack(fill='x', pady=(0, 15))
         
         # Boutons d'édition
-        button_frame = tk.Frame(right_frame, bg=theme["bg"])
+        button_frame = theme_manager.register(tk.Frame(right_frame, bg=theme["bg"]), "background")
         button_frame.pack(fill='x', pady=(0, 10))
         
         add_btn = tk.Button(
@@ -226,6 +244,7 @@ class GlossaryDialog:
             pady=8,
             command=self.add_entry
         )
+        theme_manager.register(add_btn, {"bg": "accent"})
         add_btn.pack(fill='x', pady=(0, 5))
         
         update_btn = tk.Button(
@@ -239,6 +258,7 @@ class GlossaryDialog:
             pady=8,
             command=self.update_entry
         )
+        theme_manager.register(update_btn, {"bg": "warning"})
         update_btn.pack(fill='x', pady=(0, 5))
         
         delete_btn = tk.Button(
@@ -252,6 +272,7 @@ class GlossaryDialog:
             pady=8,
             command=self.delete_entry
         )
+        theme_manager.register(delete_btn, {"bg": "danger"})
         delete_btn.pack(fill='x', pady=(0, 5))
         
         clear_btn = tk.Button(
@@ -272,7 +293,7 @@ class GlossaryDialog:
         separator.pack(fill='x', pady=10)
         
         # Boutons d'import/export
-        io_frame = tk.Frame(right_frame, bg=theme["bg"])
+        io_frame = theme_manager.register(tk.Frame(right_frame, bg=theme["bg"]), "background")
         io_frame.pack(fill='x', pady=(0, 10))
         
         export_btn = tk.Button(
@@ -315,7 +336,7 @@ class GlossaryDialog:
         validate_btn.pack(fill='x')
         
         # Boutons de fermeture
-        close_frame = tk.Frame(self.dialog, bg=theme["bg"])
+        close_frame = theme_manager.register(tk.Frame(self.dialog, bg=theme["bg"]), "background")
         close_frame.pack(fill='x', padx=10, pady=10)
         
         # help_btn = tk.Button(
@@ -344,46 +365,82 @@ class GlossaryDialog:
             padx=15,
             command=self.on_close
         )
+        theme_manager.register(close_btn, {"bg": "accent"})
         close_btn.pack(side='right')
     
     def refresh_glossary_list(self):
-        """Actualise la liste du glossaire"""
-        # Vider la liste
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Ajouter les entrées
-        entries = glossary_manager.get_all_entries()
-        for original, translation in entries.items():
-            self.tree.insert('', 'end', values=(original, translation))
-    
-    def on_search_change(self, *args):
-        """Gestionnaire de changement de recherche"""
+        """Actualise la liste du glossaire (filtrée par la recherche en cours)"""
         search_term = self.search_var.get()
-        
-        # Vider la liste
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Filtrer et afficher
         if search_term:
-            results = glossary_manager.search_entries(search_term)
-            for original, translation in results:
-                self.tree.insert('', 'end', values=(original, translation))
+            self.results = glossary_manager.search_entries(search_term)
         else:
-            self.refresh_glossary_list()
+            self.results = list(glossary_manager.glossary.items())
+        self.update_visible_rows()
+    
+    def on_search_change(self, *args):
+        """Gestionnaire de changement de recherche : cherche après une pause de frappe"""
+        if not self.dialog:
+            return
+        if self._search_job is not None:
+            self.dialog.after_cancel(self._search_job)
+        self._search_job = self.dialog.after(GLOSSARY_SEARCH["debounce_ms"], self.apply_search)
+    
+    def apply_search(self):
+        """Affiche les résultats de la recherche en cours depuis le début de la liste"""
+        self._search_job = None
+        self.visible_count = GLOSSARY_SEARCH["page_rows"]
+        self.refresh_glossary_list()
+        children = self.tree.get_children()
+        if children:
+            self.tree.see(children[0])
+    
+    def update_visible_rows(self):
+        """
+        Met la liste à jour avec les premières lignes des résultats
+        
+        Seules les lignes qui changent sont supprimées, insérées ou modifiées :
+        les lignes déjà affichées restent dans l'ordre du glossaire.
+        """
+        rows = self.results[:self.visible_count]
+        wanted = dict(rows)
+        
+        removed = [original for original in self.shown_rows if original not in wanted]
+        if removed:
+            self.tree.delete(*removed)
+            for original in removed:
+                del self.shown_rows[original]
+        
+        for position, (original, translation) in enumerate(rows):
+            shown = self.shown_rows.get(original)
+            if shown is None:
+                self.tree.insert('', position, iid=original, values=(original, translation))
+            elif shown != translation:
+                self.tree.item(original, values=(original, translation))
+            self.shown_rows[original] = translation
+        
+        # Ordre inattendu (glossaire retrié autrement) : reconstruire la liste
+        if list(self.tree.get_children()) != [original for original, _ in rows]:
+            self.tree.delete(*self.tree.get_children())
+            for original, translation in rows:
+                self.tree.insert('', 'end', iid=original, values=(original, translation))
+    
+    def on_tree_scroll(self, first, last):
+        """yscrollcommand de la liste : insère la page suivante près du bas"""
+        self.tree_scrollbar.set(first, last)
+        if float(last) >= 1.0 and self.visible_count < len(self.results):
+            self.visible_count += GLOSSARY_SEARCH["page_rows"]
+            self.dialog.after_idle(self.update_visible_rows)
     
     def on_item_select(self, event):
         """Gestionnaire de sélection d'élément"""
         selection = self.tree.selection()
         if selection:
-            item = self.tree.item(selection[0])
-            values = item['values']
-            
-            if values:
-                self.original_var.set(values[0])
-                self.translation_var.set(values[1])
-                self.selected_item = values[0]
+            # L'identifiant de ligne est l'original (les values Tk convertissent les nombres)
+            original = selection[0]
+            if original in self.shown_rows:
+                self.original_var.set(original)
+                self.translation_var.set(self.shown_rows[original])
+                self.selected_item = original
     
     def on_item_double_click(self, event):
         """Gestionnaire de double-clic"""
@@ -552,6 +609,9 @@ Le glossaire permet de traduire automatiquement des termes récurrents comme "Si
     
     def on_close(self):
         """Gestionnaire de fermeture"""
+        if self._search_job is not None:
+            self.dialog.after_cancel(self._search_job)
+            self._search_job = None
         self.dialog.destroy()
 
 def show_glossary_manager(parent):
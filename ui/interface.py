@@ -8,7 +8,7 @@ Module des composants d'interface utilisateur
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from utils.constants import VERSION, MESSAGES
+from utils.constants import VERSION, MESSAGES, PREVIEW_CONFIG
 from ui.themes import theme_manager
 
 class SaveModeDialog:
@@ -42,6 +42,7 @@ class SaveModeDialog:
         # Appliquer le thème
         theme = theme_manager.get_dialog_theme()
         self.dialog.configure(bg=theme["bg"])
+        theme_manager.register(self.dialog)
         
         self._create_content(theme)
         
@@ -52,7 +53,7 @@ class SaveModeDialog:
     def _create_content(self, theme):
         """Crée le contenu du dialogue"""
         # Titre
-        title_frame = tk.Frame(self.dialog, bg=theme["bg"])
+        title_frame = theme_manager.register(tk.Frame(self.dialog, bg=theme["bg"]), "background")
         title_frame.pack(fill='x', padx=20, pady=20)
         
         title_label = tk.Label(
@@ -62,6 +63,7 @@ class SaveModeDialog:
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(title_label)
         title_label.pack()
         
         subtitle_label = tk.Label(
@@ -71,10 +73,11 @@ class SaveModeDialog:
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(subtitle_label)
         subtitle_label.pack(pady=(5, 0))
         
         # Options
-        options_frame = tk.Frame(self.dialog, bg=theme["bg"])
+        options_frame = theme_manager.register(tk.Frame(self.dialog, bg=theme["bg"]), "background")
         options_frame.pack(fill='both', expand=True, padx=20)
         
         # Option 1: Écraser
@@ -82,7 +85,7 @@ class SaveModeDialog:
             options_frame, theme, 
             "🔄 Écraser le fichier original",
             "⚠️ Le fichier original sera remplacé par la traduction",
-            theme["warning"], '#000000',
+            {"bg": "warning"},
             lambda: self._choose_mode('overwrite')
         )
         
@@ -91,7 +94,7 @@ class SaveModeDialog:
             options_frame, theme,
             "📝 Créer un nouveau fichier", 
             "✅ Garde l'original et crée un fichier traduit séparé\n💡 L'original sera automatiquement commenté",
-            theme["accent"], theme["button_fg"],
+            {"bg": "accent", "fg": "button_fg"},
             lambda: self._choose_mode('new_file')
         )
         
@@ -107,23 +110,30 @@ class SaveModeDialog:
             pady=8,
             command=self.dialog.destroy
         )
+        theme_manager.register(cancel_btn, {"bg": "danger"})
         cancel_btn.pack(pady=10)
     
-    def _create_option(self, parent, theme, title, description, bg_color, fg_color, command):
-        """Crée une option de sauvegarde"""
-        option_frame = tk.Frame(parent, bg=theme["frame_bg"], relief='solid', bd=1)
+    def _create_option(self, parent, theme, title, description, button_colors, command):
+        """
+        Crée une option de sauvegarde
+        
+        Args:
+            button_colors (dict): Options du bouton -> clés du thème (texte noir par défaut)
+        """
+        option_frame = theme_manager.register(tk.Frame(parent, bg=theme["frame_bg"], relief='solid', bd=1))
         option_frame.pack(fill='x', pady=10)
         
         btn = tk.Button(
             option_frame,
             text=title,
             font=('Segoe UI Emoji', 11, 'bold'),
-            bg=bg_color,
-            fg=fg_color,
+            fg='#000000',
             bd=0,
             pady=15,
             command=command
         )
+        btn.configure(**{option: theme[key] for option, key in button_colors.items()})
+        theme_manager.register(btn, button_colors)
         btn.pack(fill='x', padx=10, pady=10)
         
         desc = tk.Label(
@@ -134,6 +144,7 @@ class SaveModeDialog:
             fg=theme["fg"],
             justify='left'
         )
+        theme_manager.register(desc, "stats_label")
         desc.pack(pady=(0, 10))
     
     def _choose_mode(self, mode):
@@ -173,9 +184,10 @@ class ProgressDialog:
         # Appliquer le thème
         theme = theme_manager.get_dialog_theme()
         self.dialog.configure(bg=theme["bg"])
+        theme_manager.register(self.dialog)
         
         # Contenu
-        main_frame = tk.Frame(self.dialog, bg=theme["bg"])
+        main_frame = theme_manager.register(tk.Frame(self.dialog, bg=theme["bg"]), "background")
         main_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Message
@@ -187,6 +199,7 @@ class ProgressDialog:
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(message_label)
         message_label.pack(pady=(0, 20))
         
         # Barre de progression indéterminée
@@ -269,6 +282,129 @@ class StatusBar:
         theme_manager.apply_to_widget(self.status_label, "stats_label")
         theme_manager.apply_to_widget(self.time_label, "stats_label")
 
+class LazyTextPreview:
+    """
+    Aperçu par fenêtre d'une séquence de lignes dans une zone de texte
+    
+    Seules les lignes proches de la partie visible sont insérées dans le
+    widget Text. Les tranches suivantes (ou précédentes) sont ajoutées pendant
+    le défilement et celles qui s'éloignent sont retirées : le widget ne
+    contient jamais plus de PREVIEW_CONFIG["max_lines"] lignes. Le contenu
+    complet reste dans la séquence d'origine (file_content).
+    """
+    
+    def __init__(self, text_widget, scrollbar=None):
+        """
+        Args:
+            text_widget (tk.Text): Zone de texte (ScrolledText)
+            scrollbar (tk.Scrollbar, optional): Barre de défilement à tenir à jour
+                                                (celle du ScrolledText par défaut)
+        """
+        self.text_widget = text_widget
+        self.scrollbar = scrollbar or getattr(text_widget, 'vbar', None)
+        self.lines = None
+        self.start = 0  # Index de la première ligne insérée dans le widget
+        self.end = 0    # Index suivant la dernière ligne insérée
+        self._fetch_pending = False
+        
+        text_widget.configure(yscrollcommand=self._on_scroll)
+    
+    def load(self, lines):
+        """
+        Affiche le début d'une séquence de lignes
+        
+        Args:
+            lines (list | MappedTextFile | LineOverlay): Lignes (conservées par référence)
+        """
+        self.lines = lines
+        self.start = 0
+        self.end = min(len(lines), PREVIEW_CONFIG["window_lines"])
+        
+        self.text_widget.delete('1.0', tk.END)
+        self.text_widget.insert('1.0', ''.join(lines[:self.end]))
+    
+    def clear(self):
+        """Vide la zone de texte et oublie la séquence affichée"""
+        self.lines = None
+        self.start = self.end = 0
+        self.text_widget.delete('1.0', tk.END)
+    
+    def _on_scroll(self, first, last):
+        """yscrollcommand : met à jour la barre et programme le chargement près d'un bord"""
+        if self.scrollbar is not None:
+            self.scrollbar.set(first, last)
+        
+        if self.lines is None or self._fetch_pending:
+            return
+        if self._needs_lines_below(float(last)) or self._needs_lines_above(float(first)):
+            self._fetch_pending = True
+            self.text_widget.after_idle(self._fetch)
+    
+    def _needs_lines_below(self, last):
+        return last >= 1 - PREVIEW_CONFIG["margin"] and self.end < len(self.lines)
+    
+    def _needs_lines_above(self, first):
+        return first <= PREVIEW_CONFIG["margin"] and self.start > 0
+    
+    def _top_line(self):
+        """Numéro (widget) de la première ligne visible"""
+        return int(self.text_widget.index('@0,0').split('.')[0])
+    
+    def _fetch(self):
+        """Ajoute une tranche de lignes du côté où se trouve la vue"""
+        self._fetch_pending = False
+        if self.lines is None:
+            return
+        
+        widget = self.text_widget
+        try:
+            first, last = widget.yview()
+            # Une zone en lecture seule refuse insert/delete
+            state = widget.cget('state')
+            widget.configure(state='normal')
+            try:
+                if self._needs_lines_below(last):
+                    self._extend_below()
+                elif self._needs_lines_above(first):
+                    self._extend_above()
+            finally:
+                widget.configure(state=state)
+        except tk.TclError:
+            # Widget détruit entre-temps (fenêtre fermée pendant un rappel en attente)
+            self.lines = None
+    
+    def _extend_below(self):
+        widget = self.text_widget
+        top = self._top_line()
+        new_end = min(len(self.lines), self.end + PREVIEW_CONFIG["chunk_lines"])
+        widget.insert(tk.END, ''.join(self.lines[self.end:new_end]))
+        self.end = new_end
+        
+        excess = self.end - self.start - PREVIEW_CONFIG["max_lines"]
+        if excess > 0:
+            # Les lignes retirées en haut décalent la numérotation du widget
+            removed = sum(line.count('\n') for line in self.lines[self.start:self.start + excess])
+            widget.delete('1.0', f'{removed + 1}.0')
+            self.start += excess
+            widget.yview(f'{max(top - removed, 1)}.0')
+    
+    def _extend_above(self):
+        widget = self.text_widget
+        top = self._top_line()
+        new_start = max(0, self.start - PREVIEW_CONFIG["chunk_lines"])
+        chunk = ''.join(self.lines[new_start:self.start])
+        added = chunk.count('\n')
+        widget.insert('1.0', chunk)
+        self.start = new_start
+        
+        excess = self.end - self.start - PREVIEW_CONFIG["max_lines"]
+        if excess > 0:
+            self.end -= excess
+            kept = sum(line.count('\n') for line in self.lines[self.start:self.end])
+            widget.delete(f'{kept + 1}.0', tk.END)
+        # Garder à l'écran les mêmes lignes qu'avant l'ajout
+        widget.yview(f'{top + added}.0')
+
 class ValidationResultDialog:
     """Dialogue pour afficher les résultats de validation"""
     
@@ -18,6 +18,8 @@ class ThemeManager:
         self.current_theme = "dark"
         self.style = None
         self._initialized = False
+        # Widgets thématisés : chemin Tk -> (widget, type), mis à jour à chaque changement de thème
+        self._registered_widgets = {}
     
     def _ensure_initialized(self):
         """S'assure que le gestionnaire est initialisé (lazy loading) - VERSION CORRIGÉE"""
@@ -55,6 +57,7 @@ class ThemeManager:
             self.current_theme = theme_name
             if self._ensure_initialized():
                 self.apply_current_theme()
+            self.apply_to_registered()
     
     def get_theme(self, theme_name=None):
         """Récupère un thème spécifique ou le thème actuel"""
@@ -95,9 +98,16 @@ class ThemeManager:
         
         theme = self.get_theme()
         try:
+            # Type explicite : option du widget -> clé du thème (ex. {"bg": "accent"})
+            if isinstance(widget_type, dict):
+                widget.configure(**{option: theme[key] for option, key in widget_type.items()})
+                
             # —— Widgets Tkinter natifs ——
-            if isinstance(widget, tk.Frame) and not isinstance(widget, ttk.Frame):
-                widget.configure(bg=theme["frame_bg"])
+            elif isinstance(widget, tk.Frame) and not isinstance(widget, ttk.Frame):
+                if widget_type == "background":
+                    widget.configure(bg=theme["bg"])
+                else:
+                    widget.configure(bg=theme["frame_bg"])
                 
             elif isinstance(widget, tk.Label) and not isinstance(widget, ttk.Label):
                 if widget_type == "title":
@@ -122,6 +132,13 @@ class ThemeManager:
                     highlightcolor=theme["accent"]
                 )
                 
+            elif isinstance(widget, tk.Entry) and not isinstance(widget, ttk.Entry):
+                widget.configure(
+                    bg=theme["entry_bg"],
+                    fg=theme["entry_fg"],
+                    insertbackground=theme["entry_fg"]
+                )
+                
             elif isinstance(widget, tk.Button) and not isinstance(widget, ttk.Button):
                 # ✅ CORRECTION : Adapter les couleurs selon le thème
                 current_bg = widget.cget("bg")
@@ -157,6 +174,50 @@ class ThemeManager:
         except Exception as e:
             print(f"⚠️ ThemeManager: Erreur apply_to_widget: {e}")
     
+    def register(self, widget, widget_type="default"):
+        """
+        Enregistre un widget à mettre à jour lors des changements de thème
+        
+        Args:
+            widget: Widget Tkinter créé avec les couleurs du thème actuel
+            widget_type (str | dict): Type transmis à apply_to_widget, ou options
+                                      du widget -> clés du thème (ex. {"fg": "accent"})
+        
+        Returns:
+            Le widget (pour enregistrer à la création)
+        """
+        if widget is not None:
+            # Un widget recréé au même chemin remplace l'ancien
+            self._registered_widgets[str(widget)] = (widget, widget_type)
+        return widget
+    
+    def unregister(self, widget):
+        """Retire un widget du registre"""
+        self._registered_widgets.pop(str(widget), None)
+    
+    def apply_to_registered(self):
+        """
+        Applique le thème actuel aux seuls widgets enregistrés
+        
+        Les widgets détruits depuis leur enregistrement sont retirés du registre.
+        
+        Returns:
+            int: Nombre de widgets mis à jour
+        """
+        updated = 0
+        for path, (widget, widget_type) in list(self._registered_widgets.items()):
+            try:
+                exists = widget.winfo_exists()
+            except Exception:
+                exists = False
+            if not exists:
+                del self._registered_widgets[path]
+                continue
+            
+            self.apply_to_widget(widget, widget_type)
+            updated += 1
+        return updated
+    
     def get_dialog_theme(self):
         """Récupère la configuration de thème pour les dialogues"""
         theme = self.get_theme()
@@ -13,6 +13,7 @@ from tkinter import messagebox, ttk
 from utils.constants import VERSION, THEMES, FILE_NAMES, ensure_folders_exist
 from utils.config import config_manager
 from utils.logging import log_message
+from ui.themes import theme_manager
 
 def check_first_launch():
     """
@@ -61,18 +62,19 @@ def show_tutorial():
     # Appliquer le thème
     theme = THEMES["dark"] if config_manager.is_dark_mode_enabled() else THEMES["light"]
     tutorial_window.configure(bg=theme["bg"])
+    theme_manager.register(tutorial_window)
     
     # Variable pour la checkbox
     dont_show_again = tk.BooleanVar()
     
     # Frame principal avec scrollbar
-    main_frame = tk.Frame(tutorial_window, bg=theme["bg"])
+    main_frame = theme_manager.register(tk.Frame(tutorial_window, bg=theme["bg"]), "background")
     main_frame.pack(fill='both', expand=True, padx=20, pady=20)
     
     # Canvas et scrollbar
-    canvas = tk.Canvas(main_frame, bg=theme["bg"], highlightthickness=0)
+    canvas = theme_manager.register(tk.Canvas(main_frame, bg=theme["bg"], highlightthickness=0))
     scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-    scrollable_frame = tk.Frame(canvas, bg=theme["bg"])
+    scrollable_frame = theme_manager.register(tk.Frame(canvas, bg=theme["bg"]), "background")
     
     scrollable_frame.bind(
         "<Configure>",
@@ -83,7 +85,7 @@ def show_tutorial():
     canvas.configure(yscrollcommand=scrollbar.set)
     
     # Header
-    header_frame = tk.Frame(scrollable_frame, bg=theme["bg"])
+    header_frame = theme_manager.register(tk.Frame(scrollable_frame, bg=theme["bg"]), "background")
     header_frame.pack(fill='x', pady=(0, 20))
     
     title_tutorial = tk.Label(
@@ -93,6 +95,7 @@ def show_tutorial():
         bg=theme["bg"],
         fg=theme["accent"]
     )
+    theme_manager.register(title_tutorial, {"bg": "bg", "fg": "accent"})
     title_tutorial.pack()
     
     subtitle_tutorial = tk.Label(
@@ -102,10 +105,11 @@ def show_tutorial():
         bg=theme["bg"],
         fg=theme["fg"]
     )
+    theme_manager.register(subtitle_tutorial)
     subtitle_tutorial.pack(pady=(5, 0))
     
     # Notification de non-blocage
-    notice_frame = tk.Frame(scrollable_frame, bg=theme["warning"], relief='solid', bd=2)
+    notice_frame = theme_manager.register(tk.Frame(scrollable_frame, bg=theme["warning"], relief='solid', bd=2), {"bg": "warning"})
     notice_frame.pack(fill='x', pady=(0, 20))
     
     notice_label = tk.Label(
@@ -116,6 +120,7 @@ def show_tutorial():
         fg='#000000',
         wraplength=800
     )
+    theme_manager.register(notice_label, {"bg": "warning"})
     notice_label.pack(pady=10)
     
     # ==================== CONTENU DU TUTORIEL ACTUALISÉ ====================
@@ -331,15 +336,15 @@ def show_tutorial():
     # ==================== FIN DU CONTENU ====================
     
     # Separator
-    separator_frame = tk.Frame(scrollable_frame, bg=theme["bg"], height=2)
+    separator_frame = theme_manager.register(tk.Frame(scrollable_frame, bg=theme["bg"], height=2), "background")
     separator_frame.pack(fill='x', pady=15)
     
     # Frame pour les contrôles du bas
-    bottom_frame = tk.Frame(scrollable_frame, bg=theme["bg"])
+    bottom_frame = theme_manager.register(tk.Frame(scrollable_frame, bg=theme["bg"]), "background")
     bottom_frame.pack(fill='x', pady=(0, 15))
     
     # Checkbox "Ne plus afficher"
-    checkbox_frame = tk.Frame(bottom_frame, bg=theme["bg"])
+    checkbox_frame = theme_manager.register(tk.Frame(bottom_frame, bg=theme["bg"]), "background")
     checkbox_frame.pack(side='left')
     
     checkbox = tk.Checkbutton(
@@ -353,10 +358,11 @@ def show_tutorial():
         activebackground=theme["bg"],
         activeforeground=theme["fg"]
     )
+    theme_manager.register(checkbox, {"bg": "bg", "fg": "fg", "selectcolor": "frame_bg", "activebackground": "bg", "activeforeground": "fg"})
     checkbox.pack()
     
     # Boutons
-    buttons_frame = tk.Frame(bottom_frame, bg=theme["bg"])
+    buttons_frame = theme_manager.register(tk.Frame(bottom_frame, bg=theme["bg"]), "background")
     buttons_frame.pack(side='right')
     
     def close_tutorial():
@@ -379,6 +385,7 @@ def show_tutorial():
         padx=25,
         command=close_tutorial
     )
+    theme_manager.register(btn_close, {"bg": "accent"})
     btn_close.pack(side='right', padx=(10, 0))
     
     btn_later = tk.Button(
@@ -393,6 +400,7 @@ def show_tutorial():
         padx=15,
         command=open_tutorial_again
     )
+    theme_manager.register(btn_later, {"bg": "warning"})
     btn_later.pack(side='right')
     
     # Configurer le canvas et scrollbar
@@ -440,7 +448,7 @@ def create_section(parent, theme, title, items):
         items: Liste des éléments de la section
     """
     try:
-        section_frame = tk.Frame(parent, bg=theme["frame_bg"], relief='solid', bd=1)
+        section_frame = theme_manager.register(tk.Frame(parent, bg=theme["frame_bg"], relief='solid', bd=1))
         section_frame.pack(fill='x', pady=8, padx=10)
         
         # Titre de section
@@ -451,12 +459,13 @@ def create_section(parent, theme, title, items):
             bg=theme["frame_bg"],
             fg=theme["accent"]
         )
+        theme_manager.register(section_title, {"bg": "frame_bg", "fg": "accent"})
         section_title.pack(anchor='w', padx=15, pady=(12, 8))
         
         # Contenu de la section
         for item in items:
             if item == "":  # Ligne vide pour espacer
-                spacer = tk.Frame(section_frame, bg=theme["frame_bg"], height=5)
+                spacer = theme_manager.register(tk.Frame(section_frame, bg=theme["frame_bg"], height=5))
                 spacer.pack()
             else:
                 # Déterminer le padding selon le type de contenu
@@ -473,10 +482,11 @@ def create_section(parent, theme, title, items):
                     wraplength=750,
                     anchor='w'
                 )
+                theme_manager.register(item_label, "stats_label")
                 item_label.pack(anchor='w', padx=(left_pad, 15), pady=2)
         
         # Espacement final
-        spacer = tk.Frame(section_frame, bg=theme["frame_bg"], height=10)
+        spacer = theme_manager.register(tk.Frame(section_frame, bg=theme["frame_bg"], height=10))
         spacer.pack()
         
     except Exception as e:
@@ -609,15 +619,16 @@ def show_quick_help(parent, topic=None):
     # Appliquer le thème
     theme = THEMES["dark"] if config_manager.is_dark_mode_enabled() else THEMES["light"]
     tutorial_window.configure(bg=theme["bg"])
+    theme_manager.register(tutorial_window)
     
     # Frame principal avec scrollbar (MÊME STRUCTURE)
-    main_frame = tk.Frame(tutorial_window, bg=theme["bg"])
+    main_frame = theme_manager.register(tk.Frame(tutorial_window, bg=theme["bg"]), "background")
     main_frame.pack(fill='both', expand=True, padx=20, pady=20)
     
     # Canvas et scrollbar
-    canvas = tk.Canvas(main_frame, bg=theme["bg"], highlightthickness=0)
+    canvas = theme_manager.register(tk.Canvas(main_frame, bg=theme["bg"], highlightthickness=0))
     scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-    scrollable_frame = tk.Frame(canvas, bg=theme["bg"])
+    scrollable_frame = theme_manager.register(tk.Frame(canvas, bg=theme["bg"]), "background")
     
     scrollable_frame.bind(
         "<Configure>",
@@ -628,7 +639,7 @@ def show_quick_help(parent, topic=None):
     canvas.configure(yscrollcommand=scrollbar.set)
     
     # Header (MÊME STYLE)
-    header_frame = tk.Frame(scrollable_frame, bg=theme["bg"])
+    header_frame = theme_manager.register(tk.Frame(scrollable_frame, bg=theme["bg"]), "background")
     header_frame.pack(fill='x', pady=(0, 20))
     
     title_tutorial = tk.Label(
@@ -638,6 +649,7 @@ def show_quick_help(parent, topic=None):
         bg=theme["bg"],
         fg=theme["accent"]
     )
+    theme_manager.register(title_tutorial, {"bg": "bg", "fg": "accent"})
     title_tutorial.pack()
     
     subtitle_tutorial = tk.Label(
@@ -647,6 +659,7 @@ def show_quick_help(parent, topic=None):
         bg=theme["bg"],
         fg=theme["fg"]
     )
+    theme_manager.register(subtitle_tutorial)
     subtitle_tutorial.pack(pady=(5, 0))
     
     # ========== SECTIONS STYLÉES ==========
@@ -654,7 +667,7 @@ def show_quick_help(parent, topic=None):
         create_section(scrollable_frame, theme, section_title, section_items)
     
     # Bouton fermer (MÊME STYLE)
-    close_frame = tk.Frame(scrollable_frame, bg=theme["bg"])
+    close_frame = theme_manager.register(tk.Frame(scrollable_frame, bg=theme["bg"]), "background")
     close_frame.pack(fill='x', pady=(20, 15))
     
     btn_close = tk.Button(
@@ -669,6 +682,7 @@ def show_quick_help(parent, topic=None):
         padx=25,
         command=tutorial_window.destroy
     )
+    theme_manager.register(btn_close, {"bg": "accent"})
     btn_close.pack(side='right')
     
     # Configurer canvas et scrollbar
@@ -705,15 +719,16 @@ def show_minimal_tutorial():
     # Appliquer le thème
     theme = THEMES["dark"] if config_manager.is_dark_mode_enabled() else THEMES["light"]
     tutorial_window.configure(bg=theme["bg"])
+    theme_manager.register(tutorial_window)
     
     # Frame principal avec scrollbar (MÊME STRUCTURE que show_tutorial)
-    main_frame = tk.Frame(tutorial_window, bg=theme["bg"])
+    main_frame = theme_manager.register(tk.Frame(tutorial_window, bg=theme["bg"]), "background")
     main_frame.pack(fill='both', expand=True, padx=20, pady=20)
     
     # Canvas et scrollbar
-    canvas = tk.Canvas(main_frame, bg=theme["bg"], highlightthickness=0)
+    canvas = theme_manager.register(tk.Canvas(main_frame, bg=theme["bg"], highlightthickness=0))
     scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-    scrollable_frame = tk.Frame(canvas, bg=theme["bg"])
+    scrollable_frame = theme_manager.register(tk.Frame(canvas, bg=theme["bg"]), "background")
     
     scrollable_frame.bind(
         "<Configure>",
@@ -724,7 +739,7 @@ def show_minimal_tutorial():
     canvas.configure(yscrollcommand=scrollbar.set)
     
     # Header (MÊME STYLE)
-    header_frame = tk.Frame(scrollable_frame, bg=theme["bg"])
+    header_frame = theme_manager.register(tk.Frame(scrollable_frame, bg=theme["bg"]), "background")
     header_frame.pack(fill='x', pady=(0, 20))
     
     title_tutorial = tk.Label(
@@ -734,6 +749,7 @@ def show_minimal_tutorial():
         bg=theme["bg"],
         fg=theme["accent"]
     )
+    theme_manager.register(title_tutorial, {"bg": "bg", "fg": "accent"})
     title_tutorial.pack()
     
     subtitle_tutorial = tk.Label(
@@ -743,6 +759,7 @@ def show_minimal_tutorial():
         bg=theme["bg"],
         fg=theme["fg"]
     )
+    theme_manager.register(subtitle_tutorial)
     subtitle_tutorial.pack(pady=(5, 0))
     
     # ========== CONTENU AVEC SECTIONS STYLÉES ==========
@@ -784,7 +801,7 @@ def show_minimal_tutorial():
     ])
     
     # Bouton fermer (MÊME STYLE)
-    close_frame = tk.Frame(scrollable_frame, bg=theme["bg"])
+    close_frame = theme_manager.register(tk.Frame(scrollable_frame, bg=theme["bg"]), "background")
     close_frame.pack(fill='x', pady=(20, 15))
     
     btn_close = tk.Button(
@@ -799,6 +816,7 @@ def show_minimal_tutorial():
         padx=25,
         command=tutorial_window.destroy
     )
+    theme_manager.register(btn_close, {"bg": "accent"})
     btn_close.pack(side='right')
     
     # Configurer canvas et scrollbar
@@ -835,15 +853,16 @@ def show_whats_new():
     # Appliquer le thème
     theme = THEMES["dark"] if config_manager.is_dark_mode_enabled() else THEMES["light"]
     tutorial_window.configure(bg=theme["bg"])
+    theme_manager.register(tutorial_window)
     
     # Frame principal avec scrollbar (MÊME STRUCTURE)
-    main_frame = tk.Frame(tutorial_window, bg=theme["bg"])
+    main_frame = theme_manager.register(tk.Frame(tutorial_window, bg=theme["bg"]), "background")
     main_frame.pack(fill='both', expand=True, padx=20, pady=20)
     
     # Canvas et scrollbar
-    canvas = tk.Canvas(main_frame, bg=theme["bg"], highlightthickness=0)
+    canvas = theme_manager.register(tk.Canvas(main_frame, bg=theme["bg"], highlightthickness=0))
     scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-    scrollable_frame = tk.Frame(canvas, bg=theme["bg"])
+    scrollable_frame = theme_manager.register(tk.Frame(canvas, bg=theme["bg"]), "background")
     
     scrollable_frame.bind(
         "<Configure>",
@@ -854,7 +873,7 @@ def show_whats_new():
     canvas.configure(yscrollcommand=scrollbar.set)
     
     # Header (MÊME STYLE)
-    header_frame = tk.Frame(scrollable_frame, bg=theme["bg"])
+    header_frame = theme_manager.register(tk.Frame(scrollable_frame, bg=theme["bg"]), "background")
     header_frame.pack(fill='x', pady=(0, 20))
     
     title_tutorial = tk.Label(
@@ -864,6 +883,7 @@ def show_whats_new():
         bg=theme["bg"],
         fg=theme["accent"]
     )
+    theme_manager.register(title_tutorial, {"bg": "bg", "fg": "accent"})
     title_tutorial.pack()
     
     subtitle_tutorial = tk.Label(
@@ -873,6 +893,7 @@ def show_whats_new():
         bg=theme["bg"],
         fg=theme["fg"]
     )
+    theme_manager.register(subtitle_tutorial)
     subtitle_tutorial.pack(pady=(5, 0))
     
     # ========== CONTENU AVEC SECTIONS STYLÉES ==========
@@ -927,7 +948,7 @@ def show_whats_new():
     ])
     
     # Bouton fermer (MÊME STYLE)
-    close_frame = tk.Frame(scrollable_frame, bg=theme["bg"])
+    close_frame = theme_manager.register(tk.Frame(scrollable_frame, bg=theme["bg"]), "background")
     close_frame.pack(fill='x', pady=(20, 15))
     
     btn_close = tk.Button(
@@ -942,6 +963,7 @@ def show_whats_new():
         padx=25,
         command=tutorial_window.destroy
     )
+    theme_manager.register(btn_close, {"bg": "accent"})
     btn_close.pack(side='right')
     
     # Configurer canvas et scrollbar
@@ -977,6 +999,7 @@ def create_tutorial_menu():
         # Appliquer le thème
         theme = THEMES["dark"] if config_manager.is_dark_mode_enabled() else THEMES["light"]
         menu_window.configure(bg=theme["bg"])
+        theme_manager.register(menu_window)
         
         # Titre
         title_label = tk.Label(
@@ -986,10 +1009,11 @@ def create_tutorial_menu():
             bg=theme["bg"],
             fg=theme["fg"]
         )
+        theme_manager.register(title_label)
         title_label.pack(pady=20)
         
         # Boutons d'aide
-        button_frame = tk.Frame(menu_window, bg=theme["bg"])
+        button_frame = theme_manager.register(tk.Frame(menu_window, bg=theme["bg"]), "background")
         button_frame.pack(fill='both', expand=True, padx=20)
         
         buttons = [
@@ -1004,7 +1028,7 @@ def create_tutorial_menu():
         ]
         
         for i, (text, desc, command) in enumerate(buttons):
-            btn_frame = tk.Frame(button_frame, bg=theme["frame_bg"], relief='solid', bd=1)
+            btn_frame = theme_manager.register(tk.Frame(button_frame, bg=theme["frame_bg"], relief='solid', bd=1))
             btn_frame.pack(fill='x', pady=3)
             
             btn = tk.Button(
@@ -1018,6 +1042,7 @@ def create_tutorial_menu():
                 pady=8,
                 command=lambda cmd=command: [cmd(), menu_window.destroy()]
             )
+            theme_manager.register(btn, {"bg": "accent"})
             btn.pack(fill='x', padx=8, pady=4)
             
             desc_label = tk.Label(
@@ -1027,6 +1052,7 @@ def create_tutorial_menu():
                 bg=theme["frame_bg"],
                 fg=theme["fg"]
             )
+            theme_manager.register(desc_label, "stats_label")
             desc_label.pack(pady=(0, 4))
         
         # Bouton fermer
@@ -1041,6 +1067,7 @@ def create_tutorial_menu():
             pady=8,
             command=menu_window.destroy
         )
+        theme_manager.register(close_btn, {"bg": "danger"})
         close_btn.pack(pady=10)
     
     return show_menu
@@ -9,7 +9,8 @@ Module de gestion de la configuration et des préférences utilisateur
 import json
 import os
 from .constants import DEFAULT_CONFIG, FILE_NAMES, VERSION, FOLDERS, ensure_folders_exist
-from .logging import log_message
+from .logging import log_message, set_log_level, set_log_format, anonymize_path
+from .profiling import set_profiling_enabled
 
 class ConfigManager:
     """Gestionnaire de configuration de l'application"""
@@ -37,6 +38,11 @@ class ConfigManager:
         except Exception as e:
             log_message("WARNING", "Impossible de charger la configuration", e)
             self.config = DEFAULT_CONFIG.copy()
+        
+        # Appliquer le niveau de log configuré
+        set_log_level(self.config.get("log_level", DEFAULT_CONFIG["log_level"]))
+        set_log_format(self.config.get("log_format", DEFAULT_CONFIG["log_format"]))
+        set_profiling_enabled(self.config.get("profiling_enabled", DEFAULT_CONFIG["profiling_enabled"]))
     
     def save_config(self):
         """Sauvegarde la configuration dans le fichier JSON"""
@@ -95,6 +101,35 @@ class ConfigManager:
         self.set("validation_enabled", not current)
         return not current
 
+    def get_log_level(self):
+        """Récupère le niveau minimum de log"""
+        return self.config.get("log_level", DEFAULT_CONFIG["log_level"])
+    
+    def set_log_level(self, level):
+        """Définit le niveau minimum de log et l'applique immédiatement"""
+        self.set("log_level", level)
+        set_log_level(level)
+
+    def get_log_format(self):
+        """Récupère le format du log ("text" ou "json")"""
+        return self.config.get("log_format", DEFAULT_CONFIG["log_format"])
+    
+    def set_log_format(self, log_format):
+        """Définit le format du log et l'applique immédiatement"""
+        self.set("log_format", log_format)
+        set_log_format(log_format)
+
+    def is_profiling_enabled(self):
+        """Vérifie si le profilage (cProfile + tracemalloc) est activé dans la configuration"""
+        return self.config.get("profiling_enabled", DEFAULT_CONFIG["profiling_enabled"])
+    
+    def toggle_profiling(self):
+        """Bascule le profilage et l'applique immédiatement"""
+        current = self.is_profiling_enabled()
+        self.set("profiling_enabled", not current)
+        set_profiling_enabled(not current)
+        return not current
+    
     def is_dark_mode_enabled(self):
         """Vérifie si le mode sombre est activé"""
         return self.config.get("dark_mode", True)
@@ -108,15 +143,7 @@ class ConfigManager:
     @staticmethod
     def anonymize_path(path):
         """Anonymise les chemins personnels pour la confidentialité"""
-        if not path:
-            return "chemin_non_specifie"
-        
-        import getpass
-        import re
-        username = getpass.getuser()
-        anonymized = path.replace(username, "USER")
-        anonymized = re.sub(r'[A-Z]:\\.*?\\', r'X:\\...\\', anonymized)
-        return anonymized
+        return anonymize_path(path)
 
 # Instance globale du gestionnaire de configuration
 config_manager = ConfigManager()
\ No newline at end of file
@@ -7,6 +7,7 @@ Module contenant toutes les constantes de l'application
 """
 
 import os
+import re
 
 # Version de l'application
 VERSION = "2.4.4"
@@ -85,6 +86,115 @@ PROTECTION_ORDER = [
     ('"   "', 'Trois espaces')
 ]
 
+# Patterns typiques des fichiers Ren'Py (validation, dans l'ordre de priorité)
+RENPY_PATTERNS = [
+    r'label\s+\w+:',                    # Labels Ren'Py
+    r'menu:',                           # Menus
+    r'scene\s+\w+',                     # Changements de scène
+    r'show\s+\w+',                      # Affichage de personnages
+    r'hide\s+\w+',                      # Masquage de personnages
+    r'\w+\s+".*"',                      # Dialogues (personnage + texte)
+    r'translate\s+\w+\s+\w+:',          # Blocs de traduction
+    r'old\s+".*"',                      # Anciennes traductions
+    r'new\s+".*"',                      # Nouvelles traductions
+    r'\$\s+.*',                         # Code Python intégré
+    r'if\s+.*:',                        # Conditions
+    r'jump\s+\w+',                      # Sauts
+    r'call\s+\w+',                      # Appels
+    r'return',                          # Retours
+    r'with\s+\w+',                      # Transitions
+    r'pause\s*\d*\.?\d*',               # Pauses
+]
+
+def _any_of(patterns):
+    """Alternation : trouve une ligne où au moins un des patterns est présent"""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+def _first_of(patterns, flags=0):
+    """
+    Alternation ordonnée (à utiliser avec match) : match.lastindex - 1 est
+    l'index du premier pattern de la liste présent dans la ligne
+    """
+    return re.compile("|".join(f"(?=(?s:.*?)(?:{pattern})())" for pattern in patterns), flags)
+
+def _empty_texts(protection_order):
+    """
+    Guillemets échappés et textes vides de protection_order en une expression.
+    Un texte vide ne consomme pas sa guillemet fermante : elle peut ouvrir le
+    texte vide suivant, comme avec des remplacements successifs (trois guillemets : deux textes vides)
+    """
+    bodies = sorted((pattern[1:-1] for pattern, _ in protection_order if pattern != r'\"'),
+                    key=len, reverse=True)
+    return re.compile(r'\\"|"(' + "|".join(re.escape(body) for body in bodies) + ')(?=")')
+
+# Expressions régulières compilées une seule fois pour les boucles ligne par ligne
+REGEX_PATTERNS = {
+    # Extraction
+    "code_tags": re.compile(r'(\{[^}]+\}|\[[^\]]+\])'),
+    "special_codes": [re.compile(pattern) for pattern in SPECIAL_CODES],  # Ordre du mapping
+    "special_codes_any": _any_of(SPECIAL_CODES),
+    "asterix": re.compile(r'\*([^*]+)\*'),
+    "empty_texts": _empty_texts(PROTECTION_ORDER),
+    "quoted_text": re.compile(r'"([^"]*)"'),
+    "last_quote": re.compile(r'.*(?<!\\)"', re.DOTALL),  # Jusqu'à la dernière guillemet non échappée
+    "empty_placeholder": re.compile(r'\((?:C|ESC)\d+\)'),
+    "unsafe_filename": re.compile(r'[<>:"/\\|?*]'),
+    
+    # Validation
+    "renpy_first": _first_of(RENPY_PATTERNS, re.IGNORECASE),
+    "dialogue": re.compile(r'".*"'),
+    "code_placeholder": re.compile(r'\(\d{2}\)'),
+    
+    # Cohérence
+    "code_chars": re.compile(r'\[[^\]]*\]|\{[^}]*\}|%\([^)]*\)|%[a-zA-Z_]|\(\d+\)'),
+    "escape_sequence": re.compile(r'\\[a-zA-Z]'),
+    "tag": re.compile(r'\{[^}]*\}'),
+    "variable": re.compile(r'\[[^\]]*\]'),
+    "placeholder": re.compile(r'\(\d+\)'),
+    "malformed_placeholder": re.compile(r'\(\d+(?!\))'),
+    "orphan_open": re.compile(r'\{[^}]*$'),
+    "orphan_close": re.compile(r'^[^{]*\}'),
+    "special_sequence": re.compile(r'\\n|--|%[^%]*%'),
+    
+    # Glossaire
+    "glossary_special": re.compile(r'[{}[\]()"]'),
+}
+
+# Traitement des gros fichiers
+LARGE_FILES = {
+    "mmap_threshold": 32 * 1024 * 1024,      # Au-delà : lignes lues à la demande via mmap
+    "streaming_threshold": 16 * 1024 * 1024, # Au-delà : extraction bloc par bloc
+    "streaming_block_lines": 5000            # Taille visée d'un bloc (arrondie aux blocs translate)
+}
+
+# Aperçu de la zone de texte principale (voir ui/interface.py LazyTextPreview)
+PREVIEW_CONFIG = {
+    "window_lines": 2000,   # Lignes insérées au chargement
+    "chunk_lines": 500,     # Lignes ajoutées à chaque défilement près d'un bord
+    "max_lines": 6000,      # Au-delà : les lignes à l'autre bord sont retirées du widget
+    "margin": 0.1           # Fraction de la zone affichée qui déclenche le chargement
+}
+
+# Recherche dans le glossaire (index de core/glossary.py, dialogue ui/glossary_ui.py)
+GLOSSARY_SEARCH = {
+    "ngram_size": 3,      # Taille des n-grammes indexés
+    "debounce_ms": 200,   # Délai après la dernière frappe avant de chercher
+    "page_rows": 200      # Lignes ajoutées à la liste à chaque défilement en bas
+}
+
+# Traitement par lots (voir core/batch.py)
+BATCH_CONFIG = {
+    "workers": 2,       # Threads de traitement entre le thread de lecture et celui d'écriture
+    "queue_size": 4     # Taille des files bornées entre les étapes
+}
+
+# Purge explicite de l'espace de travail (voir core/workspace.py) : seuls les
+# mappings des scripts déjà reconstruits sont concernés
+WORKSPACE_CONFIG = {
+    "max_age_days": 30,     # Scripts non modifiés depuis plus longtemps : supprimés (à traduire compris)
+    "max_total_mb": 1024    # Fichiers évinçables au-delà : les scripts reconstruits les plus anciens sont supprimés
+}
+
 # Types de fichiers supportés
 SUPPORTED_FILES = {
     "renpy": [("Ren'Py script", "*.rpy")],
@@ -102,12 +212,43 @@ MESSAGES = {
     "reconstruction_in_progress": "🔧 Reconstruction en cours..."
 }
 
+# Niveaux de log (du plus verbeux au plus critique)
+LOG_LEVELS = {
+    "DEBUG": 10,
+    "INFO": 20,
+    "WARNING": 30,
+    "ERREUR": 40
+}
+
+# Paramètres du logger bufferisé
+LOG_CONFIG = {
+    "min_level": "INFO",        # Niveau minimum écrit dans log.txt
+    "flush_interval": 0.5,      # Secondes entre deux écritures groupées
+    "batch_size": 1000,         # Nombre max de lignes écrites par ouverture du fichier
+    "item_limit": 20,           # Messages détaillés par catégorie avant agrégation
+    "path_cache_size": 256,     # Chemins mémorisés pour extract_game_name / anonymize_path
+    "max_bytes": 5 * 1024 * 1024,  # Taille maximale du log avant rotation
+    "backup_count": 5,          # Nombre de générations conservées (log.txt.1 ... log.txt.5)
+    "format": "text"            # "text" (log.txt) ou "json" (log.jsonl, un objet par ligne)
+}
+
+# Profilage à la demande (voir utils/profiling.py)
+PROFILING_CONFIG = {
+    "env_var": "TRADUCTEUR_RENPY_PROFILE",  # Valeur 1/true/oui : profilage actif quelle que soit la config
+    "top_functions": 40,        # Fonctions listées dans le résumé texte de chaque profil
+    "top_allocations": 25,      # Lignes de code qui allouent le plus (tracemalloc)
+    "traceback_frames": 1       # Profondeur des piles enregistrées par tracemalloc
+}
+
 # Configuration par défaut
 DEFAULT_CONFIG = {
     "last_directory": "",
     "auto_open_files": True,
     "dark_mode": True,
     "validation_enabled": True,
+    "log_level": LOG_CONFIG["min_level"],
+    "log_format": LOG_CONFIG["format"],
+    "profiling_enabled": False,  # cProfile + tracemalloc (dossier_configs/profiles)
     "version": VERSION
 }
 
@@ -115,6 +256,11 @@ DEFAULT_CONFIG = {
 FILE_NAMES = {
     "config": os.path.join(FOLDERS["configs"], "config.json"),
     "log": os.path.join(FOLDERS["configs"], "log.txt"),
+    "log_json": os.path.join(FOLDERS["configs"], "log.jsonl"),
+    "performance_report": os.path.join(FOLDERS["configs"], "performance_report.json"),
+    "projects_folder": os.path.join(FOLDERS["configs"], "projets"),  # Bases SQLite par jeu
+    "checkpoints_folder": os.path.join(FOLDERS["configs"], "reprises"),  # Journaux des lots
+    "profiles_folder": os.path.join(FOLDERS["configs"], "profiles"),  # Profils cProfile / tracemalloc
     "tutorial_flag": os.path.join(FOLDERS["configs"], "tutorial_shown.flag")
 }
 
@@ -6,53 +6,287 @@
 Module de gestion des logs
 """
 
+import atexit
 import datetime
+import functools
+import json
 import os
+import queue
 import re
-from .constants import FILE_NAMES
+import threading
+from .constants import FILE_NAMES, LOG_LEVELS, LOG_CONFIG
 from utils.constants import FOLDERS
 
+# Niveau minimum courant (modifiable via set_log_level)
+_min_level = LOG_LEVELS[LOG_CONFIG["min_level"]]
+
+# Format courant des enregistrements : "text" (log.txt) ou "json" (log.jsonl)
+_log_format = LOG_CONFIG["format"]
+
+# Compteurs des messages par élément (catégorie -> nombre de messages reçus)
+_item_counters = {}
+_item_lock = threading.Lock()
+
+class _LogWriter:
+    """Écrivain de log en arrière-plan : les messages sont mis en file puis écrits par lots"""
+    
+    def __init__(self):
+        self.queue = queue.SimpleQueue()
+        self.thread = None
+        self.lock = threading.Lock()
+        self.file_lock = threading.Lock()
+    
+    def start(self):
+        """Démarre le thread d'écriture s'il n'est pas déjà actif"""
+        if self.thread is not None and self.thread.is_alive():
+            return
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+                self.thread.start()
+    
+    def put(self, log_line):
+        """Ajoute une ligne à la file d'écriture"""
+        self.start()
+        self.queue.put(log_line)
+    
+    def flush(self, timeout=2.0):
+        """Force l'écriture de tous les messages en attente"""
+        if self.thread is None or not self.thread.is_alive():
+            self._write(self._drain([]))
+            return
+        done = threading.Event()
+        self.queue.put(done)
+        done.wait(timeout)
+    
+    def _drain(self, pending):
+        """Récupère sans attendre les lignes déjà en file"""
+        while len(pending) < LOG_CONFIG["batch_size"]:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, threading.Event):
+                self._write(pending)
+                pending = []
+                item.set()
+            else:
+                pending.append(item)
+        return pending
+    
+    def _run(self):
+        """Boucle du thread : attend un message puis écrit tout le lot disponible"""
+        while True:
+            try:
+                item = self.queue.get(timeout=LOG_CONFIG["flush_interval"])
+            except queue.Empty:
+                continue
+            
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            
+            pending = self._drain([item])
+            self._write(pending)
+    
+    def _write(self, lines):
+        """Écrit un lot de lignes avec une seule ouverture du fichier, puis fait tourner si besoin"""
+        if not lines:
+            return
+        try:
+            with self.file_lock:
+                with open(get_log_path(), 'a', encoding='utf-8', newline='') as f:
+                    f.write(''.join(lines))
+                    size = f.tell()
+                
+                if size >= LOG_CONFIG["max_bytes"]:
+                    self.rotate()
+        except:
+            pass  # Échec silencieux pour éviter les boucles d'erreur
+    
+    def rotate(self):
+        """
+        Décale les générations du log (log.txt -> log.txt.1 -> ... -> log.txt.N)
+        
+        La plus ancienne génération au-delà de backup_count est supprimée.
+        """
+        path = get_log_path()
+        if not os.path.exists(path):
+            return
+        
+        backup_count = LOG_CONFIG["backup_count"]
+        if backup_count <= 0:
+            os.remove(path)
+            return
+        
+        oldest = f"{path}.{backup_count}"
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        
+        for i in range(backup_count - 1, 0, -1):
+            source = f"{path}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{path}.{i + 1}")
+        
+        os.replace(path, f"{path}.1")
+
+_writer = _LogWriter()
+
+def flush_log():
+    """Écrit immédiatement tous les messages en attente dans le fichier log"""
+    flush_item_summaries()
+    _writer.flush()
+
+atexit.register(flush_log)
+
+def set_log_level(level):
+    """
+    Définit le niveau minimum des messages écrits dans le log
+    
+    Args:
+        level (str): DEBUG, INFO, WARNING ou ERREUR
+    """
+    global _min_level
+    if level in LOG_LEVELS:
+        _min_level = LOG_LEVELS[level]
+
+def is_level_enabled(level):
+    """Indique si un niveau de log sera effectivement écrit"""
+    return LOG_LEVELS.get(level, LOG_LEVELS["ERREUR"]) >= _min_level
+
+def set_log_format(log_format):
+    """
+    Définit le format des enregistrements du log
+    
+    Args:
+        log_format (str): "text" (lignes entre crochets dans log.txt)
+                          ou "json" (un objet JSON par ligne dans log.jsonl)
+    """
+    global _log_format
+    if log_format in ("text", "json") and log_format != _log_format:
+        _writer.flush()
+        _log_format = log_format
+
+def get_log_path():
+    """Retourne le chemin du fichier log correspondant au format courant"""
+    return FILE_NAMES["log_json"] if _log_format == "json" else FILE_NAMES["log"]
+
 def initialize_log():
-    """Initialise/réinitialise le fichier log au démarrage"""
+    """Initialise le fichier log au démarrage en conservant les sessions précédentes par rotation"""
     try:
         # Créer le dossier configs s'il n'existe pas
-        log_dir = os.path.dirname(FILE_NAMES["log"])
+        log_dir = os.path.dirname(get_log_path())
         if log_dir and not os.path.exists(log_dir):
             os.makedirs(log_dir, exist_ok=True)
         
-        # Réinitialiser le fichier log
-        with open(FILE_NAMES["log"], 'w', encoding='utf-8') as f:
-            f.write(f"=== TRADUCTEUR REN'PY PRO - LOG DE SESSION ===\n")
-            f.write(f"Démarrage: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 50 + "\n\n")
+        # Vider la file avant de changer de fichier
+        _writer.flush()
+        
+        with _writer.file_lock:
+            # Archiver le log de la session précédente au lieu de l'écraser
+            if os.path.exists(get_log_path()) and os.path.getsize(get_log_path()) > 0:
+                _writer.rotate()
+            
+            started = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            with open(get_log_path(), 'w', encoding='utf-8', newline='') as f:
+                if _log_format == "json":
+                    f.write(json.dumps({
+                        'timestamp': started,
+                        'level': "INFO",
+                        'message': "=== TRADUCTEUR REN'PY PRO - LOG DE SESSION ===",
+                        'stage': "session"
+                    }, ensure_ascii=False) + "\n")
+                else:
+                    f.write(f"=== TRADUCTEUR REN'PY PRO - LOG DE SESSION ===\n")
+                    f.write(f"Démarrage: {started}\n")
+                    f.write("=" * 50 + "\n\n")
             
     except Exception as e:
         print(f"⚠️ Impossible d'initialiser le log: {e}")
 
-def log_message(level, message, exception=None):
+def log_message(level, message, exception=None, stage=None, file_name=None, duration=None):
     """
-    Écrit un message dans le fichier log.txt
+    Met un message en file pour écriture dans le fichier log
     
     Args:
-        level (str): INFO, WARNING, ERREUR
+        level (str): DEBUG, INFO, WARNING, ERREUR
         message (str): Message à logger
         exception (Exception, optional): Exception associée
+        stage (str, optional): Étape du pipeline (champ structuré)
+        file_name (str, optional): Fichier concerné (champ structuré)
+        duration (float, optional): Durée en secondes (champ structuré)
     """
     try:
+        if not is_level_enabled(level):
+            return
+        
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_line = f"[{timestamp}] [{level}] {message}"
         
-        if exception:
-            log_line += f" | Exception: {str(exception)}"
+        if _log_format == "json":
+            record = {'timestamp': timestamp, 'level': level, 'message': message}
+            if stage is not None:
+                record['stage'] = stage
+            if file_name is not None:
+                record['file'] = file_name
+            if duration is not None:
+                record['duration'] = round(duration, 6)
+            if exception:
+                record['exception'] = str(exception)
+            log_line = json.dumps(record, ensure_ascii=False, default=str)
+        else:
+            log_line = f"[{timestamp}] [{level}] {message}"
+            
+            if exception:
+                log_line += f" | Exception: {str(exception)}"
         
         log_line += "\n"
         
-        with open(FILE_NAMES["log"], 'a', encoding='utf-8', newline='') as f:
-            f.write(log_line)
+        _writer.put(log_line)
             
     except:
         pass  # Échec silencieux pour éviter les boucles d'erreur
 
+def log_item(level, category, message):
+    """
+    Logge un message répété par élément (terme, expression...) avec limitation
+    
+    Seuls les premiers messages de chaque catégorie sont écrits en détail,
+    les suivants sont comptés puis résumés par flush_item_summaries().
+    
+    Args:
+        level (str): Niveau du message
+        category (str): Catégorie servant à l'agrégation
+        message (str): Message détaillé
+    """
+    if not is_level_enabled(level):
+        return
+    
+    with _item_lock:
+        count = _item_counters.get(category, 0) + 1
+        _item_counters[category] = count
+    
+    if count <= LOG_CONFIG["item_limit"]:
+        log_message(level, message)
+
+def flush_item_summaries(category=None):
+    """
+    Écrit le résumé des messages agrégés et remet les compteurs à zéro
+    
+    Args:
+        category (str, optional): Catégorie à résumer (toutes si None)
+    """
+    with _item_lock:
+        if category is None:
+            counters = dict(_item_counters)
+            _item_counters.clear()
+        else:
+            counters = {category: _item_counters.pop(category, 0)}
+    
+    for name, count in counters.items():
+        hidden = count - LOG_CONFIG["item_limit"]
+        if hidden > 0:
+            log_message("INFO", f"{name}: {count} messages au total ({hidden} non détaillés)")
+
 def log_performance(operation, file_name, duration, details=None):
     """
     Log les performances d'une opération
@@ -70,11 +304,27 @@ def log_performance(operation, file_name, duration, details=None):
             details_str = " | ".join([f"{k}: {v}" for k, v in details.items()])
             message += f" | {details_str}"
         
-        log_message("INFO", message)
+        log_message("INFO", message, stage=operation, file_name=file_name, duration=duration)
         
     except Exception as e:
         log_message("WARNING", f"Impossible de logger la performance: {str(e)}")
 
+# Anonymisation : motif compilé une fois, utilisateur résolu à la première utilisation
+_DRIVE_PATTERN = re.compile(r'[A-Z]:[\\].*?[\\]')
+_username = None
+
+def _get_username():
+    """Récupère (une seule fois) le nom de l'utilisateur courant"""
+    global _username
+    if _username is None:
+        try:
+            import getpass
+            _username = getpass.getuser()
+        except Exception:
+            _username = ""
+    return _username
+
+@functools.lru_cache(maxsize=LOG_CONFIG["path_cache_size"])
 def anonymize_path(path):
     """
     Anonymise les chemins personnels pour la confidentialité
@@ -88,17 +338,19 @@ def anonymize_path(path):
     if not path:
         return "chemin_non_specifie"
     
-    import getpass
-    username = getpass.getuser()
-    anonymized = path.replace(username, "USER")
+    username = _get_username()
+    anonymized = path.replace(username, "USER") if username else path
     # ✅ CORRECTION : Échapper correctement les backslashes
-    anonymized = re.sub(r'[A-Z]:[\\].*?[\\]', r'X:\\...\\', anonymized)
+    anonymized = _DRIVE_PATTERN.sub(r'X:\\...\\', anonymized)
     return anonymized
 
 def extract_game_name(file_path):
     """
     ✅ CORRECTION : Extrait le nom du jeu principal depuis le chemin
     
+    Le résultat est mémorisé par chemin normalisé : les traces DEBUG
+    ne sont écrites que lors de la première analyse d'un chemin.
+    
     Exemple:
     C:\\Users\\Rory Mercury 91\\Documents\\GuiltyPleasure-0.49-pc\\game\\tl\\fr_zenpy_DeepL_andric31
     -> GuiltyPleasure-0.49-pc
@@ -107,55 +359,90 @@ def extract_game_name(file_path):
         if not file_path:
             return "Projet_Inconnu"
         
-        # Normaliser le chemin
-        normalized_path = os.path.normpath(file_path)
-        path_parts = normalized_path.split(os.sep)
-        
-        # Debug : afficher le chemin pour comprendre
-        log_message("DEBUG", f"Chemin analysé: {file_path}")
-        log_message("DEBUG", f"Parties du chemin: {path_parts}")
+        return _detect_game_name(os.path.normpath(file_path))
         
-        # Chercher le dossier principal du jeu
-        # On veut trouver le dossier qui contient "game" ou "tl"
-        for i, part in enumerate(path_parts):
-            part_lower = part.lower()
-            
-            # Si on trouve "game" ou "tl", le dossier parent est le jeu
-            if part_lower in ['game', 'tl']:
-                if i > 0:
-                    game_folder = path_parts[i - 1]
-                    log_message("DEBUG", f"Nom du jeu détecté: {game_folder}")
-                    return game_folder
-        
-        # Si pas trouvé par la méthode game/tl, chercher des patterns typiques
-        for i, part in enumerate(path_parts):
-            part_lower = part.lower()
-            
-            # Ignorer les dossiers système et utilisateur
-            if part_lower in ['documents', 'desktop', 'downloads', 'users', 'program files', 'windows']:
-                continue
-            
-            # Chercher des patterns de nom de jeu
-            if (len(part) > 3 and 
-                not part.isdigit() and 
-                not part_lower.startswith('user') and
-                not part_lower in ['game', 'tl', 'french', 'english', 'scripts', 'script']):
-                
-                # Vérifier si c'est probablement un nom de jeu
-                if (any(char.isalpha() for char in part) and 
-                    ('.' in part or '-' in part or len(part) > 5)):
-                    
-                    log_message("DEBUG", f"Nom du jeu détecté par pattern: {part}")
-                    return part
+    except Exception as e:
+        log_message("WARNING", f"Impossible d'extraire le nom du jeu de {anonymize_path(file_path)}", e)
+        return "Projet_Inconnu"
+
+@functools.lru_cache(maxsize=LOG_CONFIG["path_cache_size"])
+def _detect_game_name(normalized_path):
+    """Analyse un chemin normalisé pour en déduire le nom du jeu (mémorisé)"""
+    path_parts = normalized_path.split(os.sep)
+    
+    # Debug : afficher le chemin pour comprendre
+    log_message("DEBUG", f"Chemin analysé: {normalized_path}")
+    log_message("DEBUG", f"Parties du chemin: {path_parts}")
+    
+    # Chercher le dossier principal du jeu
+    # On veut trouver le dossier qui contient "game" ou "tl"
+    for i, part in enumerate(path_parts):
+        part_lower = part.lower()
         
-        # Fallback : utiliser le nom du fichier
-        filename = os.path.basename(file_path)
-        if filename.endswith('.rpy'):
-            filename = filename[:-4]  # Enlever .rpy
+        # Si on trouve "game" ou "tl", le dossier parent est le jeu
+        if part_lower in ['game', 'tl']:
+            if i > 0:
+                game_folder = path_parts[i - 1]
+                log_message("DEBUG", f"Nom du jeu détecté: {game_folder}")
+                return game_folder
+    
+    # Si pas trouvé par la méthode game/tl, chercher des patterns typiques
+    for i, part in enumerate(path_parts):
+        part_lower = part.lower()
         
-        log_message("DEBUG", f"Fallback nom du jeu: {filename}")
-        return filename if filename else "Projet_Inconnu"
+        # Ignorer les dossiers système et utilisateur
+        if part_lower in ['documents', 'desktop', 'downloads', 'users', 'program files', 'windows']:
+            continue
         
-    except Exception as e:
-        log_message("WARNING", f"Impossible d'extraire le nom du jeu de {anonymize_path(file_path)}", e)
-        return "Projet_Inconnu"
\ No newline at end of file
+        # Chercher des patterns de nom de jeu
+        if (len(part) > 3 and 
+            not part.isdigit() and 
+            not part_lower.startswith('user') and
+            not part_lower in ['game', 'tl', 'french', 'english', 'scripts', 'script']):
+            
+            # Vérifier si c'est probablement un nom de jeu
+            if (any(char.isalpha() for char in part) and 
+                ('.' in part or '-' in part or len(part) > 5)):
+                
+                log_message("DEBUG", f"Nom du jeu détecté par pattern: {part}")
+                return part
+    
+    # Fallback : utiliser le nom du fichier
+    filename = os.path.basename(normalized_path)
+    if filename.endswith('.rpy'):
+        filename = filename[:-4]  # Enlever .rpy
+    
+    log_message("DEBUG", f"Fallback nom du jeu: {filename}")
+    return filename if filename else "Projet_Inconnu"
+
+def get_script_subfolders(file_path):
+    """
+    Sous-dossiers d'un script sous le dossier de langue (game/tl/<langue>) ou sous game
+    
+    Deux scripts de même nom dans des sous-dossiers différents ont ainsi des
+    fichiers de travail distincts ; un script placé directement dans le dossier
+    de langue (ou hors d'un jeu) n'a pas de sous-dossier.
+    
+    Exemple:
+    MonJeu/game/tl/french/chapitre1/script.rpy -> ['chapitre1']
+    
+    Returns:
+        list: Noms des sous-dossiers, du plus haut au plus bas
+    """
+    if not file_path:
+        return []
+    path_parts = os.path.normpath(file_path).split(os.sep)
+    lowered = [part.lower() for part in path_parts]
+    
+    anchor = None
+    for i, part in enumerate(lowered[:-1]):
+        if part == 'tl':
+            anchor = i + 2  # Ignorer le dossier de langue
+            break
+        if part == 'game':
+            anchor = i + 3 if lowered[i + 1] == 'tl' else i + 1
+            break
+    
+    if anchor is None or anchor >= len(path_parts) - 1:
+        return []
+    return path_parts[anchor:-1]
@@ -0,0 +1,238 @@
+# utils/performance.py
+# Performance Spans Module
+# Created for Traducteur Ren'Py Pro v2.4.4
+
+"""
+Module de mesure des performances par étapes (spans hiérarchiques)
+
+Chaque étape du pipeline est encadrée par un span qui mesure le temps réel,
+le temps CPU et le volume traité. Les résultats sont agrégés en mémoire pour
+la session ; le rapport JSON de dossier_configs est écrit au plus une fois
+toutes les REPORT_INTERVAL secondes, puis à la fin du lot et de la session.
+"""
+
+import atexit
+import contextlib
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+from .constants import FILE_NAMES
+from .logging import log_message, log_performance
+
+# Nombre de spans racines détaillés conservés dans le rapport
+MAX_RECENT_SPANS = 50
+
+# Délai minimal (secondes) entre deux écritures du rapport pendant la session
+REPORT_INTERVAL = 30.0
+
+_local = threading.local()
+_lock = threading.Lock()
+_report_lock = threading.Lock()  # Une seule écriture du rapport à la fois (lots en parallèle)
+_session = {
+    'started': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    'stages': {},
+    'recent': []
+}
+_report_state = {'dirty': False, 'last_write': time.monotonic()}
+
+class Span:
+    """Mesure d'une étape : temps réel, temps CPU, octets traités et sous-étapes"""
+
+    __slots__ = ('name', 'path', 'file_name', 'bytes_processed', 'wall_time',
+                 'cpu_time', 'children', '_wall_start', '_cpu_start')
+
+    def __init__(self, name, path, file_name=None, bytes_processed=0):
+        self.name = name
+        self.path = path
+        self.file_name = file_name
+        self.bytes_processed = bytes_processed
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.children = []
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+
+    def add_bytes(self, count):
+        """Ajoute un volume traité au span"""
+        self.bytes_processed += count
+
+    def to_dict(self):
+        """Convertit le span (et ses enfants) en dictionnaire sérialisable"""
+        data = {
+            'name': self.name,
+            'wall_time': round(self.wall_time, 6),
+            'cpu_time': round(self.cpu_time, 6),
+            'bytes': self.bytes_processed
+        }
+        if self.file_name:
+            data['file'] = self.file_name
+        if self.children:
+            data['children'] = [child.to_dict() for child in self.children]
+        return data
+
+def _get_stack():
+    """Pile des spans actifs du thread courant"""
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+@contextlib.contextmanager
+def perf_span(name, file_name=None, bytes_processed=0):
+    """
+    Mesure une étape du pipeline (context manager)
+    
+    Les spans ouverts à l'intérieur d'un autre deviennent ses enfants.
+    
+    Exemple:
+        with perf_span("extraction", file_name="script.rpy") as span:
+            span.add_bytes(len(data))
+            with perf_span("glossaire"):
+                ...
+    
+    Args:
+        name (str): Nom de l'étape
+        file_name (str, optional): Fichier traité (hérité du parent si absent)
+        bytes_processed (int): Volume traité connu au départ
+    """
+    stack = _get_stack()
+    parent = stack[-1] if stack else None
+    path = f"{parent.path}/{name}" if parent else name
+    if not file_name and parent:
+        file_name = parent.file_name
+    
+    span = Span(name, path, file_name, bytes_processed)
+    if parent:
+        parent.children.append(span)
+    stack.append(span)
+    
+    span._cpu_start = time.thread_time()
+    span._wall_start = time.perf_counter()
+    try:
+        yield span
+    finally:
+        span.wall_time = time.perf_counter() - span._wall_start
+        span.cpu_time = time.thread_time() - span._cpu_start
+        
+        if stack and stack[-1] is span:
+            stack.pop()
+        
+        _record_span(span)
+        if not stack:
+            _finish_root_span(span)
+
+def timed_span(name):
+    """Décorateur équivalent à perf_span pour une fonction entière"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with perf_span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def add_span_bytes(count):
+    """Ajoute un volume traité au span actif du thread courant (s'il existe)"""
+    stack = _get_stack()
+    if stack:
+        stack[-1].bytes_processed += count
+
+def _record_span(span):
+    """Agrège un span terminé dans les statistiques de la session"""
+    with _lock:
+        stage = _session['stages'].get(span.path)
+        if stage is None:
+            stage = _session['stages'][span.path] = {
+                'count': 0,
+                'wall_time': 0.0,
+                'cpu_time': 0.0,
+                'bytes': 0,
+                'max_wall_time': 0.0
+            }
+        stage['count'] += 1
+        stage['wall_time'] += span.wall_time
+        stage['cpu_time'] += span.cpu_time
+        stage['bytes'] += span.bytes_processed
+        stage['max_wall_time'] = max(stage['max_wall_time'], span.wall_time)
+
+def _finish_root_span(span):
+    """Termine une opération complète : log de synthèse et écriture différée du rapport"""
+    with _lock:
+        _session['recent'].append(span.to_dict())
+        del _session['recent'][:-MAX_RECENT_SPANS]
+        _report_state['dirty'] = True
+        due = time.monotonic() - _report_state['last_write'] >= REPORT_INTERVAL
+
+    details = {child.name: f"{child.wall_time:.3f}s" for child in span.children}
+    details['cpu'] = f"{span.cpu_time:.2f}s"
+    if span.bytes_processed:
+        details['octets'] = span.bytes_processed
+    log_performance(span.name, span.file_name or "-", span.wall_time, details)
+
+    if due:
+        flush_performance_report()
+
+def get_session_report():
+    """
+    Construit le rapport de performance de la session
+
+    Returns:
+        dict: Étapes agrégées (triées par temps réel décroissant) et dernières opérations
+    """
+    with _lock:
+        stages = {}
+        for path, stage in sorted(_session['stages'].items(),
+                                  key=lambda item: item[1]['wall_time'], reverse=True):
+            stages[path] = {
+                'count': stage['count'],
+                'wall_time': round(stage['wall_time'], 6),
+                'cpu_time': round(stage['cpu_time'], 6),
+                'bytes': stage['bytes'],
+                'max_wall_time': round(stage['max_wall_time'], 6),
+                'avg_wall_time': round(stage['wall_time'] / stage['count'], 6)
+            }
+        return {
+            'session_started': _session['started'],
+            'generated': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'stages': stages,
+            'recent': list(_session['recent'])
+        }
+
+def write_performance_report():
+    """Écrit le rapport de performance JSON de la session dans dossier_configs"""
+    try:
+        report_path = FILE_NAMES["performance_report"]
+        report_dir = os.path.dirname(report_path)
+        if report_dir:
+            os.makedirs(report_dir, exist_ok=True)
+
+        with _lock:
+            _report_state['dirty'] = False
+            _report_state['last_write'] = time.monotonic()
+        report = get_session_report()
+        with _report_lock:
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+        return report_path
+    except Exception as e:
+        log_message("WARNING", "Impossible d'écrire le rapport de performance", e)
+        return None
+
+def flush_performance_report():
+    """Écrit le rapport si des opérations ont été mesurées depuis la dernière écriture"""
+    with _lock:
+        if not _report_state['dirty']:
+            return None
+    return write_performance_report()
+
+atexit.register(flush_performance_report)
+
+def reset_session():
+    """Remet à zéro les statistiques de la session"""
+    with _lock:
+        _session['started'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        _session['stages'].clear()
+        _session['recent'].clear()
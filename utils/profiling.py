@@ -0,0 +1,162 @@
+# utils/profiling.py
+# Profiling Hooks Module
+# Created for Traducteur Ren'Py Pro v2.4.4
+
+"""
+Profilage à la demande (cProfile et tracemalloc)
+
+Activé par la variable d'environnement TRADUCTEUR_RENPY_PROFILE=1 ou par
+l'option "profiling_enabled" de config.json. Chaque opération décorée par
+profiled() écrit alors dans dossier_configs/profiles/<horodatage>/ un
+fichier .pstats et un résumé texte (fonctions les plus coûteuses, pic
+mémoire et allocations principales) à joindre à un signalement.
+
+Désactivé, le décorateur appelle directement la fonction.
+"""
+
+import cProfile
+import datetime
+import functools
+import io
+import os
+import pstats
+import threading
+import tracemalloc
+from .constants import FILE_NAMES, PROFILING_CONFIG
+from .logging import log_message, anonymize_path
+
+_TRUE_VALUES = ('1', 'true', 'yes', 'oui', 'on')
+
+# La variable d'environnement force le profilage quelle que soit la configuration
+_env_enabled = os.environ.get(PROFILING_CONFIG["env_var"], "").strip().lower() in _TRUE_VALUES
+_enabled = _env_enabled
+
+# cProfile et tracemalloc sont globaux : une seule opération profilée à la fois
+_active = threading.Lock()
+_session_lock = threading.Lock()
+_session = {'folder': None, 'count': 0}
+
+def set_profiling_enabled(enabled):
+    """
+    Active ou désactive le profilage
+    
+    Args:
+        enabled (bool): Valeur de l'option de configuration
+    """
+    global _enabled
+    _enabled = bool(enabled) or _env_enabled
+
+def is_profiling_enabled():
+    """Indique si les opérations décorées sont profilées"""
+    return _enabled
+
+def profiled(name):
+    """
+    Décorateur : profile la fonction quand le profilage est actif
+    
+    Une opération lancée pendant qu'une autre est profilée (lots en
+    parallèle, appels imbriqués) s'exécute sans profil.
+    
+    Args:
+        name (str): Nom de l'opération (extraction, reconstruction, coherence...)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled or not _active.acquire(blocking=False):
+                return func(*args, **kwargs)
+            try:
+                return _run_profiled(name, _target_name(args), func, args, kwargs)
+            finally:
+                _active.release()
+        return wrapper
+    return decorator
+
+def _target_name(args):
+    """Fichier traité : chemin de l'objet appelé ou premier argument texte"""
+    for arg in args:
+        if isinstance(arg, str):
+            return os.path.basename(arg)
+        path = getattr(arg, 'original_path', None)
+        if path:
+            return os.path.basename(path)
+    return None
+
+def _run_profiled(name, target, func, args, kwargs):
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start(PROFILING_CONFIG["traceback_frames"])
+    tracemalloc.reset_peak()
+    
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError as e:
+        # Un autre outil de profilage est déjà actif (débogueur, profileur externe)
+        log_message("WARNING", f"Profilage impossible pour {name}", e)
+        if started_tracing:
+            tracemalloc.stop()
+        return func(*args, **kwargs)
+    
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+        if started_tracing:
+            tracemalloc.stop()
+        _write_profile(name, target, profiler, snapshot, peak)
+
+def _session_folder():
+    """Dossier des profils de la session et numéro du prochain profil"""
+    with _session_lock:
+        if _session['folder'] is None:
+            stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            _session['folder'] = os.path.join(FILE_NAMES["profiles_folder"], stamp)
+        _session['count'] += 1
+        return _session['folder'], _session['count']
+
+def _write_profile(name, target, profiler, snapshot, peak):
+    """Écrit le fichier .pstats et le résumé texte d'une opération"""
+    try:
+        folder, number = _session_folder()
+        os.makedirs(folder, exist_ok=True)
+        
+        base = f"{number:03d}_{name}"
+        if target:
+            base += "_" + "".join(c if c.isalnum() or c in "-_." else "_" for c in target)
+        stats_path = os.path.join(folder, base + ".pstats")
+        summary_path = os.path.join(folder, base + ".txt")
+        
+        profiler.dump_stats(stats_path)
+        
+        functions = io.StringIO()
+        stats = pstats.Stats(profiler, stream=functions)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILING_CONFIG["top_functions"])
+        
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+        allocations = snapshot.statistics('lineno')[:PROFILING_CONFIG["top_allocations"]]
+        
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            f.write(f"Profil: {name}" + (f" - {target}" if target else "") + "\n")
+            f.write(f"Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"Pic mémoire (tracemalloc): {peak / (1024 * 1024):.2f} Mo\n\n")
+            f.write("=== Fonctions (temps cumulé) ===\n")
+            f.write(functions.getvalue())
+            f.write("\n=== Allocations principales (mémoire encore allouée en fin d'opération) ===\n")
+            for index, stat in enumerate(allocations, 1):
+                frame = stat.traceback[0]
+                f.write(f"#{index} {frame.filename}:{frame.lineno}: "
+                        f"{stat.size / 1024:.1f} Ko ({stat.count} blocs)\n")
+        
+        log_message("INFO", f"Profil {name} écrit: {anonymize_path(stats_path)}")
+        return stats_path
+    except Exception as e:
+        log_message("WARNING", f"Impossible d'écrire le profil {name}", e)
+        return None